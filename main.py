@@ -5,6 +5,13 @@ import argparse
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.ui.gradio_interface import GradioInterface
+from src.api.api_server import ApiServer
+from src.infrastructure.metrics_server import MetricsServer
+from src.infrastructure.logger_service import LoggerService
+from src.infrastructure.result_cache import ResultCache
+from src.infrastructure.configuration_loader import ConfigurationLoader
+from src.simulation.simulation_engine import SimulationEngine
+from src.simulation.sweep_worker import SweepWorker
 
 
 def main():
@@ -25,9 +32,90 @@ def main():
         default=7860,
         help="Port to run the web server on (default: 7860)",
     )
+    parser.add_argument(
+        "--config",
+        type=str,
+        default=None,
+        help="JSON configuration file (e.g. a calibrated cost model from the benchmark script)",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Expose Prometheus metrics on http://127.0.0.1:<port>/metrics (disabled by default)",
+    )
+    parser.add_argument(
+        "--api-port",
+        type=int,
+        default=None,
+        help="Serve the HTTP/JSON compute API (/run, /batch, /sweep) on http://127.0.0.1:<port> (disabled by default)",
+    )
+    parser.add_argument(
+        "--sweep-worker",
+        type=str,
+        default=None,
+        metavar="HOST:PORT",
+        help="Run as a worker for the sweep coordinator at HOST:PORT instead of starting the web interface",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory for the persistent on-disk result cache (memory-only if omitted)",
+    )
+    parser.add_argument(
+        "--checkpoint-dir",
+        type=str,
+        default=None,
+        help="Directory where long exact and sampling runs checkpoint their progress, "
+        "so a restarted run resumes instead of starting over",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="UI requests handled in parallel per event (default: 8)",
+    )
+    parser.add_argument(
+        "--max-concurrent-jobs",
+        type=int,
+        default=2,
+        help="Simulations allowed to run at the same time across all users (default: 2)",
+    )
+    parser.add_argument(
+        "--max-jobs-per-user",
+        type=int,
+        default=1,
+        help="Simulations a single browser session may have queued or running (default: 1)",
+    )
+    parser.add_argument(
+        "--async-logging",
+        action="store_true",
+        help="Write logs from a background thread instead of the calling thread",
+    )
+    parser.add_argument(
+        "--json-logs",
+        action="store_true",
+        help="Emit structured JSON log records (with run IDs and timings)",
+    )
 
     args = parser.parse_args()
 
+    if args.config:
+        ConfigurationLoader().load_configuration(args.config)
+
+    if args.async_logging or args.json_logs:
+        LoggerService().configure(
+            async_mode=args.async_logging, json_format=args.json_logs
+        )
+
+    if args.sweep_worker:
+        host, _, port = args.sweep_worker.rpartition(":")
+        result_cache = ResultCache(disk_directory=args.cache_dir) if args.cache_dir else None
+        print(f"- Sweep worker serving coordinator {host}:{port}")
+        SweepWorker(host, int(port), SimulationEngine(result_cache=result_cache)).run()
+        return
+
     print("=" * 60)
     print("- Starting Airport Cost-Sharing Game Web Interface...")
     print("=" * 60)
@@ -38,10 +126,30 @@ def main():
         print("- Running locally only")
 
     print(f"Server port: {args.port}")
+
+    if args.metrics_port is not None:
+        MetricsServer(port=args.metrics_port).start()
+        print(f"Metrics endpoint: http://127.0.0.1:{args.metrics_port}/metrics")
+
+    result_cache = ResultCache(disk_directory=args.cache_dir) if args.cache_dir else None
+    engine = SimulationEngine(
+        result_cache=result_cache, checkpoint_directory=args.checkpoint_dir
+    )
+
+    if args.api_port is not None:
+        ApiServer(engine, port=args.api_port).start()
+        print(f"Compute API: http://127.0.0.1:{args.api_port} (/run, /batch, /sweep)")
+
     print("=" * 60)
 
-    app = GradioInterface()
-    app.launch(share=args.share, server_port=args.port)
+    app = GradioInterface(
+        engine,
+        max_concurrent_jobs=args.max_concurrent_jobs,
+        max_jobs_per_user=args.max_jobs_per_user,
+    )
+    app.launch(
+        share=args.share, server_port=args.port, concurrency_limit=args.concurrency
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,287 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+from src.models.entities.game_configuration import GameConfiguration
+from src.models.entities.calculation_result import CalculationResult
+
+from src.simulation.simulation_engine import SimulationEngine, ConfigurationValidationError
+from src.simulation.micro_batcher import MicroBatcher, MicroBatcherClosedError
+from src.simulation.scenario_sweep import expand_sweep
+
+from src.infrastructure.metrics_registry import MetricsRegistry
+
+
+class _BadRequestError(ValueError):
+    pass
+
+
+def _error_payload(error: Exception) -> Tuple[int, Dict[str, str]]:
+    """
+    Maps an exception to an HTTP status and a JSON error body.
+    """
+    if isinstance(error, ConfigurationValidationError):
+        return 422, {"error": error.reason, "message": str(error)}
+    if isinstance(error, (_BadRequestError, ValidationError, json.JSONDecodeError)):
+        return 400, {"error": "invalid_request", "message": str(error)}
+    if isinstance(error, ValueError):
+        return 422, {"error": "invalid_configuration", "message": str(error)}
+    if isinstance(error, MicroBatcherClosedError):
+        return 503, {"error": "unavailable", "message": str(error)}
+    return 500, {"error": "calculation_error", "message": str(error)}
+
+
+def _outcome_payload(outcome: Any) -> Dict[str, Any]:
+    if isinstance(outcome, CalculationResult):
+        return {"result": outcome.model_dump(mode="json")}
+    return _error_payload(outcome)[1]
+
+
+class _ApiRequestHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections open between requests (every response is either
+    # sized with Content-Length or chunked).
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without this, Nagle's algorithm and
+    # delayed ACKs stall every keep-alive response by ~40 ms.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/health":
+            self._send_json(404, {"error": "not_found", "message": "Unknown endpoint"})
+            return
+        self._send_json(200, {"status": "ok"})
+
+    def do_POST(self):
+        api: "ApiServer" = self.server.api
+        route = self.path.split("?", 1)[0]
+        handlers = {"/run": self._run, "/batch": self._batch, "/sweep": self._sweep}
+        handler = handlers.get(route)
+        if handler is None:
+            self._discard_body()
+            self._send_json(404, {"error": "not_found", "message": "Unknown endpoint"})
+            api.count_request(route, 404)
+            return
+        try:
+            body = self._read_json()
+            status = handler(api, body)
+        except Exception as e:
+            status, payload = _error_payload(e)
+            self._send_json(status, payload)
+        api.count_request(route, status)
+
+    def _run(self, api: "ApiServer", body: Any) -> int:
+        config = GameConfiguration.model_validate(body)
+        result = api.run(config)
+        self._send_json(200, result.model_dump(mode="json"))
+        return 200
+
+    def _batch(self, api: "ApiServer", body: Any) -> int:
+        if not isinstance(body, dict) or not isinstance(body.get("configurations"), list):
+            raise _BadRequestError('Expected {"configurations": [...]}')
+        configs = [GameConfiguration.model_validate(c) for c in body["configurations"]]
+        self._stream_ndjson(
+            {"index": i, **_outcome_payload(outcome)}
+            for i, outcome in enumerate(api.run_batch(configs))
+        )
+        return 200
+
+    def _sweep(self, api: "ApiServer", body: Any) -> int:
+        if not isinstance(body, dict) or not isinstance(body.get("grid"), dict):
+            raise _BadRequestError('Expected {"configuration": {...}, "grid": {...}}')
+        config = GameConfiguration.model_validate(body.get("configuration"))
+        try:
+            scenarios = expand_sweep(config, body["grid"])
+        except ValueError as e:
+            raise _BadRequestError(str(e)) from e
+        outcomes = api.run_batch([c for _, c in scenarios])
+        self._stream_ndjson(
+            {"index": i, "overrides": overrides, **_outcome_payload(outcome)}
+            for i, ((overrides, _), outcome) in enumerate(zip(scenarios, outcomes))
+        )
+        return 200
+
+    def _read_json(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > self.server.api.max_body_bytes:
+            self.close_connection = True
+            raise _BadRequestError(
+                f"Request body of {length} bytes exceeds {self.server.api.max_body_bytes}"
+            )
+        return json.loads(self.rfile.read(length) or b"null")
+
+    def _discard_body(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= self.server.api.max_body_bytes:
+            self.rfile.read(length)
+        else:
+            self.close_connection = True
+
+    def _send_json(self, status: int, payload: Any) -> None:
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        if len(body) <= ApiServer.STREAM_THRESHOLD_BYTES:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        # Large single results (e.g. 10^6 players) are sent in chunks.
+        self._start_chunked(status, "application/json")
+        step = ApiServer.STREAM_CHUNK_BYTES
+        for offset in range(0, len(body), step):
+            self._write_chunk(body[offset : offset + step])
+        self._end_chunked()
+
+    def _stream_ndjson(self, lines: Iterable[Dict[str, Any]]) -> None:
+        """
+        Streams one JSON document per line as the lines are produced.
+        """
+        self._start_chunked(200, "application/x-ndjson")
+        try:
+            for line in lines:
+                self._write_chunk(
+                    json.dumps(line, separators=(",", ":")).encode("utf-8") + b"\n"
+                )
+        except Exception as e:
+            # The status line is already sent; report the failure in-band and hang up.
+            self._write_chunk(json.dumps(_error_payload(e)[1]).encode("utf-8") + b"\n")
+            self.close_connection = True
+        self._end_chunked()
+
+    def _start_chunked(self, status: int, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _write_chunk(self, data: bytes) -> None:
+        if data:
+            self.wfile.write(b"%X\r\n%s\r\n" % (len(data), data))
+            self.wfile.flush()
+
+    def _end_chunked(self) -> None:
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        # High request rates; keep per-request lines out of the application log.
+        pass
+
+
+class ApiServer:
+    """
+    Lightweight HTTP/JSON API over a SimulationEngine, served from daemon threads
+    with HTTP/1.1 persistent connections.
+
+    Endpoints:
+    - GET /health: {"status": "ok"}.
+    - POST /run: a GameConfiguration; responds with the CalculationResult. Small
+      closed-form requests (airport Shapley/Banzhaf/semivalues) arriving together are
+      micro-batched into one vectorised engine call.
+    - POST /batch: {"configurations": [...]}; streams NDJSON, one line per
+      configuration in order: {"index": i, "result": {...}} or
+      {"index": i, "error": reason, "message": ...}.
+    - POST /sweep: {"configuration": {...}, "grid": {field: [values, ...]}}; streams
+      one NDJSON line per grid combination, with its "overrides".
+
+    Errors are JSON {"error", "message"}: 400 for malformed requests, 422 for invalid
+    configurations, 500 for failed calculations.
+    """
+
+    STREAM_THRESHOLD_BYTES = 1 << 20
+    STREAM_CHUNK_BYTES = 1 << 18
+    # Batches are run and streamed in slices, so the first lines go out early.
+    STREAM_BATCH_SIZE = 64
+
+    def __init__(
+        self,
+        simulation_engine: SimulationEngine,
+        port: int = 8000,
+        host: str = "127.0.0.1",
+        max_batch_size: int = 64,
+        max_batch_delay_seconds: float = 0.002,
+        micro_batch_max_players: int = 1000,
+        max_body_bytes: int = 64 << 20,
+    ):
+        """
+        Args:
+            simulation_engine: Engine that serves every request (and its caches).
+            port: Port to listen on; 0 picks a free port (see `port` after `start`).
+            max_batch_size: Most /run requests coalesced into one engine call.
+            max_batch_delay_seconds: How long a micro-batch waits for more requests.
+            micro_batch_max_players: Larger /run requests bypass the micro-batcher.
+            max_body_bytes: Largest accepted request body.
+        """
+        self.simulation_engine = simulation_engine
+        self.host = host
+        self.port = port
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay_seconds = max_batch_delay_seconds
+        self.micro_batch_max_players = micro_batch_max_players
+        self.max_body_bytes = max_body_bytes
+        self._batcher: Optional[MicroBatcher] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        self._requests_total = MetricsRegistry().counter(
+            "api_requests_total",
+            "HTTP API requests by endpoint and status code.",
+            ["endpoint", "status"],
+        )
+
+    def start(self) -> None:
+        if self._server is not None:
+            return
+        self._batcher = MicroBatcher(
+            self.simulation_engine, self.max_batch_size, self.max_batch_delay_seconds
+        )
+        self._server = ThreadingHTTPServer((self.host, self.port), _ApiRequestHandler)
+        self._server.daemon_threads = True
+        self._server.api = self
+        # Port 0 asks the OS for a free port; expose the one actually bound.
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="ApiServer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._batcher.shutdown()
+        self._server = None
+        self._thread = None
+        self._batcher = None
+
+    def run(self, config: GameConfiguration) -> CalculationResult:
+        """
+        Raises:
+            MicroBatcherClosedError: If the server has not been started or was stopped.
+        """
+        batcher = self._batcher
+        if batcher is None:
+            raise MicroBatcherClosedError("ApiServer is not running; call start() first")
+        if (
+            config.algorithm in SimulationEngine.BATCHED_ALGORITHMS
+            and len(config.players) <= self.micro_batch_max_players
+        ):
+            return batcher.run(config)
+        return self.simulation_engine.run_simulation(config)
+
+    def run_batch(
+        self, configs: List[GameConfiguration]
+    ) -> Iterator[Union[CalculationResult, Exception]]:
+        """
+        Yields the outcome (result or exception) of each configuration in order,
+        running them in slices of STREAM_BATCH_SIZE.
+        """
+        for start in range(0, len(configs), self.STREAM_BATCH_SIZE):
+            chunk = configs[start : start + self.STREAM_BATCH_SIZE]
+            yield from self.simulation_engine.run_batch(chunk, return_exceptions=True)
+
+    def count_request(self, endpoint: str, status: int) -> None:
+        self._requests_total.inc(endpoint=endpoint, status=str(status))
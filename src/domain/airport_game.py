@@ -1,4 +1,6 @@
-from typing import List
+from typing import List, Sequence, Union
+
+import numpy as np
 
 from src.models.entities.player import Player
 from src.domain.cooperative_game import CooperativeGame
@@ -10,6 +12,12 @@ class AirportGame(CooperativeGame):
     In this game, the cost of a coalition is determined by the player with the largest requirement (cost).
     """
 
+    supports_batch_evaluation = True
+
+    def __init__(self, players: List[Player]):
+        super().__init__(players)
+        self._costs = None
+
     def calculate_characteristic_function(self, coalition: List[Player]) -> float:
         """
         Calculates the cost for a coalition of airplanes (players).
@@ -21,3 +29,16 @@ class AirportGame(CooperativeGame):
 
         # The cost of the coalition is the maximum individual cost among its members
         return max(player.cost for player in coalition)
+
+    def evaluate_coalitions(
+        self, coalitions: Union[np.ndarray, Sequence[int]]
+    ) -> np.ndarray:
+        """
+        Vectorised characteristic function: the maximum member cost of each
+        coalition row, or 0 for empty coalitions.
+        """
+        membership = self.membership_matrix(coalitions)
+        if self._costs is None:
+            self._costs = np.array([p.cost for p in self.players], dtype=float)
+        worths = np.where(membership, self._costs, -np.inf).max(axis=1, initial=-np.inf)
+        return np.where(np.isneginf(worths), 0.0, worths)
@@ -1,4 +1,6 @@
-from typing import Dict, List, Sequence, Set
+from typing import Dict, List, Sequence, Set, Union
+
+import numpy as np
 
 from src.models.entities.player import Player
 from src.domain.cooperative_game import CooperativeGame
@@ -10,6 +12,8 @@ class AirportGameWithCoalitionConfiguration(CooperativeGame):
     Paper model is (N, c, B). :contentReference[oaicite:4]{index=4}
     """
 
+    supports_batch_evaluation = True
+
     def __init__(self, players: List[Player], runway_cost_steps: Sequence[float]):
         """
         runway_cost_steps: [c1, c2, ..., c_|T|] where c0 is defined as 0 in the paper. :contentReference[oaicite:5]{index=5}
@@ -18,6 +22,8 @@ class AirportGameWithCoalitionConfiguration(CooperativeGame):
         if len(runway_cost_steps) == 0:
             raise ValueError("runway_cost_steps must be non-empty")
         self.c = [0.0] + list(runway_cost_steps)  # c[0]=0, c[t]=c_t
+        self._types = None
+        self._c_array = None
 
         # Build B_a and B_i
         self.B_a: Dict[str, Set[str]] = {}  # airline -> set of movement ids
@@ -37,3 +43,17 @@ class AirportGameWithCoalitionConfiguration(CooperativeGame):
             return 0.0
         t = max(p.type for p in coalition)
         return self.c[t]
+
+    def evaluate_coalitions(
+        self, coalitions: Union[np.ndarray, Sequence[int]]
+    ) -> np.ndarray:
+        """
+        Vectorised characteristic function: c[max type] of each coalition row,
+        with empty coalitions mapping to c[0] = 0.
+        """
+        membership = self.membership_matrix(coalitions)
+        if self._types is None:
+            self._types = np.array([p.type for p in self.players], dtype=np.int64)
+            self._c_array = np.asarray(self.c, dtype=float)
+        max_types = np.where(membership, self._types, 0).max(axis=1, initial=0)
+        return self._c_array[max_types]
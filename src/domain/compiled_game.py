@@ -0,0 +1,208 @@
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from src.models.entities.game_configuration import GameConfiguration
+from src.models.entities.player_index import PlayerIndex
+
+
+class CompiledGame:
+    """
+    Array form of an airport game, ready for the closed-form calculators.
+
+    Instead of Player models it holds:
+    - player IDs interned as one NUL-separated UTF-8 blob (decoded on first use);
+    - the sorted cost structure: distinct cost levels in increasing order, each
+      player's level and the number of players at or above each level;
+    - per-player types (0 if absent) and movements;
+    - airline IDs interned the same way, with the code-sharing incidence B_i in CSR
+      form: the airlines of player j are
+      `incidence_airlines[incidence_offsets[j]:incidence_offsets[j + 1]]`;
+    - the runway cost steps c_1..c_|T| of the configuration value model.
+
+    All arrays may be read-only memory maps (see game_snapshot).
+    """
+
+    ARRAYS = (
+        "player_id_blob",
+        "costs",
+        "levels",
+        "level_of",
+        "level_users",
+        "types",
+        "movements",
+        "airline_id_blob",
+        "incidence_offsets",
+        "incidence_airlines",
+        "runway_cost_steps",
+    )
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        missing = [name for name in self.ARRAYS if name not in arrays]
+        if missing:
+            raise ValueError(f"Compiled game is missing arrays: {missing}")
+        for name in self.ARRAYS:
+            setattr(self, name, arrays[name])
+        self._player_index: Optional[PlayerIndex] = None
+        self._airline_ids: Optional[Sequence[str]] = None
+
+    @property
+    def num_players(self) -> int:
+        return len(self.costs)
+
+    @property
+    def num_airlines(self) -> int:
+        return len(self.airline_ids)
+
+    @property
+    def player_index(self) -> PlayerIndex:
+        if self._player_index is None:
+            self._player_index = PlayerIndex(
+                _decode_ids(self.player_id_blob, self.num_players)
+            )
+        return self._player_index
+
+    @property
+    def airline_ids(self) -> Sequence[str]:
+        if self._airline_ids is None:
+            self._airline_ids = _decode_ids(
+                self.airline_id_blob, int(self.incidence_airlines.max(initial=-1)) + 1
+            )
+        return self._airline_ids
+
+    @property
+    def total_cost(self) -> float:
+        """
+        Cost of the grand coalition: the largest requirement.
+        """
+        return float(self.levels[-1]) if len(self.levels) else 0.0
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        return {name: getattr(self, name) for name in self.ARRAYS}
+
+    @classmethod
+    def from_configuration(cls, config: GameConfiguration) -> "CompiledGame":
+        """
+        Compiles the players of `config`. A player without a cost costs c_type.
+        """
+        players = config.players
+        steps = np.asarray(config.runway_cost_steps or [], dtype=np.float64)
+        types = np.array([p.type or 0 for p in players], dtype=np.int32)
+        costs = np.array(
+            [
+                p.cost if p.cost is not None else (steps[p.type - 1] if p.type else np.nan)
+                for p in players
+            ],
+            dtype=np.float64,
+        )
+        memberships = [sorted(p.airlines or ()) for p in players]
+        return cls.from_columns(
+            player_ids=[p.id for p in players],
+            costs=costs,
+            types=types,
+            movements=np.array(
+                [p.movements if p.movements is not None else 1 for p in players],
+                dtype=np.int64,
+            ),
+            airlines=memberships,
+            runway_cost_steps=steps,
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        player_ids: Sequence[str],
+        costs: np.ndarray,
+        types: Optional[np.ndarray] = None,
+        movements: Optional[np.ndarray] = None,
+        airlines: Optional[Sequence[Sequence[str]]] = None,
+        incidence: Optional[tuple] = None,
+        runway_cost_steps: Optional[np.ndarray] = None,
+    ) -> "CompiledGame":
+        """
+        Compiles column data without building Player models.
+
+        Args:
+            player_ids: Unique IDs, one per player.
+            costs: Positive runway requirement per player.
+            types: Aircraft category per player (1..|T|), or None.
+            movements: Movements per player (default 1 each).
+            airlines: Airline IDs per player, or pass `incidence` instead.
+            incidence: Already interned code-sharing sets as
+                (airline_ids, offsets, airline_indices) in CSR form.
+            runway_cost_steps: c_1..c_|T| for the configuration value.
+        """
+        n = len(player_ids)
+        costs = np.ascontiguousarray(costs, dtype=np.float64)
+        if costs.shape != (n,):
+            raise ValueError(f"Expected {n} costs, got shape {costs.shape}")
+        if n and not (costs > 0).all():
+            raise ValueError("Every player needs a positive cost (or a type with cost steps)")
+
+        levels, level_of, counts = np.unique(costs, return_inverse=True, return_counts=True)
+        level_users = n - (np.cumsum(counts) - counts)
+
+        if airlines is not None and incidence is not None:
+            raise ValueError("Pass either airlines or incidence, not both")
+        if airlines is not None:
+            airline_ids = sorted({a for member in airlines for a in member})
+            position = {a: k for k, a in enumerate(airline_ids)}
+            offsets = np.zeros(n + 1, dtype=np.int64)
+            offsets[1:] = np.cumsum([len(member) for member in airlines])
+            indices = np.fromiter(
+                (position[a] for member in airlines for a in member),
+                dtype=np.int32,
+                count=int(offsets[-1]),
+            )
+        elif incidence is not None:
+            airline_ids, offsets, indices = incidence
+            offsets = np.ascontiguousarray(offsets, dtype=np.int64)
+            indices = np.ascontiguousarray(indices, dtype=np.int32)
+            if offsets.shape != (n + 1,) or offsets[0] != 0 or offsets[-1] != len(indices):
+                raise ValueError("Incidence offsets must have N + 1 entries from 0 to nnz")
+            if len(indices) and (indices.min() < 0 or indices.max() >= len(airline_ids)):
+                raise ValueError("Incidence refers to an unknown airline")
+        else:
+            airline_ids = []
+            offsets = np.zeros(n + 1, dtype=np.int64)
+            indices = np.zeros(0, dtype=np.int32)
+
+        return cls(
+            {
+                "player_id_blob": _encode_ids(player_ids),
+                "costs": costs,
+                "levels": levels,
+                "level_of": level_of.ravel().astype(np.int32),
+                "level_users": level_users.astype(np.int64),
+                "types": (
+                    np.zeros(n, dtype=np.int32)
+                    if types is None
+                    else np.ascontiguousarray(types, dtype=np.int32)
+                ),
+                "movements": (
+                    np.ones(n, dtype=np.int64)
+                    if movements is None
+                    else np.ascontiguousarray(movements, dtype=np.int64)
+                ),
+                "airline_id_blob": _encode_ids(airline_ids),
+                "incidence_offsets": offsets,
+                "incidence_airlines": indices,
+                "runway_cost_steps": np.asarray(
+                    runway_cost_steps if runway_cost_steps is not None else [],
+                    dtype=np.float64,
+                ),
+            }
+        )
+
+
+def _encode_ids(ids: Sequence[str]) -> np.ndarray:
+    if any("\0" in i for i in ids):
+        raise ValueError("IDs must not contain NUL characters")
+    return np.frombuffer("\0".join(ids).encode("utf-8"), dtype=np.uint8)
+
+
+def _decode_ids(blob: np.ndarray, count: int) -> Sequence[str]:
+    # An empty blob is either no IDs or the single ID "".
+    if count == 0 and len(blob) == 0:
+        return []
+    return blob.tobytes().decode("utf-8").split("\0")
@@ -0,0 +1,56 @@
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+from src.models.entities.player import Player
+from src.domain.cooperative_game import CooperativeGame
+
+
+class CompositeGame(CooperativeGame):
+    """
+    Sum of several component games over the same players, e.g. one airport game per
+    facility: c(S) = sum over components k of c_k(S).
+
+    A component may be defined over a subset of the players (e.g. only the movements
+    that use a facility), listed in the game's order; the others do not affect it.
+
+    Because the Shapley value is additive, it can be computed per component with the
+    fastest calculator for that component's structure and then summed
+    (DecompositionShapleyCalculator).
+    """
+
+    def __init__(self, players: List[Player], components: Dict[str, CooperativeGame]):
+        super().__init__(players)
+        position = {p.id: i for i, p in enumerate(players)}
+        # Game positions of each component's players.
+        self._positions: Dict[str, np.ndarray] = {}
+        for name, component in components.items():
+            positions = [position.get(p.id, -1) for p in component.players]
+            if -1 in positions or positions != sorted(set(positions)):
+                raise ValueError(
+                    f"Component {name!r} must be defined over the game's players, in the same order"
+                )
+            self._positions[name] = np.array(positions, dtype=np.int64)
+        self.components = dict(components)
+        self.supports_batch_evaluation = all(
+            c.supports_batch_evaluation for c in self.components.values()
+        )
+
+    def calculate_characteristic_function(self, coalition: List[Player]) -> float:
+        # Components hold their own Player objects, so translate by ID.
+        ids = {p.id for p in coalition}
+        total = 0.0
+        for component in self.components.values():
+            members = [p for p in component.players if p.id in ids]
+            total += component.calculate_characteristic_function(members)
+        return total
+
+    def evaluate_coalitions(
+        self, coalitions: Union[np.ndarray, Sequence[int]]
+    ) -> np.ndarray:
+        membership = self.membership_matrix(coalitions)
+        total = np.zeros(len(membership))
+        for name, component in self.components.items():
+            if len(component.players):
+                total += component.evaluate_coalitions(membership[:, self._positions[name]])
+        return total
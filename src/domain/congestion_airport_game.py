@@ -0,0 +1,55 @@
+from typing import List, Sequence, Union
+
+import numpy as np
+
+from src.models.entities.player import Player
+from src.domain.cooperative_game import CooperativeGame
+
+
+class CongestionAirportGame(CooperativeGame):
+    """
+    Airport game whose cost also grows with traffic. With L(S) the longest runway
+    requirement in S and M(S) the total movements of S (`Player.movements`, default 1):
+
+        c(S) = L(S) * (1 + maintenance_rate * M(S)) + slot_cost * M(S)
+
+    Maintenance scales with both the runway built and how often it is used; slot
+    (handling) costs scale with movements only. With both rates 0 this is the
+    classic AirportGame.
+    """
+
+    supports_batch_evaluation = True
+
+    def __init__(
+        self, players: List[Player], maintenance_rate: float = 0.0, slot_cost: float = 0.0
+    ):
+        super().__init__(players)
+        self.maintenance_rate = maintenance_rate
+        self.slot_cost = slot_cost
+        self._costs = None
+        self._movements = None
+
+    @staticmethod
+    def movements_of(player: Player) -> int:
+        return 1 if player.movements is None else player.movements
+
+    def calculate_characteristic_function(self, coalition: List[Player]) -> float:
+        if not coalition:
+            return 0.0
+        longest = max(player.cost for player in coalition)
+        movements = sum(self.movements_of(player) for player in coalition)
+        return longest * (1 + self.maintenance_rate * movements) + self.slot_cost * movements
+
+    def evaluate_coalitions(
+        self, coalitions: Union[np.ndarray, Sequence[int]]
+    ) -> np.ndarray:
+        membership = self.membership_matrix(coalitions)
+        if self._costs is None:
+            self._costs = np.array([p.cost for p in self.players], dtype=float)
+            self._movements = np.array(
+                [self.movements_of(p) for p in self.players], dtype=float
+            )
+        longest = np.where(membership, self._costs, -np.inf).max(axis=1, initial=-np.inf)
+        longest = np.where(np.isneginf(longest), 0.0, longest)
+        movements = membership @ self._movements
+        return longest * (1 + self.maintenance_rate * movements) + self.slot_cost * movements
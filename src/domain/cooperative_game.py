@@ -1,16 +1,38 @@
-from typing import List
+from typing import List, Sequence, Union
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from src.models.entities.player import Player
+from src.models.entities.player_index import PlayerIndex
 
 
 class CooperativeGame(ABC):
     """
     Abstract base class representing a generic cooperative game.
+
+    Games that can evaluate many coalitions in one vectorised call override
+    `evaluate_coalitions` and set `supports_batch_evaluation`; calculators use the
+    batch path whenever it is available.
     """
 
+    supports_batch_evaluation: bool = False
+
+    # Largest bitmask that fits in an int64 membership row.
+    MAX_BITMASK_PLAYERS = 63
+
     def __init__(self, players: List[Player]):
         self.players = players
+        self._player_index = None
+
+    @property
+    def player_index(self) -> PlayerIndex:
+        """
+        Player ID <-> position index of `self.players`, shared by array-backed results.
+        """
+        if self._player_index is None:
+            self._player_index = PlayerIndex.from_players(self.players)
+        return self._player_index
 
     @abstractmethod
     def calculate_characteristic_function(self, coalition: List[Player]) -> float:
@@ -24,3 +46,54 @@ class CooperativeGame(ABC):
             The characteristic value of the coalition.
         """
         pass
+
+    def evaluate_coalitions(
+        self, coalitions: Union[np.ndarray, Sequence[int]]
+    ) -> np.ndarray:
+        """
+        Calculates the worth of many coalitions at once.
+
+        Args:
+            coalitions: Either a boolean membership array of shape (k, N), where column j
+                refers to `self.players[j]`, or k integer bitmasks (bit j set if
+                `self.players[j]` is a member).
+
+        Returns:
+            Array of shape (k,) with the characteristic value of each coalition.
+
+        The default implementation evaluates the coalitions one by one.
+        """
+        membership = self.membership_matrix(coalitions)
+        return np.array(
+            [
+                self.calculate_characteristic_function(
+                    [p for p, member in zip(self.players, row) if member]
+                )
+                for row in membership
+            ],
+            dtype=float,
+        )
+
+    def membership_matrix(
+        self, coalitions: Union[np.ndarray, Sequence[int]]
+    ) -> np.ndarray:
+        """
+        Normalises bitmasks or boolean arrays to a (k, N) boolean membership matrix.
+        """
+        n = len(self.players)
+        array = np.asarray(coalitions)
+        if array.dtype == bool:
+            membership = array.reshape(-1, n)
+        elif np.issubdtype(array.dtype, np.integer):
+            if n > self.MAX_BITMASK_PLAYERS:
+                raise ValueError(
+                    f"Bitmask coalitions support at most {self.MAX_BITMASK_PLAYERS} players; "
+                    "pass a boolean membership array instead."
+                )
+            masks = array.astype(np.int64).reshape(-1, 1)
+            membership = ((masks >> np.arange(n, dtype=np.int64)) & 1).astype(bool)
+        else:
+            raise ValueError(
+                f"Coalitions must be a boolean array or integer bitmasks, got {array.dtype}"
+            )
+        return membership
@@ -0,0 +1,90 @@
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+from src.models.entities.player import Player
+from src.models.entities.tree_edge import TreeEdge
+from src.domain.cooperative_game import CooperativeGame
+
+
+class TreeGame(CooperativeGame):
+    """
+    Standard tree game: infrastructure is a rooted tree with a cost per edge, and each
+    player (movement) needs the path from the root to its node (`Player.node`).
+    The cost of a coalition is the total cost of the union of its members' paths.
+    The airport game is the special case of a single chain.
+    """
+
+    supports_batch_evaluation = True
+
+    def __init__(self, players: List[Player], edges: Sequence[TreeEdge]):
+        super().__init__(players)
+        self.edges = list(edges)
+        self.parent: Dict[str, str] = {}
+        self.edge_cost: Dict[str, float] = {}
+        children: Dict[str, List[str]] = {}
+        for edge in self.edges:
+            if edge.child in self.parent:
+                raise ValueError(f"Node {edge.child} has more than one parent edge")
+            self.parent[edge.child] = edge.parent
+            self.edge_cost[edge.child] = edge.cost
+            children.setdefault(edge.parent, []).append(edge.child)
+
+        roots = {e.parent for e in self.edges} - set(self.parent)
+        if len(roots) != 1 and self.edges:
+            raise ValueError(f"Tree must have exactly one root, found {sorted(roots)}")
+        self.root = next(iter(roots)) if roots else None
+
+        # Nodes in breadth-first order from the root; parents always precede children.
+        self.order: List[str] = [self.root] if self.root is not None else []
+        for node in self.order:
+            self.order.extend(children.get(node, []))
+        if len(self.order) != len(self.parent) + (1 if self.root is not None else 0):
+            raise ValueError("Tree edges contain a cycle or a part not connected to the root")
+
+        known = set(self.order)
+        missing = [p.id for p in players if p.node not in known]
+        if missing:
+            raise ValueError(f"Players without a node in the tree: {missing}")
+
+        self._path_matrix = None
+
+    def calculate_characteristic_function(self, coalition: List[Player]) -> float:
+        """
+        Sums the cost of every edge on the path from the root to any member's node.
+        Each edge is visited once, so the cost is linear in the size of the union.
+        """
+        used = set()
+        total = 0.0
+        for player in coalition:
+            node = player.node
+            while node in self.parent and node not in used:
+                used.add(node)
+                total += self.edge_cost[node]
+                node = self.parent[node]
+        return total
+
+    def evaluate_coalitions(
+        self, coalitions: Union[np.ndarray, Sequence[int]]
+    ) -> np.ndarray:
+        """
+        Vectorised characteristic function: an edge is paid for if any member's path
+        uses it.
+        """
+        membership = self.membership_matrix(coalitions)
+        if self._path_matrix is None:
+            self._path_matrix, self._path_costs = self._build_path_matrix()
+        used = (membership.astype(np.int32) @ self._path_matrix) > 0
+        return used @ self._path_costs
+
+    def _build_path_matrix(self):
+        edge_nodes = [node for node in self.order if node in self.parent]
+        column = {node: j for j, node in enumerate(edge_nodes)}
+        matrix = np.zeros((len(self.players), len(edge_nodes)), dtype=np.int32)
+        for i, player in enumerate(self.players):
+            node = player.node
+            while node in self.parent:
+                matrix[i, column[node]] = 1
+                node = self.parent[node]
+        costs = np.array([self.edge_cost[node] for node in edge_nodes], dtype=float)
+        return matrix, costs
@@ -0,0 +1,40 @@
+import os
+import tempfile
+from typing import Optional
+
+from src.models.entities.calculation_checkpoint import CalculationCheckpoint
+
+
+class CheckpointStore:
+    """
+    Keeps calculation checkpoints as one JSON file per run key under `directory`.
+    Files are replaced atomically, so a crash mid-write leaves the previous checkpoint.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def save(self, key: str, checkpoint: CalculationCheckpoint) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(checkpoint.model_dump_json())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._path(key))
+
+    def load(self, key: str) -> Optional[CalculationCheckpoint]:
+        try:
+            with open(self._path(key), "r") as f:
+                return CalculationCheckpoint.model_validate_json(f.read())
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.checkpoint.json")
@@ -0,0 +1,55 @@
+import json
+import socket
+import struct
+from typing import Any, Optional
+
+# 4-byte big-endian length prefix, then that many bytes of UTF-8 JSON.
+_HEADER = struct.Struct("!I")
+MAX_FRAME_BYTES = 256 << 20
+
+
+class FrameProtocolError(ConnectionError):
+    """
+    Raised when a peer sends a malformed or oversized frame.
+    """
+
+
+def send_frame(sock: socket.socket, message: Any) -> None:
+    """
+    Sends one JSON message as a length-prefixed frame.
+    """
+    data = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    if len(data) > MAX_FRAME_BYTES:
+        raise FrameProtocolError(f"Frame of {len(data)} bytes exceeds {MAX_FRAME_BYTES}")
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def recv_frame(sock: socket.socket) -> Optional[Any]:
+    """
+    Receives one JSON message, or returns None if the peer closed the connection
+    cleanly between frames.
+    """
+    header = _recv_exactly(sock, _HEADER.size, allow_eof=True)
+    if header is None:
+        return None
+    (length,) = _HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise FrameProtocolError(f"Frame of {length} bytes exceeds {MAX_FRAME_BYTES}")
+    try:
+        return json.loads(_recv_exactly(sock, length))
+    except ValueError as e:
+        raise FrameProtocolError(f"Malformed frame: {e}") from e
+
+
+def _recv_exactly(sock: socket.socket, size: int, allow_eof: bool = False) -> Optional[bytes]:
+    chunks = []
+    remaining = size
+    while remaining:
+        chunk = sock.recv(min(remaining, 1 << 20))
+        if not chunk:
+            if allow_eof and remaining == size:
+                return None
+            raise ConnectionError("Connection closed in the middle of a frame")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
@@ -0,0 +1,115 @@
+import json
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from src.domain.compiled_game import CompiledGame
+
+
+class SnapshotFormatError(ValueError):
+    """
+    The file is not a game snapshot, or was written by an incompatible version.
+    """
+
+
+MAGIC = b"AIRPSNAP"
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+# magic, format version, header length
+_PREAMBLE = struct.Struct("<8sII")
+
+
+def save_snapshot(game: CompiledGame, path: str) -> None:
+    """
+    Writes `game` as a versioned binary snapshot.
+
+    Layout: a 16-byte preamble (magic, version, header length), a JSON header with
+    each array's dtype, shape and byte offset, then the raw little-endian arrays,
+    each aligned to 64 bytes. The file is written to a temporary name and renamed,
+    so readers never map a partial snapshot.
+    """
+    arrays = {
+        name: np.ascontiguousarray(array, dtype=np.dtype(array.dtype).newbyteorder("<"))
+        for name, array in game.arrays().items()
+    }
+
+    # Offsets depend on the header length, which depends on the offsets; a fixed-width
+    # offset field (padded header) avoids iterating.
+    sections = {}
+    header_length = len(_header(arrays, {name: 0 for name in arrays})) + 32 * len(arrays)
+    offset = _align(_PREAMBLE.size + header_length)
+    for name, array in arrays.items():
+        sections[name] = offset
+        offset = _align(offset + array.nbytes)
+    header = _header(arrays, sections).ljust(header_length)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, header_length))
+            f.write(header)
+            for name, array in arrays.items():
+                f.seek(sections[name])
+                f.write(array.tobytes())
+            f.truncate(offset)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_snapshot(path: str) -> CompiledGame:
+    """
+    Memory-maps a snapshot written by `save_snapshot`. The arrays are read-only views
+    of the mapping: nothing is parsed or copied, and processes that load the same file
+    share its pages through the page cache.
+
+    Raises:
+        SnapshotFormatError: If the file is not a snapshot of this format version.
+    """
+    mapping = np.memmap(path, dtype=np.uint8, mode="r")
+    if len(mapping) < _PREAMBLE.size:
+        raise SnapshotFormatError(f"{path} is too short to be a game snapshot")
+    magic, version, header_length = _PREAMBLE.unpack(bytes(mapping[: _PREAMBLE.size]))
+    if magic != MAGIC:
+        raise SnapshotFormatError(f"{path} is not a game snapshot")
+    if version != FORMAT_VERSION:
+        raise SnapshotFormatError(
+            f"{path} has snapshot format version {version}; expected {FORMAT_VERSION}"
+        )
+    header = json.loads(
+        bytes(mapping[_PREAMBLE.size : _PREAMBLE.size + header_length]).decode("utf-8")
+    )
+
+    arrays = {}
+    for name, section in header["arrays"].items():
+        dtype = np.dtype(section["dtype"])
+        shape = tuple(section["shape"])
+        end = section["offset"] + dtype.itemsize * int(np.prod(shape))
+        if end > len(mapping):
+            raise SnapshotFormatError(f"{path} is truncated (array {name})")
+        arrays[name] = np.ndarray(shape, dtype=dtype, buffer=mapping, offset=section["offset"])
+    return CompiledGame(arrays)
+
+
+def _header(arrays, offsets) -> bytes:
+    return json.dumps(
+        {
+            "arrays": {
+                name: {
+                    "dtype": array.dtype.str,
+                    "shape": list(array.shape),
+                    "offset": offsets[name],
+                }
+                for name, array in arrays.items()
+            }
+        }
+    ).encode("utf-8")
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
@@ -1,19 +1,105 @@
+import os
 import sys
+import json
+import queue
+import atexit
 import logging
-from typing import Optional
+import logging.handlers
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats log records as single-line JSON objects.
+    Structured fields passed via `extra` (run_id, timings, ...) are included when present.
+    """
+
+    STRUCTURED_FIELDS = ("run_id", "algorithm", "num_players", "timings")
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": self.formatTime(record),
+            "logger": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for field in self.STRUCTURED_FIELDS:
+            if hasattr(record, field):
+                payload[field] = getattr(record, field)
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Drops repeats of the same (level, message) emitted within `interval_seconds`.
+    The next record that gets through reports how many repeats were suppressed.
+
+    Messages often embed run IDs or cache keys, so the table of recent messages is
+    kept in emission order: entries whose window has passed are dropped, and at most
+    `max_entries` are kept.
+    """
+
+    def __init__(self, interval_seconds: float, max_entries: int = 10000):
+        super().__init__()
+        self.interval_seconds = interval_seconds
+        self.max_entries = max_entries
+        # (level, message) -> (window start, suppressed repeats), oldest window first
+        self._last_seen: "OrderedDict[Tuple[int, str], Tuple[float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = (record.levelno, record.getMessage())
+        now = time.monotonic()
+        with self._lock:
+            last_time, suppressed = self._last_seen.get(key, (None, 0))
+            if last_time is not None and now - last_time < self.interval_seconds:
+                self._last_seen[key] = (last_time, suppressed + 1)
+                return False
+            self._last_seen[key] = (now, 0)
+            self._last_seen.move_to_end(key)
+            self._prune(now)
+
+        if suppressed:
+            record.msg = f"{record.getMessage()} (suppressed {suppressed} repeats)"
+            record.args = None
+        return True
+
+    def _prune(self, now: float) -> None:
+        # Caller holds the lock.
+        while self._last_seen:
+            key, (last_time, _) = next(iter(self._last_seen.items()))
+            expired = now - last_time >= self.interval_seconds
+            if not expired and len(self._last_seen) <= self.max_entries:
+                return
+            del self._last_seen[key]
 
 
 class LoggerService:
     """
     Singleton Logger Service to handle application logging.
+
+    By default records are written synchronously to stdout and logs/app.log.
+    `configure` can switch to a queue-based asynchronous mode in which callers only
+    enqueue records and a background listener thread performs the actual I/O.
     """
 
     _instance: Optional["LoggerService"] = None
     _logger: logging.Logger
 
+    LOG_DIR = "logs"
+    LOG_FILE = "app.log"
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(LoggerService, cls).__new__(cls)
+            cls._instance._listener = None
+            cls._instance._rate_limit_filter = None
+            cls._instance._shutdown_registered = False
             cls._instance._initialize_logger()
         return cls._instance
 
@@ -21,31 +107,99 @@ class LoggerService:
         self._logger = logging.getLogger("AppLogger")
         self._logger.setLevel(logging.INFO)
 
+        # Add handlers to logger
+        if not self._logger.handlers:
+            for handler in self._create_handlers(json_format=False):
+                self._logger.addHandler(handler)
+
+    def _create_handlers(
+        self,
+        json_format: bool,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+    ) -> List[logging.Handler]:
         # Create formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
+        if json_format:
+            formatter: logging.Formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+            )
 
         # Create console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(formatter)
 
-        # Create file handler
-        import os
-
-        log_dir = "logs"
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        # Create rotating file handler
+        if not os.path.exists(self.LOG_DIR):
+            os.makedirs(self.LOG_DIR)
 
-        file_handler = logging.FileHandler(os.path.join(log_dir, "app.log"))
+        file_handler = logging.handlers.RotatingFileHandler(
+            os.path.join(self.LOG_DIR, self.LOG_FILE),
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+        )
         file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(formatter)
 
-        # Add handlers to logger
-        if not self._logger.handlers:
-            self._logger.addHandler(console_handler)
-            self._logger.addHandler(file_handler)
+        return [console_handler, file_handler]
+
+    def configure(
+        self,
+        async_mode: bool = False,
+        json_format: bool = False,
+        rate_limit_seconds: float = 0.0,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+    ) -> None:
+        """
+        Rebuilds the logging pipeline.
+
+        Args:
+            async_mode: Enqueue records and write them from a background thread.
+            json_format: Emit one JSON object per line instead of plain text.
+            rate_limit_seconds: Suppress identical messages repeated within this window (0 disables).
+            max_bytes: Rotate logs/app.log once it reaches this size.
+            backup_count: Number of rotated log files to keep.
+        """
+        self.shutdown()
+        for handler in list(self._logger.handlers):
+            self._logger.removeHandler(handler)
+            handler.close()
+
+        if self._rate_limit_filter is not None:
+            self._logger.removeFilter(self._rate_limit_filter)
+            self._rate_limit_filter = None
+        if rate_limit_seconds > 0:
+            self._rate_limit_filter = RateLimitFilter(rate_limit_seconds)
+            self._logger.addFilter(self._rate_limit_filter)
+
+        handlers = self._create_handlers(json_format, max_bytes, backup_count)
+        if not async_mode:
+            for handler in handlers:
+                self._logger.addHandler(handler)
+            return
+
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+        if not self._shutdown_registered:
+            atexit.register(self.shutdown)
+            self._shutdown_registered = True
+
+    def shutdown(self) -> None:
+        """
+        Stops the background writer (if any), flushing all queued records.
+        """
+        if self._listener is not None:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
 
     def get_logger(self) -> logging.Logger:
         return self._logger
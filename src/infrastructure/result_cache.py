@@ -0,0 +1,215 @@
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from src.models.enums.algorithm_type import AlgorithmType
+from src.models.entities.game_configuration import GameConfiguration
+from src.models.entities.calculation_result import CalculationResult
+
+from src.infrastructure.metrics_registry import MetricsRegistry
+
+
+# Algorithms whose output depends on random draws; only cached when seeded.
+SAMPLING_ALGORITHMS = {
+    AlgorithmType.APPROXIMATE,
+    AlgorithmType.CONFIGURATION_VALUE_SAMPLING,
+}
+
+# Configuration fields that only influence sampling algorithms.
+SAMPLING_FIELDS = ("num_samples", "seed", "sampling_mode", "num_workers")
+
+# Configuration fields that only influence the AUTO choice, which is resolved before caching.
+PLANNING_FIELDS = ("target_accuracy", "time_budget_seconds")
+
+
+def compute_cache_key(config: GameConfiguration) -> Optional[str]:
+    """
+    Returns a SHA-256 key over the canonical form of the configuration,
+    or None if the run is not reproducible (unseeded sampling) and must not be cached.
+
+    The canonical form drops fields that cannot affect the result (player display
+    names, sampling settings for deterministic algorithms) and orders set-valued
+    fields so that equal configurations always hash identically. Deterministic
+    algorithms also ignore the order of the players; seeded sampling runs do not,
+    since their permutations are drawn over player positions.
+    """
+    if config.algorithm in SAMPLING_ALGORITHMS:
+        if config.seed is None:
+            return None
+        return compute_run_key(config)
+    canonical = _canonical_form(config)
+    canonical["players"].sort(key=lambda player: player["id"])
+    return _hash(canonical)
+
+
+def compute_run_key(config: GameConfiguration) -> str:
+    """
+    Returns a SHA-256 key identifying one run of a configuration, including the
+    sampling settings of sampling algorithms even when they are unseeded.
+    Used to name checkpoints.
+    """
+    canonical = _canonical_form(config)
+    if config.algorithm in SAMPLING_ALGORITHMS:
+        for field in SAMPLING_FIELDS:
+            canonical[field] = getattr(config, field)
+    return _hash(canonical)
+
+
+def compute_game_key(config: GameConfiguration) -> str:
+    """
+    Returns a SHA-256 key identifying the game and algorithm of a configuration,
+    ignoring sampling settings. Runs with equal game keys sample the same game.
+    """
+    return _hash(_canonical_form(config))
+
+
+def _canonical_form(config: GameConfiguration) -> dict:
+    canonical = config.model_dump(mode="json")
+    for player in canonical["players"]:
+        player.pop("name", None)
+        if player.get("airlines") is not None:
+            player["airlines"] = sorted(player["airlines"])
+    for field in SAMPLING_FIELDS + PLANNING_FIELDS:
+        canonical.pop(field, None)
+    return canonical
+
+
+def _hash(canonical: dict) -> str:
+    encoded = json.dumps(canonical, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier cache of CalculationResults keyed by `compute_cache_key`.
+
+    - Memory tier: bounded LRU of the most recently used results.
+    - Disk tier (optional): one JSON file per key under `disk_directory`, survives
+      restarts and is evicted least-recently-used first once `max_disk_bytes` is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        disk_directory: Optional[str] = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+    ):
+        self.max_entries = max_entries
+        self.disk_directory = disk_directory
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: "OrderedDict[str, CalculationResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if disk_directory is not None:
+            os.makedirs(disk_directory, exist_ok=True)
+
+        self._requests = MetricsRegistry().counter(
+            "simulation_cache_requests_total",
+            "Result cache lookups by tier and outcome (hit/miss).",
+            ["tier", "outcome"],
+        )
+
+    def get(self, key: str) -> Optional[CalculationResult]:
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+        if result is not None:
+            self._requests.inc(tier="memory", outcome="hit")
+            return result
+        self._requests.inc(tier="memory", outcome="miss")
+
+        if self.disk_directory is None:
+            return None
+
+        result = self._read_from_disk(key)
+        self._requests.inc(tier="disk", outcome="hit" if result else "miss")
+        if result is not None:
+            self._put_in_memory(key, result)
+        return result
+
+    def put(self, key: str, result: CalculationResult) -> None:
+        self._put_in_memory(key, result)
+        if self.disk_directory is not None:
+            self._write_to_disk(key, result)
+
+    def invalidate(self, key: str) -> None:
+        """
+        Removes a single entry from both tiers.
+        """
+        with self._lock:
+            self._memory.pop(key, None)
+        if self.disk_directory is not None:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        """
+        Removes all entries from both tiers.
+        """
+        with self._lock:
+            self._memory.clear()
+        if self.disk_directory is not None:
+            for name in os.listdir(self.disk_directory):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.disk_directory, name))
+
+    def _put_in_memory(self, key: str, result: CalculationResult) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_directory, f"{key}.json")
+
+    def _read_from_disk(self, key: str) -> Optional[CalculationResult]:
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                result = CalculationResult.model_validate_json(f.read())
+        except (FileNotFoundError, ValueError):
+            return None
+        # Touch the file so eviction treats it as recently used.
+        os.utime(path, None)
+        return result
+
+    def _write_to_disk(self, key: str, result: CalculationResult) -> None:
+        # Write to a temporary file and rename so readers never see partial entries.
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(result.model_dump_json())
+        os.replace(tmp_path, self._path(key))
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        entries = []
+        total = 0
+        for name in os.listdir(self.disk_directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.disk_directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
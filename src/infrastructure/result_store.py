@@ -0,0 +1,384 @@
+import csv
+import json
+import os
+import threading
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, TextIO, Union
+
+import numpy as np
+
+from src.models.entities.calculation_result import CalculationResult
+from src.models.entities.array_calculation_result import (
+    AllocationVector,
+    ArrayCalculationResult,
+)
+
+
+class ResultStore:
+    """
+    Append-only, column-oriented store for many allocations over the same players
+    (e.g. every scenario of a sweep), read back through memory maps.
+
+    Layout of `directory`:
+    - manifest.json: format version and the player-ID index (column order).
+    - values.f64: one float64 row of shares per scenario, stacked (row-major).
+    - standard_errors.f64: same shape, NaN where absent (only if enabled).
+    - total_cost.f64, execution_time.f64: one float64 per scenario.
+    - scenarios.jsonl: one line per scenario (algorithm, is_exact, samples and the
+      caller's metadata). It is written last, so it marks the scenario as complete;
+      column bytes beyond the last complete scenario are cut off on open.
+
+    Reads return views of the memory-mapped files without copying: a row slice is a
+    contiguous block, a single player's column is a strided view.
+    """
+
+    FORMAT_VERSION = 1
+    MANIFEST = "manifest.json"
+    SCENARIOS = "scenarios.jsonl"
+    EXPORT_BLOCK_ROWS = 256
+
+    def __init__(
+        self,
+        directory: str,
+        player_ids: Optional[Sequence[str]] = None,
+        store_standard_errors: bool = False,
+    ):
+        """
+        Args:
+            directory: Store location; created if missing, reopened if it exists.
+            player_ids: Column order for a new store. Defaults to the order of the
+                first appended result. Must match if the store already exists.
+            store_standard_errors: Also keep per-player standard errors (new stores only).
+        """
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._files: Dict[str, Any] = {}
+        self._maps: Dict[str, np.memmap] = {}
+        self._metadata: List[Dict[str, Any]] = []
+        os.makedirs(directory, exist_ok=True)
+
+        manifest_path = os.path.join(directory, self.MANIFEST)
+        if os.path.exists(manifest_path):
+            with open(manifest_path, "r") as f:
+                manifest = json.load(f)
+            if manifest.get("format_version") != self.FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported result store version {manifest.get('format_version')}"
+                )
+            if player_ids is not None and list(player_ids) != manifest["player_ids"]:
+                raise ValueError("player_ids do not match the existing store")
+            self._set_players(manifest["player_ids"], manifest["standard_errors"])
+            self._recover()
+        else:
+            self.store_standard_errors = store_standard_errors
+            self.player_ids: Optional[List[str]] = None
+            if player_ids is not None:
+                self._create(list(player_ids))
+
+    @property
+    def num_scenarios(self) -> int:
+        return len(self._metadata)
+
+    def append(
+        self,
+        result: Union[CalculationResult, ArrayCalculationResult],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Appends one allocation and returns its scenario index.
+
+        Args:
+            result: Allocation over exactly the store's players. An array-backed result
+                in the store's player order is written without a per-player lookup.
+            metadata: JSON-serializable scenario description (e.g. sweep overrides).
+        """
+        with self._lock:
+            if self.player_ids is None:
+                self._create(list(result.shapley_values))
+
+            # Everything that can fail on bad input (missing players, metadata JSON
+            # cannot encode) happens before the first byte is written.
+            rows = {"values.f64": self._row(result.shapley_values).tobytes()}
+            if self.store_standard_errors:
+                errors = (
+                    self._row(result.standard_errors)
+                    if result.standard_errors is not None
+                    else np.full(len(self.player_ids), np.nan)
+                )
+                rows["standard_errors.f64"] = errors.tobytes()
+            rows["total_cost.f64"] = np.float64(result.total_cost).tobytes()
+            rows["execution_time.f64"] = np.float64(result.execution_time).tobytes()
+            record = {
+                "algorithm": result.algorithm_used.value,
+                "is_exact": result.is_exact,
+                "num_samples_used": result.num_samples_used,
+                "metadata": metadata or {},
+            }
+            rows[self.SCENARIOS] = (json.dumps(record) + "\n").encode("utf-8")
+
+            scenarios_size = self._size(self.SCENARIOS)
+            try:
+                for name, data in rows.items():
+                    self._write(name, data)
+            except BaseException:
+                # Cut every file back to the complete scenarios, so a failed append
+                # cannot shift the rows of later ones.
+                self._truncate(self.SCENARIOS, scenarios_size)
+                for name, width in self._column_widths().items():
+                    self._truncate(name, self.num_scenarios * width * 8)
+                raise
+            self._metadata.append(record)
+            return len(self._metadata) - 1
+
+    def values(
+        self,
+        scenarios: Union[int, slice] = slice(None),
+        players: Union[None, slice, Sequence[str]] = None,
+    ) -> np.ndarray:
+        """
+        Shares of `scenarios` (an index or a slice) for `players` (all, a column slice,
+        or a list of player IDs). Index and slice reads are zero-copy views; a list
+        of player IDs gathers the columns into a new array.
+        """
+        return self._select(self._matrix("values.f64"), scenarios, players)
+
+    def standard_errors(
+        self,
+        scenarios: Union[int, slice] = slice(None),
+        players: Union[None, slice, Sequence[str]] = None,
+    ) -> np.ndarray:
+        if not self.store_standard_errors:
+            raise ValueError("This store was created without standard errors")
+        return self._select(self._matrix("standard_errors.f64"), scenarios, players)
+
+    def player_values(self, player_id: str) -> np.ndarray:
+        """
+        One player's share in every scenario (a strided, zero-copy view).
+        """
+        return self._matrix("values.f64")[:, self._column(player_id)]
+
+    def total_costs(self) -> np.ndarray:
+        return self._vector("total_cost.f64")
+
+    def execution_times(self) -> np.ndarray:
+        return self._vector("execution_time.f64")
+
+    def metadata(self, scenario: int) -> Dict[str, Any]:
+        return self._metadata[scenario]
+
+    def export_jsonl(self, out: Union[str, TextIO], scenarios: slice = slice(None)) -> int:
+        """
+        Streams one JSON object per scenario (its record, total cost and shares) to a
+        path or text stream. Returns the number of scenarios written.
+        """
+        with self._open_output(out) as f:
+            count = 0
+            for index, rows in self._blocks(scenarios):
+                totals = self.total_costs()[index : index + len(rows)]
+                for offset, row in enumerate(rows):
+                    line = {
+                        "scenario": index + offset,
+                        **self._metadata[index + offset],
+                        "total_cost": float(totals[offset]),
+                        "shapley_values": dict(zip(self.player_ids, row.tolist())),
+                    }
+                    f.write(json.dumps(line) + "\n")
+                    count += 1
+            return count
+
+    def export_csv(self, out: Union[str, TextIO], scenarios: slice = slice(None)) -> int:
+        """
+        Streams the allocations in long format (scenario, player_id, value[,
+        standard_error]) to a path or text stream. Returns the number of rows written.
+        """
+        with self._open_output(out) as f:
+            writer = csv.writer(f)
+            header = ["scenario", "player_id", "value"]
+            if self.store_standard_errors:
+                header.append("standard_error")
+            writer.writerow(header)
+            count = 0
+            for index, rows in self._blocks(scenarios):
+                errors = (
+                    self._matrix("standard_errors.f64")[index : index + len(rows)]
+                    if self.store_standard_errors
+                    else None
+                )
+                for offset, row in enumerate(rows):
+                    columns = [
+                        [index + offset] * len(row),
+                        self.player_ids,
+                        row.tolist(),
+                    ]
+                    if errors is not None:
+                        columns.append(errors[offset].tolist())
+                    writer.writerows(zip(*columns))
+                    count += len(row)
+            return count
+
+    def close(self) -> None:
+        with self._lock:
+            for f in self._files.values():
+                f.close()
+            self._files.clear()
+            self._maps.clear()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _create(self, player_ids: List[str]) -> None:
+        if len(set(player_ids)) != len(player_ids):
+            raise ValueError("Player IDs must be unique")
+        manifest = {
+            "format_version": self.FORMAT_VERSION,
+            "player_ids": player_ids,
+            "standard_errors": self.store_standard_errors,
+        }
+        with open(os.path.join(self.directory, self.MANIFEST), "w") as f:
+            json.dump(manifest, f)
+        self._set_players(player_ids, self.store_standard_errors)
+
+    def _set_players(self, player_ids: List[str], store_standard_errors: bool) -> None:
+        self.player_ids = player_ids
+        self._ids = tuple(player_ids)
+        self.store_standard_errors = store_standard_errors
+        self._index = {pid: j for j, pid in enumerate(player_ids)}
+
+    def _recover(self) -> None:
+        """
+        Loads the scenario records and trims column bytes of an interrupted append.
+        """
+        path = os.path.join(self.directory, self.SCENARIOS)
+        complete = 0
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                lines = f.read().split(b"\n")
+            # The last element is b"" after a complete line, or a partial record.
+            for line in lines[:-1]:
+                self._metadata.append(json.loads(line))
+                complete += len(line) + 1
+            with open(path, "r+b") as f:
+                f.truncate(complete)
+
+        n = len(self._metadata)
+        for name, width in self._column_widths().items():
+            column_path = os.path.join(self.directory, name)
+            size = os.path.getsize(column_path) if os.path.exists(column_path) else 0
+            if size < n * width * 8:
+                raise ValueError(f"Result store column {name} is shorter than its records")
+            if size > n * width * 8:
+                with open(column_path, "r+b") as f:
+                    f.truncate(n * width * 8)
+
+    def _column_widths(self) -> Dict[str, int]:
+        widths = {
+            "values.f64": len(self.player_ids),
+            "total_cost.f64": 1,
+            "execution_time.f64": 1,
+        }
+        if self.store_standard_errors:
+            widths["standard_errors.f64"] = len(self.player_ids)
+        return widths
+
+    def _row(self, values: Mapping[str, float]) -> np.ndarray:
+        if isinstance(values, AllocationVector) and values.index.ids == self._ids:
+            return values.values
+        if len(values) != len(self.player_ids):
+            raise ValueError(
+                f"Result has {len(values)} players; the store holds {len(self.player_ids)}"
+            )
+        try:
+            return np.fromiter(
+                (values[pid] for pid in self.player_ids),
+                dtype=np.float64,
+                count=len(self.player_ids),
+            )
+        except KeyError as e:
+            raise ValueError(f"Result is missing player {e.args[0]!r}") from None
+
+    def _write(self, name: str, data: bytes) -> None:
+        f = self._files.get(name)
+        if f is None:
+            f = open(os.path.join(self.directory, name), "ab")
+            self._files[name] = f
+        f.write(data)
+        f.flush()
+
+    def _size(self, name: str) -> int:
+        path = os.path.join(self.directory, name)
+        return os.path.getsize(path) if os.path.exists(path) else 0
+
+    def _truncate(self, name: str, size: int) -> None:
+        # Drop the append handle too: it may still buffer bytes of the failed write.
+        f = self._files.pop(name, None)
+        if f is not None:
+            try:
+                f.close()
+            except OSError:
+                pass
+        path = os.path.join(self.directory, name)
+        if os.path.exists(path) and os.path.getsize(path) > size:
+            os.truncate(path, size)
+
+    def _matrix(self, name: str) -> np.ndarray:
+        n = len(self.player_ids) if self.player_ids is not None else 0
+        return self._map(name, (self.num_scenarios, n))
+
+    def _vector(self, name: str) -> np.ndarray:
+        return self._map(name, (self.num_scenarios,))
+
+    def _map(self, name: str, shape) -> np.ndarray:
+        if int(np.prod(shape)) == 0:
+            return np.empty(shape, dtype=np.float64)
+        cached = self._maps.get(name)
+        if cached is None or cached.shape != shape:
+            cached = np.memmap(
+                os.path.join(self.directory, name), dtype=np.float64, mode="r", shape=shape
+            )
+            self._maps[name] = cached
+        return cached
+
+    def _column(self, player_id: str) -> int:
+        try:
+            return self._index[player_id]
+        except KeyError:
+            raise KeyError(f"Unknown player {player_id!r}") from None
+
+    def _select(self, matrix: np.ndarray, scenarios, players) -> np.ndarray:
+        rows = matrix[scenarios]
+        if players is None:
+            return rows
+        if isinstance(players, slice):
+            return rows[..., players]
+        return rows[..., [self._column(pid) for pid in players]]
+
+    def _blocks(self, scenarios: slice) -> Iterator:
+        start, stop, step = scenarios.indices(self.num_scenarios)
+        if step != 1:
+            raise ValueError("Export supports contiguous scenario ranges only")
+        matrix = self._matrix("values.f64")
+        for index in range(start, stop, self.EXPORT_BLOCK_ROWS):
+            yield index, matrix[index : min(index + self.EXPORT_BLOCK_ROWS, stop)]
+
+    @staticmethod
+    def _open_output(out: Union[str, TextIO]):
+        if isinstance(out, str):
+            return open(out, "w", newline="")
+        return _Unclosed(out)
+
+
+class _Unclosed:
+    """
+    Context manager that hands back a caller-owned stream without closing it.
+    """
+
+    def __init__(self, stream: TextIO):
+        self.stream = stream
+
+    def __enter__(self) -> TextIO:
+        return self.stream
+
+    def __exit__(self, *exc_info) -> None:
+        pass
@@ -0,0 +1,26 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+
+from src.models.enums.algorithm_type import AlgorithmType
+
+
+class AlgorithmPlan(BaseModel):
+    """
+    The algorithm chosen for a configuration, with its predicted cost.
+    """
+
+    algorithm: AlgorithmType = Field(..., description="The concrete algorithm to run")
+    num_samples: Optional[int] = Field(
+        None, description="Number of samples (sampling algorithms only)"
+    )
+    predicted_seconds: float = Field(
+        ..., description="Runtime predicted by the calibrated cost model"
+    )
+    expected_relative_error: float = Field(
+        0.0,
+        description="Worst-case standard error of each share as a fraction of the total cost (0 for exact algorithms)",
+    )
+    reason: str = Field(..., description="Human-readable explanation of the choice")
+
+    class Config:
+        frozen = True
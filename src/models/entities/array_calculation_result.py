@@ -0,0 +1,173 @@
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+import numpy as np
+
+from src.models.enums.algorithm_type import AlgorithmType
+from src.models.entities.calculation_result import CalculationResult
+from src.models.entities.player_index import PlayerIndex
+
+
+class AllocationVector(Mapping[str, float]):
+    """
+    Read-only player ID -> value mapping over a float array and a PlayerIndex.
+    Supports the dict interface of `CalculationResult.shapley_values` without
+    creating a Python float per player.
+    """
+
+    __slots__ = ("values", "index")
+
+    def __init__(self, values: np.ndarray, index: PlayerIndex):
+        self.values = values
+        self.index = index
+
+    def __getitem__(self, player_id: str) -> float:
+        return float(self.values[self.index.position(player_id)])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index.ids)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self.index
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(zip(self.index.ids, self.values.tolist()))
+
+
+class ArrayCalculationResult:
+    """
+    CalculationResult for large games: the values are one contiguous float64 array
+    whose positions are given by a shared PlayerIndex.
+
+    Construction does not validate or box the individual values, so calculators
+    should only build it from their own output. `shapley_values` and
+    `standard_errors` look up players by ID lazily; `to_calculation_result` converts
+    to the dict-based model when a caller needs it.
+    """
+
+    __slots__ = (
+        "values",
+        "player_index",
+        "total_cost",
+        "execution_time",
+        "algorithm_used",
+        "is_exact",
+        "standard_error_values",
+        "num_samples_used",
+        "budget_used",
+        "component_values",
+    )
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        player_index: PlayerIndex,
+        total_cost: float,
+        execution_time: float,
+        algorithm_used: AlgorithmType,
+        is_exact: bool = True,
+        standard_error_values: Optional[np.ndarray] = None,
+        num_samples_used: Optional[int] = None,
+        budget_used: Optional[float] = None,
+        component_values: Optional[Dict[str, Dict[str, float]]] = None,
+    ):
+        if values.shape != (len(player_index),):
+            raise ValueError(
+                f"Expected {len(player_index)} values, got an array of shape {values.shape}"
+            )
+        self.values = self._read_only(values)
+        self.player_index = player_index
+        self.total_cost = float(total_cost)
+        self.execution_time = float(execution_time)
+        self.algorithm_used = algorithm_used
+        self.is_exact = is_exact
+        self.standard_error_values = (
+            self._read_only(standard_error_values)
+            if standard_error_values is not None
+            else None
+        )
+        self.num_samples_used = num_samples_used
+        self.budget_used = budget_used
+        self.component_values = component_values
+
+    @property
+    def shapley_values(self) -> AllocationVector:
+        return AllocationVector(self.values, self.player_index)
+
+    @property
+    def standard_errors(self) -> Optional[AllocationVector]:
+        if self.standard_error_values is None:
+            return None
+        return AllocationVector(self.standard_error_values, self.player_index)
+
+    def model_copy(self, update: Optional[Dict[str, Any]] = None) -> "ArrayCalculationResult":
+        """
+        Copy with some fields replaced (same signature as the pydantic model, so
+        callers can treat both result types alike). The arrays are shared.
+        """
+        fields = {name: getattr(self, name) for name in self.__slots__}
+        fields.update(update or {})
+        return ArrayCalculationResult(**fields)
+
+    def to_calculation_result(self) -> CalculationResult:
+        """
+        Converts to the dict-based CalculationResult. The values come from a
+        calculator, so the per-entry validation is skipped.
+        """
+        standard_errors = self.standard_errors
+        return CalculationResult.model_construct(
+            shapley_values=self.shapley_values.to_dict(),
+            total_cost=self.total_cost,
+            execution_time=self.execution_time,
+            algorithm_used=self.algorithm_used,
+            is_exact=self.is_exact,
+            standard_errors=standard_errors.to_dict() if standard_errors is not None else None,
+            num_samples_used=self.num_samples_used,
+            budget_used=self.budget_used,
+            component_values=self.component_values,
+        )
+
+    @classmethod
+    def from_calculation_result(
+        cls, result: CalculationResult, player_index: Optional[PlayerIndex] = None
+    ) -> "ArrayCalculationResult":
+        """
+        Packs a dict-based result into arrays ordered by `player_index` (by default
+        the order of `result.shapley_values`).
+        """
+        if player_index is None:
+            player_index = PlayerIndex(result.shapley_values)
+
+        def pack(values: Dict[str, float]) -> np.ndarray:
+            if len(values) != len(player_index):
+                raise ValueError("Result players do not match the player index")
+            return np.fromiter(
+                (values[pid] for pid in player_index.ids),
+                dtype=np.float64,
+                count=len(player_index),
+            )
+
+        return cls(
+            values=pack(result.shapley_values),
+            player_index=player_index,
+            total_cost=result.total_cost,
+            execution_time=result.execution_time,
+            algorithm_used=result.algorithm_used,
+            is_exact=result.is_exact,
+            standard_error_values=(
+                pack(result.standard_errors) if result.standard_errors is not None else None
+            ),
+            num_samples_used=result.num_samples_used,
+            budget_used=result.budget_used,
+            component_values=result.component_values,
+        )
+
+    @staticmethod
+    def _read_only(values: np.ndarray) -> np.ndarray:
+        values = np.ascontiguousarray(values, dtype=np.float64)
+        if values.flags.writeable:
+            values = values.view()
+            values.flags.writeable = False
+        return values
@@ -0,0 +1,28 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+from src.models.enums.algorithm_type import AlgorithmType
+from src.models.entities.sampling_session_state import SamplingSessionState
+
+
+class CalculationCheckpoint(BaseModel):
+    """
+    Partial state of a long-running calculation, written periodically so that an
+    interrupted run can resume where it stopped.
+    """
+
+    algorithm: AlgorithmType = Field(..., description="The algorithm being run")
+    player_ids: List[str] = Field(..., description="Player IDs, aligned with the sums")
+    position: int = Field(
+        0, ge=0, description="Permutations fully processed (exact enumeration)"
+    )
+    sums: List[float] = Field(
+        default_factory=list,
+        description="Running sums of marginal contributions (exact enumeration)",
+    )
+    sampling: Optional[SamplingSessionState] = Field(
+        None, description="Accumulated samples and RNG state (sampling algorithms)"
+    )
+
+    class Config:
+        frozen = True
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import Dict, Optional
 from pydantic import BaseModel, Field
 
 from src.models.enums.algorithm_type import AlgorithmType
@@ -17,6 +17,23 @@ class CalculationResult(BaseModel):
         ..., description="Time taken to perform the calculation in seconds"
     )
     algorithm_used: AlgorithmType = Field(..., description="The algorithm used")
+    is_exact: bool = Field(
+        True, description="False if the values are a sampling estimate"
+    )
+    standard_errors: Optional[Dict[str, float]] = Field(
+        None, description="Standard error of each estimated value (sampling algorithms only)"
+    )
+    num_samples_used: Optional[int] = Field(
+        None, description="Number of sampled orderings (sampling algorithms only)"
+    )
+    budget_used: Optional[float] = Field(
+        None,
+        description="Fraction of the wall-clock deadline consumed (deadline runs only)",
+    )
+    component_values: Optional[Dict[str, Dict[str, float]]] = Field(
+        None,
+        description="Per-facility shares, facility name -> player ID -> value (multi-facility games only)",
+    )
 
     class Config:
         frozen = True
@@ -0,0 +1,25 @@
+from typing import List
+from pydantic import BaseModel, Field
+
+
+class CoreStabilityReport(BaseModel):
+    """
+    Outcome of checking whether a cost allocation lies in the core of a game.
+    """
+
+    in_core: bool = Field(
+        ..., description="True if the allocation is efficient and no coalition overpays"
+    )
+    efficiency_gap: float = Field(
+        ..., description="Total allocated minus the grand coalition's cost"
+    )
+    max_violation: float = Field(
+        ...,
+        description="Largest x(S) - c(S) over all non-empty coalitions S; positive means S overpays",
+    )
+    most_violated_coalition: List[str] = Field(
+        ..., description="Player IDs of a coalition attaining max_violation"
+    )
+
+    class Config:
+        frozen = True
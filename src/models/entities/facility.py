@@ -0,0 +1,20 @@
+from typing import Dict
+from pydantic import BaseModel, Field
+
+
+class Facility(BaseModel):
+    """
+    One shared facility (runway, terminal, apron, navigation aids, ...) of a
+    multi-facility game. Each facility is an airport game over the same movements:
+    a coalition pays for the largest size any of its members needs.
+    """
+
+    name: str = Field(..., description="Facility name, used as the breakdown key")
+    player_costs: Dict[str, float] = Field(
+        ...,
+        description="Player ID -> cost of the facility size that player needs; "
+        "players not listed do not use the facility",
+    )
+
+    class Config:
+        frozen = True
@@ -1,7 +1,9 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
 
 from src.models.entities.player import Player
+from src.models.entities.tree_edge import TreeEdge
+from src.models.entities.facility import Facility
 from src.models.enums.algorithm_type import AlgorithmType
 
 
@@ -21,10 +23,67 @@ class GameConfiguration(BaseModel):
         None,
         description="Number of samples for approximate calculation (if applicable)",
     )
+    seed: Optional[int] = Field(
+        None,
+        description="Random seed for sampling algorithms. Seeded runs are reproducible (and cacheable).",
+    )
+    sampling_mode: Optional[Literal["sequential", "vectorised", "parallel"]] = Field(
+        None,
+        description="CONFIGURATION_VALUE_SAMPLING only: how samples are evaluated (default vectorised)",
+    )
+    num_workers: Optional[int] = Field(
+        None,
+        ge=1,
+        description="CONFIGURATION_VALUE_SAMPLING only: worker processes in parallel mode (default 4)",
+    )
+
+    target_accuracy: Optional[float] = Field(
+        None,
+        gt=0,
+        description="AUTO only: acceptable standard error of each share, as a fraction of the total cost",
+    )
+    time_budget_seconds: Optional[float] = Field(
+        None, gt=0, description="AUTO only: time the chosen algorithm may take"
+    )
+
+    semivalue_alpha: Optional[float] = Field(
+        None,
+        gt=0,
+        description="SEMIVALUE only: alpha of the Beta(alpha, beta) size weighting (default 1)",
+    )
+    semivalue_beta: Optional[float] = Field(
+        None,
+        gt=0,
+        description="SEMIVALUE only: beta of the Beta(alpha, beta) size weighting (default 1)",
+    )
 
     runway_cost_steps: Optional[List[float]] = Field(
         None, description="c1..c_|T| (c0 assumed 0). Required for CONFIGURATION_VALUE."
     )
 
+    maintenance_rate: Optional[float] = Field(
+        None,
+        ge=0,
+        description="Maintenance cost per unit of runway per movement. Makes the game "
+        "congestion-aware (CONGESTION_SHAPLEY, EXACT, APPROXIMATE).",
+    )
+    slot_cost: Optional[float] = Field(
+        None,
+        ge=0,
+        description="Slot/handling cost per movement. Makes the game congestion-aware.",
+    )
+
+    tree_edges: Optional[List[TreeEdge]] = Field(
+        None,
+        description="Rooted infrastructure tree; each player needs the path to Player.node. "
+        "Required for TREE_SHAPLEY, and turns EXACT/APPROXIMATE into tree games.",
+    )
+
+    facilities: Optional[List[Facility]] = Field(
+        None,
+        description="Facilities whose costs add up (runway, terminal, apron, ...). "
+        "Required for DECOMPOSITION, and turns EXACT/APPROXIMATE into multi-facility games.",
+    )
+
     class Config:
         frozen = True
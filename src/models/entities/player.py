@@ -11,5 +11,13 @@ class Player(BaseModel):
     type: Optional[int] = Field(None, ge=1, description="τ(i)")
     airlines: Optional[FrozenSet[str]] = Field(None, min_items=1)
 
+    movements: Optional[int] = Field(
+        None, ge=0, description="Movements operated (congestion games only, default 1)"
+    )
+
+    node: Optional[str] = Field(
+        None, description="Tree node the player needs to reach (tree games only)"
+    )
+
     class Config:
         frozen = True
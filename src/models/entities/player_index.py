@@ -0,0 +1,65 @@
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models.entities.player import Player
+
+
+class PlayerIndex:
+    """
+    Immutable mapping between player IDs and array positions.
+
+    One index is shared by every array-backed result of the same game, so a result
+    only carries its float array. The ID -> position table is built on the first
+    lookup by ID.
+    """
+
+    __slots__ = ("ids", "_positions")
+
+    def __init__(self, ids: Sequence[str]):
+        self.ids: Tuple[str, ...] = tuple(ids)
+        self._positions: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_players(cls, players: Sequence[Player]) -> "PlayerIndex":
+        return cls([p.id for p in players])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.ids)
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._table()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PlayerIndex):
+            return NotImplemented
+        return self is other or self.ids == other.ids
+
+    def __hash__(self) -> int:
+        return hash(self.ids)
+
+    def position(self, player_id: str) -> int:
+        """
+        Array position of `player_id`.
+
+        Raises:
+            KeyError: If the player is not in the index.
+        """
+        return self._table()[player_id]
+
+    def positions(self, player_ids: Sequence[str]) -> np.ndarray:
+        table = self._table()
+        return np.fromiter(
+            (table[pid] for pid in player_ids), dtype=np.int64, count=len(player_ids)
+        )
+
+    def _table(self) -> Dict[str, int]:
+        if self._positions is None:
+            positions = {pid: j for j, pid in enumerate(self.ids)}
+            if len(positions) != len(self.ids):
+                raise ValueError("Player IDs must be unique")
+            self._positions = positions
+        return self._positions
@@ -0,0 +1,25 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class SamplingSessionState(BaseModel):
+    """
+    Serializable snapshot of a Monte Carlo sampling session.
+    Can be stored, resumed later, or merged with sessions sampled elsewhere.
+    """
+
+    game_key: Optional[str] = Field(
+        None, description="Identifies the sampled game; sessions only merge with equal keys"
+    )
+    player_ids: List[str] = Field(..., description="Player IDs, aligned with the sums")
+    sums: List[float] = Field(..., description="Running sums of marginal contributions")
+    squared_sums: List[float] = Field(
+        ..., description="Running sums of squared marginal contributions"
+    )
+    num_samples: int = Field(0, ge=0, description="Number of sampled orderings")
+    rng_state: Optional[list] = Field(
+        None, description="random.Random state, so a resumed session continues the same stream"
+    )
+
+    class Config:
+        frozen = True
@@ -0,0 +1,43 @@
+from typing import Optional
+from pydantic import BaseModel, Field
+
+
+class SemivalueWeighting(BaseModel):
+    """
+    Describes a semivalue by how it weights coalitions of each size.
+
+    A semivalue pays player i the weighted average of its marginal contributions
+    v(S U {i}) - v(S), where the weight of S depends only on |S|. Two families are
+    supported:
+
+    - Binomial(p): each other player is in S independently with probability p.
+      p = 0.5 gives the Banzhaf value.
+    - Beta(alpha, beta): the inclusion probability is itself drawn from a
+      Beta(alpha, beta) distribution. alpha = beta = 1 gives the Shapley value.
+    """
+
+    name: str = Field(..., description="Label of the semivalue in results")
+    binomial_p: Optional[float] = Field(
+        None, ge=0, le=1, description="Inclusion probability (binomial semivalues)"
+    )
+    alpha: float = Field(1.0, gt=0, description="Beta weighting parameter alpha")
+    beta: float = Field(1.0, gt=0, description="Beta weighting parameter beta")
+
+    class Config:
+        frozen = True
+
+    @classmethod
+    def shapley(cls) -> "SemivalueWeighting":
+        return cls(name="shapley")
+
+    @classmethod
+    def banzhaf(cls) -> "SemivalueWeighting":
+        return cls(name="banzhaf", binomial_p=0.5)
+
+    @classmethod
+    def binomial(cls, p: float) -> "SemivalueWeighting":
+        return cls(name=f"binomial({p:g})", binomial_p=p)
+
+    @classmethod
+    def beta_weighted(cls, alpha: float, beta: float) -> "SemivalueWeighting":
+        return cls(name=f"beta({alpha:g},{beta:g})", alpha=alpha, beta=beta)
@@ -0,0 +1,28 @@
+from typing import Dict, FrozenSet, List, Optional
+from pydantic import BaseModel, Field
+
+from src.models.entities.player import Player
+from src.models.entities.calculation_result import CalculationResult
+
+
+class SessionState(BaseModel):
+    """
+    Per-browser-session UI state. Immutable: handlers return updated copies
+    instead of mutating a shared instance.
+    """
+
+    players: List[Player] = Field(
+        default_factory=list, description="Players generated for this session"
+    )
+    runway_cost_steps: Optional[List[float]] = Field(
+        None, description="Last parsed runway cost steps c1..c_|T|"
+    )
+    codeshare: Dict[str, FrozenSet[str]] = Field(
+        default_factory=dict, description="Mapping of player IDs to operating airlines"
+    )
+    last_result: Optional[CalculationResult] = Field(
+        None, description="Most recent result, used to page through the results table"
+    )
+
+    class Config:
+        frozen = True
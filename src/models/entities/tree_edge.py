@@ -0,0 +1,16 @@
+from pydantic import BaseModel, Field
+
+
+class TreeEdge(BaseModel):
+    """
+    One edge of a rooted infrastructure tree (runway, taxiway or apron section).
+    Each node except the root has exactly one edge to its parent, so an edge is
+    identified by its child node.
+    """
+
+    parent: str = Field(..., description="Node closer to the root")
+    child: str = Field(..., description="Node further from the root")
+    cost: float = Field(..., ge=0, description="Cost of building this section")
+
+    class Config:
+        frozen = True
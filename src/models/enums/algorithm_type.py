@@ -9,3 +9,12 @@ class AlgorithmType(str, Enum):
     EXACT = "exact"
     APPROXIMATE = "approximate"
     CONFIGURATION_VALUE = "configuration_value"
+    CONFIGURATION_VALUE_SAMPLING = "configuration_value_sampling"
+    AIRPORT_SHAPLEY = "airport_shapley"
+    BANZHAF = "banzhaf"
+    SEMIVALUE = "semivalue"
+    NUCLEOLUS = "nucleolus"
+    TREE_SHAPLEY = "tree_shapley"
+    DECOMPOSITION = "decomposition"
+    CONGESTION_SHAPLEY = "congestion_shapley"
+    AUTO = "auto"
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class JobStatus(str, Enum):
+    """
+    Lifecycle states of a background simulation job.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
@@ -0,0 +1,119 @@
+import time
+from typing import Optional
+
+import numpy as np
+
+from src.services.shapley_calculator_interface import ShapleyCalculator
+from src.services.calculation_monitor import CalculationMonitor
+
+from src.domain.airport_game import AirportGame
+
+from src.models.enums.algorithm_type import AlgorithmType
+from src.models.entities.calculation_result import CalculationResult
+
+
+class AirportNucleolusCalculator(ShapleyCalculator):
+    """
+    Calculates the nucleolus of an airport game with Littlechild's sequential
+    algorithm instead of a sequence of LPs over 2^N coalitions.
+
+    With costs sorted as c_1 <= ... <= c_n, the binding coalitions are the prefixes
+    {1..k} (slack c_k - x(1..k)) and the complements N minus {j} (slack x_j). Each
+    stage raises the smallest slack as far as possible by charging the next block
+    of cheapest players the same amount:
+
+        eps_j = min over k in (i_{j-1}, n-1] of (c_k - X_{j-1}) / (k - i_{j-1} + 1)
+
+    where X_{j-1} is what players 1..i_{j-1} already pay. Players up to the largest
+    minimising k (i_j) pay eps_j, and the last player pays the remainder c_n - X.
+    Within a tie group of equal costs only the last index can minimise the ratio,
+    so only those indices are candidates.
+
+    The ratio is the slope from (i_{j-1}, X_{j-1}) to the point (k + 2, c_k), so the
+    minimum is attained on the lower convex hull of the remaining candidates' points,
+    where the slopes are unimodal. The hulls of all candidate suffixes are built
+    together (right to left, each vertex linked to the next one), and each stage
+    walks its hull from the left to the minimum; the vertices it passes are settled
+    by that stage, so all stages together take O(N).
+
+    Complexity: O(N log N) for the sort plus O(N) for all stages.
+    """
+
+    def calculate(
+        self, game: AirportGame, monitor: Optional[CalculationMonitor] = None
+    ) -> CalculationResult:
+        start_time = time.time()
+        players = game.players
+        n = len(players)
+        if n == 0:
+            raise ValueError("Game has no players")
+
+        costs = np.array([p.cost for p in players], dtype=float)
+        order = np.argsort(costs, kind="stable")
+        c = costs[order]
+
+        # Candidate prefixes (0-based last index): ends of tie groups, plus n-2 so
+        # that a tie at the top still has a candidate.
+        candidates = np.flatnonzero(np.diff(c) > 0)
+        if n >= 2 and (len(candidates) == 0 or candidates[-1] != n - 2):
+            candidates = np.append(candidates, n - 2)
+
+        xs = (candidates + 2).tolist()
+        ys = c[candidates].tolist()
+        next_vertex = self._suffix_hulls(xs, ys)
+
+        allocation = np.zeros(n)
+        assigned = 0  # players 0..assigned-1 (in sorted order) are settled
+        paid = 0.0
+        first = 0  # first candidate >= assigned
+        while assigned < n - 1:
+            if monitor is not None:
+                monitor.update(assigned, n)
+            # Walk the hull while the slope from (assigned, paid) does not increase;
+            # on ties this keeps the largest minimising k.
+            best = first
+            following = next_vertex[best]
+            while following >= 0 and (ys[following] - paid) * (xs[best] - assigned) <= (
+                ys[best] - paid
+            ) * (xs[following] - assigned):
+                best, following = following, next_vertex[following]
+            eps = (ys[best] - paid) / (xs[best] - assigned)
+            last = int(candidates[best])
+            allocation[assigned : last + 1] = eps
+            paid += eps * (last + 1 - assigned)
+            assigned = last + 1
+            first = best + 1
+
+        allocation[n - 1] = c[n - 1] - paid
+
+        nucleolus = np.empty(n)
+        nucleolus[order] = allocation
+        end_time = time.time()
+
+        return CalculationResult(
+            shapley_values=dict(zip([p.id for p in players], nucleolus.tolist())),
+            total_cost=game.calculate_characteristic_function(players),
+            execution_time=end_time - start_time,
+            algorithm_used=AlgorithmType.NUCLEOLUS,
+        )
+
+    @staticmethod
+    def _suffix_hulls(xs, ys):
+        """
+        For points sorted by increasing x, returns next_vertex[j]: the vertex after j on
+        the lower convex hull of points j, j+1, ... (-1 if j is the last), so each
+        suffix's hull is the chain j, next_vertex[j], next_vertex[next_vertex[j]], ...
+        """
+        next_vertex = [-1] * len(xs)
+        stack = []
+        for j in range(len(xs) - 1, -1, -1):
+            # Drop the top vertex while it is not strictly below the segment from j
+            # to the vertex after it (collinear points are dropped too).
+            while len(stack) >= 2:
+                b, d = stack[-1], stack[-2]
+                if (ys[b] - ys[j]) * (xs[d] - xs[j]) < (ys[d] - ys[j]) * (xs[b] - xs[j]):
+                    break
+                stack.pop()
+            next_vertex[j] = stack[-1] if stack else -1
+            stack.append(j)
+        return next_vertex
@@ -0,0 +1,51 @@
+import time
+from typing import Optional
+
+from src.services.shapley_calculator_interface import ShapleyCalculator
+from src.services.calculation_monitor import CalculationMonitor
+from src.services.airport_semivalue_engine import AirportSemivalueEngine
+
+from src.domain.airport_game import AirportGame
+
+from src.models.enums.algorithm_type import AlgorithmType
+from src.models.entities.calculation_result import CalculationResult
+from src.models.entities.array_calculation_result import ArrayCalculationResult
+from src.models.entities.semivalue_weighting import SemivalueWeighting
+
+
+class AirportSemivalueCalculator(ShapleyCalculator):
+    """
+    Calculates a semivalue (Shapley, Banzhaf or a weighted semivalue) of an airport
+    game in closed form with AirportSemivalueEngine. Complexity is O(N log N).
+    """
+
+    def __init__(self, weighting: SemivalueWeighting, algorithm: AlgorithmType):
+        self.weighting = weighting
+        self.algorithm = algorithm
+        self.engine = AirportSemivalueEngine()
+
+    def calculate(
+        self, game: AirportGame, monitor: Optional[CalculationMonitor] = None
+    ) -> CalculationResult:
+        return self.calculate_array(game, monitor).to_calculation_result()
+
+    def calculate_array(
+        self, game: AirportGame, monitor: Optional[CalculationMonitor] = None
+    ) -> ArrayCalculationResult:
+        start_time = time.time()
+        if monitor is not None:
+            monitor.update(0, 1)
+
+        values = self.engine.compute_arrays(game, [self.weighting])[self.weighting.name]
+
+        if monitor is not None:
+            monitor.update(1, 1)
+        end_time = time.time()
+
+        return ArrayCalculationResult(
+            values=values,
+            player_index=game.player_index,
+            total_cost=game.calculate_characteristic_function(game.players),
+            execution_time=end_time - start_time,
+            algorithm_used=self.algorithm,
+        )
@@ -0,0 +1,162 @@
+import math
+from typing import Optional
+
+from src.models.enums.algorithm_type import AlgorithmType
+from src.models.entities.algorithm_plan import AlgorithmPlan
+from src.models.entities.game_configuration import GameConfiguration
+
+from src.services.cost_model import CostModel
+
+from src.infrastructure.result_cache import SAMPLING_ALGORITHMS
+
+
+class AlgorithmSelector:
+    """
+    Chooses a calculator for a configuration from the game type, the number of
+    players, the requested accuracy and a time budget.
+
+    - Code-sharing games (runway cost steps, player types and airlines) use the
+      closed-form configuration value.
+    - Tree games (tree edges) use the linear-time tree Shapley allocation.
+    - Multi-facility games are decomposed into one closed-form airport game per facility.
+    - Congestion-aware games (maintenance rate or slot cost) use their closed form.
+    - Classic airport games (a cost for every player) use the exact O(N log N)
+      closed-form airport Shapley value, whatever the size.
+    - Anything else uses the exact calculator when the cost model predicts it fits
+      the time budget, and Monte Carlo sampling otherwise. Marginal contributions lie
+      in [0, total cost], so m samples bound the standard error of each share by
+      total_cost / (2 * sqrt(m)); the sample count is chosen for the target accuracy
+      and capped by the time budget.
+    """
+
+    DEFAULT_TARGET_ACCURACY = 0.01
+    DEFAULT_TIME_BUDGET_SECONDS = 10.0
+    MIN_SAMPLES = 100
+
+    def __init__(self, cost_model: Optional[CostModel] = None):
+        self.cost_model = cost_model or CostModel.from_configuration()
+
+    def plan(self, config: GameConfiguration) -> AlgorithmPlan:
+        """
+        Returns the plan for `config`. For an explicit algorithm the plan keeps it and
+        only adds the predicted runtime; for AUTO it makes the choice.
+        """
+        n = len(config.players)
+        num_types = self._num_types(config)
+
+        if config.algorithm != AlgorithmType.AUTO:
+            samples = (
+                (config.num_samples or 1000)
+                if config.algorithm in SAMPLING_ALGORITHMS
+                else None
+            )
+            return AlgorithmPlan(
+                algorithm=config.algorithm,
+                num_samples=samples,
+                predicted_seconds=self.cost_model.predict(
+                    config.algorithm, n, samples, num_types
+                ),
+                expected_relative_error=(
+                    self._relative_error(samples) if samples is not None else 0.0
+                ),
+                reason="Selected explicitly.",
+            )
+
+        if self._is_configuration_game(config):
+            return AlgorithmPlan(
+                algorithm=AlgorithmType.CONFIGURATION_VALUE,
+                predicted_seconds=self.cost_model.predict(
+                    AlgorithmType.CONFIGURATION_VALUE, n, num_types=num_types
+                ),
+                reason="Code-sharing game: closed-form configuration value.",
+            )
+
+        if config.facilities is not None:
+            return AlgorithmPlan(
+                algorithm=AlgorithmType.DECOMPOSITION,
+                predicted_seconds=self.cost_model.predict(AlgorithmType.DECOMPOSITION, n),
+                reason="Multi-facility game: facilities solved separately and summed.",
+            )
+
+        if config.maintenance_rate is not None or config.slot_cost is not None:
+            return AlgorithmPlan(
+                algorithm=AlgorithmType.CONGESTION_SHAPLEY,
+                predicted_seconds=self.cost_model.predict(
+                    AlgorithmType.CONGESTION_SHAPLEY, n
+                ),
+                reason="Congestion-aware airport game: closed form over sorted costs.",
+            )
+
+        if config.tree_edges is not None:
+            return AlgorithmPlan(
+                algorithm=AlgorithmType.TREE_SHAPLEY,
+                predicted_seconds=self.cost_model.predict(AlgorithmType.TREE_SHAPLEY, n),
+                reason="Tree game: edge costs split among downstream users.",
+            )
+
+        if all(p.cost is not None for p in config.players):
+            return AlgorithmPlan(
+                algorithm=AlgorithmType.AIRPORT_SHAPLEY,
+                predicted_seconds=self.cost_model.predict(AlgorithmType.AIRPORT_SHAPLEY, n),
+                reason="Classic airport game: exact closed-form Shapley value over sorted costs.",
+            )
+
+        budget = config.time_budget_seconds or self.DEFAULT_TIME_BUDGET_SECONDS
+        accuracy = config.target_accuracy or self.DEFAULT_TARGET_ACCURACY
+
+        exact_seconds = self.cost_model.predict(AlgorithmType.EXACT, n)
+        if exact_seconds <= budget:
+            return AlgorithmPlan(
+                algorithm=AlgorithmType.EXACT,
+                predicted_seconds=exact_seconds,
+                reason=f"Exact enumeration of {n}! orderings fits the {budget:g}s budget.",
+            )
+
+        samples = max(self.MIN_SAMPLES, math.ceil(1.0 / (4.0 * accuracy**2)))
+        approx_seconds = self.cost_model.predict(AlgorithmType.APPROXIMATE, n, samples)
+        reason = (
+            f"Exact enumeration would take ~{self.format_seconds(exact_seconds)}; "
+            f"sampling {samples:,} orderings for {accuracy:.2%} accuracy."
+        )
+        if approx_seconds > budget:
+            per_sample = self.cost_model.predict(AlgorithmType.APPROXIMATE, n, 1)
+            if per_sample > 0:
+                samples = max(self.MIN_SAMPLES, int(budget / per_sample))
+            approx_seconds = self.cost_model.predict(AlgorithmType.APPROXIMATE, n, samples)
+            reason = (
+                f"Exact enumeration would take ~{self.format_seconds(exact_seconds)}; "
+                f"sampling limited to {samples:,} orderings by the {budget:g}s budget."
+            )
+
+        return AlgorithmPlan(
+            algorithm=AlgorithmType.APPROXIMATE,
+            num_samples=samples,
+            predicted_seconds=approx_seconds,
+            expected_relative_error=self._relative_error(samples),
+            reason=reason,
+        )
+
+    @staticmethod
+    def _is_configuration_game(config: GameConfiguration) -> bool:
+        return bool(config.runway_cost_steps) and all(
+            p.type is not None and p.airlines for p in config.players
+        )
+
+    @staticmethod
+    def _num_types(config: GameConfiguration) -> Optional[int]:
+        types = [p.type for p in config.players if p.type is not None]
+        return max(types) if types else None
+
+    @staticmethod
+    def _relative_error(samples: int) -> float:
+        return 1.0 / (2.0 * math.sqrt(samples))
+
+    @staticmethod
+    def format_seconds(seconds: float) -> str:
+        if math.isinf(seconds) or seconds > 3.15e9:
+            return "centuries"
+        if seconds >= 3600:
+            return f"{seconds / 3600:,.1f} h"
+        if seconds >= 60:
+            return f"{seconds / 60:,.1f} min"
+        return f"{seconds:.2f} s"
@@ -1,12 +1,13 @@
 import time
-import random
-from typing import List
+from typing import Optional
 
 from src.services.shapley_calculator_interface import ShapleyCalculator
+from src.services.calculation_monitor import CalculationMonitor
+from src.services.sampling_session import SamplingSession
+from src.services.calculation_checkpointer import CalculationCheckpointer
 
 from src.domain.cooperative_game import CooperativeGame
 
-from src.models.entities.player import Player
 from src.models.enums.algorithm_type import AlgorithmType
 from src.models.entities.calculation_result import CalculationResult
 
@@ -16,10 +17,24 @@ class ApproximateShapleyCalculator(ShapleyCalculator):
     Calculates approximate Shapley values using Monte Carlo sampling.
     """
 
-    def __init__(self, num_samples: int = 1000):
+    def __init__(
+        self,
+        num_samples: int = 1000,
+        seed: Optional[int] = None,
+        checkpointer: Optional[CalculationCheckpointer] = None,
+    ):
+        """
+        Args:
+            checkpointer: If given, the accumulated sums and RNG state are saved
+                periodically, and a matching checkpoint is resumed from on start.
+        """
         self.num_samples = num_samples
+        self.seed = seed
+        self.checkpointer = checkpointer
 
-    def calculate(self, game: CooperativeGame) -> CalculationResult:
+    def calculate(
+        self, game: CooperativeGame, monitor: Optional[CalculationMonitor] = None
+    ) -> CalculationResult:
         """
         Calculates Shapley values using Monte Carlo sampling.
 
@@ -33,39 +48,19 @@ class ApproximateShapleyCalculator(ShapleyCalculator):
 
         Use this calculator when the number of players is large (e.g., N > 10), where
         calculating the exact value is computationally prohibitive due to N! complexity.
+
+        If the monitor carries a deadline, the calculator is "anytime": it keeps drawing
+        samples until the deadline (ignoring num_samples) and returns the estimate so far.
         """
         start_time = time.time()
-        players = game.players
-        shapley_values = {player.id: 0.0 for player in players}
-
-        for _ in range(self.num_samples):
-            # Generate a random permutation
-            perm = list(players)
-            random.shuffle(perm)
-
-            current_coalition: List[Player] = []
-            current_cost = 0.0
-
-            for player in perm:
-                new_coalition = current_coalition + [player]
-                new_cost = game.calculate_characteristic_function(new_coalition)
-                marginal_contribution = new_cost - current_cost
-
-                shapley_values[player.id] += marginal_contribution
-
-                current_coalition = new_coalition
-                current_cost = new_cost
-
-        # Average over samples
-        for player_id in shapley_values:
-            shapley_values[player_id] /= self.num_samples
-
-        end_time = time.time()
-        total_cost = game.calculate_characteristic_function(players)
-
-        return CalculationResult(
-            shapley_values=shapley_values,
-            total_cost=total_cost,
-            execution_time=end_time - start_time,
-            algorithm_used=AlgorithmType.APPROXIMATE,
+        session = SamplingSession(game, seed=self.seed)
+        if self.checkpointer is not None:
+            checkpoint = self.checkpointer.load(
+                AlgorithmType.APPROXIMATE, session.player_ids
+            )
+            if checkpoint is not None and checkpoint.sampling is not None:
+                session = SamplingSession.from_state(game, checkpoint.sampling)
+        session.add_samples(
+            max(0, self.num_samples - session.num_samples), monitor, self.checkpointer
         )
+        return session.estimate(time.time() - start_time)
@@ -0,0 +1,47 @@
+import time
+from typing import Callable, List, Optional
+
+from src.models.enums.algorithm_type import AlgorithmType
+from src.models.entities.calculation_checkpoint import CalculationCheckpoint
+
+from src.infrastructure.checkpoint_store import CheckpointStore
+
+
+class CalculationCheckpointer:
+    """
+    Saves and restores the checkpoint of a single run.
+
+    Calculators call `maybe_save` at their progress points; a checkpoint is only built
+    and written once `interval_seconds` have passed since the last one, so the check
+    is cheap enough for inner loops.
+    """
+
+    def __init__(self, store: CheckpointStore, key: str, interval_seconds: float = 60.0):
+        self.store = store
+        self.key = key
+        self.interval_seconds = interval_seconds
+        self._last_save = time.monotonic()
+
+    def load(
+        self, algorithm: AlgorithmType, player_ids: List[str]
+    ) -> Optional[CalculationCheckpoint]:
+        """
+        Returns the stored checkpoint if it belongs to this algorithm and player list.
+        """
+        checkpoint = self.store.load(self.key)
+        if checkpoint is None:
+            return None
+        if checkpoint.algorithm != algorithm or checkpoint.player_ids != player_ids:
+            return None
+        return checkpoint
+
+    def maybe_save(self, build: Callable[[], CalculationCheckpoint]) -> None:
+        if time.monotonic() - self._last_save >= self.interval_seconds:
+            self.save(build())
+
+    def save(self, checkpoint: CalculationCheckpoint) -> None:
+        self.store.save(self.key, checkpoint)
+        self._last_save = time.monotonic()
+
+    def clear(self) -> None:
+        self.store.delete(self.key)
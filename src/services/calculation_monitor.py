@@ -0,0 +1,74 @@
+import time
+import threading
+from typing import Callable, Optional
+
+
+class CalculationCancelledError(Exception):
+    """
+    Raised inside a calculator when its monitor has been cancelled.
+    """
+
+
+class CalculationDeadlineExceededError(Exception):
+    """
+    Raised by calculators that cannot return a partial answer once the deadline has passed.
+    """
+
+
+class CalculationMonitor:
+    """
+    Shared handle between a running calculation and its caller.
+
+    Calculators report progress through `update`, which also acts as the cooperative
+    cancellation point: once `cancel` has been called, the next `update` raises
+    CalculationCancelledError and the calculation unwinds.
+
+    An optional wall-clock deadline (a `time.monotonic()` timestamp) tells anytime
+    calculators when to stop refining and return their current estimate.
+    """
+
+    def __init__(
+        self,
+        progress_callback: Optional[Callable[[float], None]] = None,
+        deadline: Optional[float] = None,
+    ):
+        self.progress_callback = progress_callback
+        self.progress = 0.0
+        self.deadline = deadline
+        self._cancel_event = threading.Event()
+
+    def deadline_reached(self) -> bool:
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def time_remaining(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def check_deadline(self) -> None:
+        """
+        Raises:
+            CalculationDeadlineExceededError: If the deadline has passed.
+        """
+        if self.deadline_reached():
+            raise CalculationDeadlineExceededError("Calculation deadline exceeded")
+
+    def cancel(self) -> None:
+        self._cancel_event.set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def update(self, completed: int, total: int) -> None:
+        """
+        Records that `completed` of `total` work units are done.
+
+        Raises:
+            CalculationCancelledError: If the calculation has been cancelled.
+        """
+        if self._cancel_event.is_set():
+            raise CalculationCancelledError("Calculation was cancelled")
+        self.progress = completed / total if total else 1.0
+        if self.progress_callback is not None:
+            self.progress_callback(self.progress)
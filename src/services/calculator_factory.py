@@ -1,13 +1,27 @@
 from typing import Optional
 
 from src.services.shapley_calculator_interface import ShapleyCalculator
+from src.services.calculation_checkpointer import CalculationCheckpointer
 from src.services.exact_shapley_calculator import ExactShapleyCalculator
 from src.services.approximate_shapley_calculator import ApproximateShapleyCalculator
 from src.services.configuration_value_airport_calculator import (
     ConfigurationValueAirportCalculator,
 )
+from src.services.configuration_value_sampling_calculator import (
+    ConfigurationValueSamplingCalculator,
+)
+from src.services.airport_semivalue_calculator import AirportSemivalueCalculator
+from src.services.airport_nucleolus_calculator import AirportNucleolusCalculator
+from src.services.tree_shapley_calculator import TreeShapleyCalculator
+from src.services.decomposition_shapley_calculator import DecompositionShapleyCalculator
+from src.services.congestion_airport_calculator import CongestionAirportCalculator
+
+from src.services.algorithm_selector import AlgorithmSelector
 
 from src.models.enums.algorithm_type import AlgorithmType
+from src.models.entities.algorithm_plan import AlgorithmPlan
+from src.models.entities.game_configuration import GameConfiguration
+from src.models.entities.semivalue_weighting import SemivalueWeighting
 
 
 class CalculatorFactory:
@@ -17,14 +31,57 @@ class CalculatorFactory:
 
     @staticmethod
     def create_calculator(
-        algorithm: AlgorithmType, num_samples: Optional[int] = None
+        algorithm: AlgorithmType,
+        num_samples: Optional[int] = None,
+        seed: Optional[int] = None,
+        checkpointer: Optional[CalculationCheckpointer] = None,
+        semivalue: Optional[SemivalueWeighting] = None,
+        sampling_mode: Optional[str] = None,
+        num_workers: Optional[int] = None,
     ) -> ShapleyCalculator:
         if algorithm == AlgorithmType.EXACT:
-            return ExactShapleyCalculator()
+            return ExactShapleyCalculator(checkpointer=checkpointer)
         elif algorithm == AlgorithmType.APPROXIMATE:
             samples = num_samples if num_samples is not None else 1000
-            return ApproximateShapleyCalculator(num_samples=samples)
+            return ApproximateShapleyCalculator(
+                num_samples=samples, seed=seed, checkpointer=checkpointer
+            )
         elif algorithm == AlgorithmType.CONFIGURATION_VALUE:
             return ConfigurationValueAirportCalculator()
+        elif algorithm == AlgorithmType.CONFIGURATION_VALUE_SAMPLING:
+            samples = num_samples if num_samples is not None else 1000
+            return ConfigurationValueSamplingCalculator(
+                num_samples=samples,
+                seed=seed,
+                mode=sampling_mode or "vectorised",
+                num_workers=num_workers or 4,
+            )
+        elif algorithm == AlgorithmType.AIRPORT_SHAPLEY:
+            return AirportSemivalueCalculator(SemivalueWeighting.shapley(), algorithm)
+        elif algorithm == AlgorithmType.BANZHAF:
+            return AirportSemivalueCalculator(SemivalueWeighting.banzhaf(), algorithm)
+        elif algorithm == AlgorithmType.SEMIVALUE:
+            return AirportSemivalueCalculator(
+                semivalue or SemivalueWeighting.shapley(), algorithm
+            )
+        elif algorithm == AlgorithmType.NUCLEOLUS:
+            return AirportNucleolusCalculator()
+        elif algorithm == AlgorithmType.TREE_SHAPLEY:
+            return TreeShapleyCalculator()
+        elif algorithm == AlgorithmType.DECOMPOSITION:
+            return DecompositionShapleyCalculator()
+        elif algorithm == AlgorithmType.CONGESTION_SHAPLEY:
+            return CongestionAirportCalculator()
+        elif algorithm == AlgorithmType.AUTO:
+            raise ValueError(
+                "AUTO must be resolved to a concrete algorithm with CalculatorFactory.plan first."
+            )
         else:
             raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    @staticmethod
+    def plan(config: GameConfiguration) -> AlgorithmPlan:
+        """
+        Chooses the algorithm for `config` (resolving AUTO) and predicts its runtime.
+        """
+        return AlgorithmSelector().plan(config)
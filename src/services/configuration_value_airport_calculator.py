@@ -1,7 +1,8 @@
 import time
-from typing import Dict
+from typing import Dict, Optional
 
 from src.services.shapley_calculator_interface import ShapleyCalculator
+from src.services.calculation_monitor import CalculationMonitor
 
 from src.models.enums.algorithm_type import AlgorithmType
 from src.models.entities.calculation_result import CalculationResult
@@ -15,7 +16,9 @@ class ConfigurationValueAirportCalculator(ShapleyCalculator):
     """
 
     def calculate(
-        self, game: AirportGameWithCoalitionConfiguration
+        self,
+        game: AirportGameWithCoalitionConfiguration,
+        monitor: Optional[CalculationMonitor] = None,
     ) -> CalculationResult:
         start = time.time()
 
@@ -43,6 +46,8 @@ class ConfigurationValueAirportCalculator(ShapleyCalculator):
 
         # For each threshold t, compute which airlines have any movement with type >= t
         for t in range(1, T + 1):
+            if monitor is not None:
+                monitor.update(t - 1, T)
             airlines_ge_t = 0
             for a, movement_ids in game.B_a.items():
                 count = 0
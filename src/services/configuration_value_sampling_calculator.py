@@ -0,0 +1,313 @@
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from src.services.shapley_calculator_interface import ShapleyCalculator
+from src.services.calculation_monitor import CalculationMonitor
+from src.services.marginal_contributions import MAX_BATCH_CELLS, prefix_worths
+
+from src.domain.cooperative_game import CooperativeGame
+
+from src.models.entities.player import Player
+from src.models.enums.algorithm_type import AlgorithmType
+from src.models.entities.calculation_result import CalculationResult
+
+
+class ConfigurationValueSamplingCalculator(ShapleyCalculator):
+    """
+    Estimates the configuration value of any game with an airline structure
+    (B_a: airline -> movements, B_i: movement -> airlines) by Monte Carlo sampling.
+
+    Each movement i is split into one copy (i, a) per airline a in B_i, and the copies
+    are grouped by airline. A sample is a two-level ordering: a uniformly random order
+    of the airlines, then a uniformly random order of each airline's copies. Walking
+    the copies in that order, copy (i, a) contributes v(S + i) - v(S), where S is the
+    set of movements whose copies came earlier (zero if i is already in S), and the
+    contribution is credited to movement i. The average over samples converges to
+    the configuration value; on airport games it reproduces the closed form of
+    Theorem 4.1 (ConfigurationValueAirportCalculator).
+
+    Modes:
+    - "sequential": evaluates coalitions one at a time (any game).
+    - "vectorised": evaluates all prefix coalitions of a block of samples with one
+      `evaluate_coalitions` call (games with `supports_batch_evaluation`).
+    - "parallel": splits the samples over `num_workers` processes, each running the
+      vectorised (or sequential) mode on an independent random stream. The game must
+      be picklable.
+
+    Sequential and vectorised runs with the same seed draw the same orderings.
+
+    If the monitor carries a deadline, sampling stops when it passes (after at least
+    MIN_ANYTIME_SAMPLES samples) or after `num_samples`, whichever comes first, and the
+    result reports the number of samples actually drawn.
+    """
+
+    MODES = ("sequential", "vectorised", "parallel")
+    PROGRESS_INTERVAL = 100
+
+    # Deadline runs draw at least this many samples, so that the estimate comes with
+    # a standard error.
+    MIN_ANYTIME_SAMPLES = 2
+
+    def __init__(
+        self,
+        num_samples: int = 1000,
+        seed: Optional[int] = None,
+        mode: str = "vectorised",
+        num_workers: int = 4,
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode {mode!r}; expected one of {self.MODES}")
+        self.num_samples = num_samples
+        self.seed = seed
+        self.mode = mode
+        self.num_workers = num_workers
+
+    def calculate(
+        self, game: CooperativeGame, monitor: Optional[CalculationMonitor] = None
+    ) -> CalculationResult:
+        start_time = time.time()
+        players = game.players
+        if not players:
+            raise ValueError("Game has no players")
+        unions = self._unions(game)
+        seed_sequence = np.random.SeedSequence(self.seed)
+        time_limit = monitor.time_remaining() if monitor is not None else None
+
+        if self.mode == "parallel" and self.num_workers > 1:
+            sums, squared_sums, m = self._run_parallel(
+                game, unions, seed_sequence, monitor, time_limit
+            )
+        else:
+            vectorised = self.mode != "sequential" and game.supports_batch_evaluation
+            sums, squared_sums, m = _sample_configuration_value(
+                game,
+                unions,
+                self.num_samples,
+                seed_sequence,
+                vectorised,
+                monitor,
+                self.PROGRESS_INTERVAL,
+                time_limit,
+                self.MIN_ANYTIME_SAMPLES,
+            )
+
+        shapley_values = {}
+        standard_errors = {}
+        for p, total, squared_total in zip(players, sums.tolist(), squared_sums.tolist()):
+            mean = total / m
+            variance = max(0.0, squared_total / m - mean**2)
+            shapley_values[p.id] = mean
+            if m > 1:
+                # Unbiased variance m / (m - 1) * variance, divided by m.
+                standard_errors[p.id] = math.sqrt(variance / (m - 1))
+
+        end_time = time.time()
+        return CalculationResult(
+            shapley_values=shapley_values,
+            total_cost=game.calculate_characteristic_function(players),
+            execution_time=end_time - start_time,
+            algorithm_used=AlgorithmType.CONFIGURATION_VALUE_SAMPLING,
+            is_exact=False,
+            standard_errors=standard_errors if m > 1 else None,
+            num_samples_used=m,
+        )
+
+    def _run_parallel(
+        self,
+        game: CooperativeGame,
+        unions: Dict[str, Set[str]],
+        seed_sequence: np.random.SeedSequence,
+        monitor: Optional[CalculationMonitor],
+        time_limit: Optional[float],
+    ) -> Tuple[np.ndarray, np.ndarray, int]:
+        workers = min(self.num_workers, self.num_samples)
+        shares = [
+            self.num_samples // workers + (1 if w < self.num_samples % workers else 0)
+            for w in range(workers)
+        ]
+        vectorised = game.supports_batch_evaluation
+
+        sums = np.zeros(len(game.players))
+        squared_sums = np.zeros(len(game.players))
+        done = 0
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Workers get the time left rather than the deadline: monotonic clocks are
+            # not comparable across processes. Each still draws at least one sample.
+            futures = [
+                executor.submit(
+                    _sample_configuration_value,
+                    game,
+                    unions,
+                    share,
+                    child,
+                    vectorised,
+                    None,
+                    self.PROGRESS_INTERVAL,
+                    time_limit,
+                    1,
+                )
+                for share, child in zip(shares, seed_sequence.spawn(workers))
+            ]
+            try:
+                for future in as_completed(futures):
+                    worker_sums, worker_squared_sums, worker_drawn = future.result()
+                    sums += worker_sums
+                    squared_sums += worker_squared_sums
+                    done += worker_drawn
+                    if monitor is not None:
+                        monitor.update(done, self.num_samples)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return sums, squared_sums, done
+
+    @staticmethod
+    def _unions(game: CooperativeGame) -> Dict[str, Set[str]]:
+        """
+        Returns B_a (airline -> movement ids), from the game if it defines one,
+        otherwise from the players' airlines.
+        """
+        unions = getattr(game, "B_a", None)
+        if unions:
+            return unions
+        unions = {}
+        for p in game.players:
+            if not p.airlines:
+                raise ValueError(
+                    f"Configuration value sampling requires Player.airlines; missing for {p.id}"
+                )
+            for a in p.airlines:
+                unions.setdefault(a, set()).add(p.id)
+        return unions
+
+
+def _sample_configuration_value(
+    game: CooperativeGame,
+    unions: Dict[str, Set[str]],
+    num_samples: int,
+    seed_sequence: np.random.SeedSequence,
+    vectorised: bool,
+    monitor: Optional[CalculationMonitor] = None,
+    progress_interval: int = 100,
+    time_limit: Optional[float] = None,
+    min_samples: int = 1,
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Draws up to `num_samples` two-level orderings and returns the per-movement sums
+    and squared sums of each sample's credited contributions, and the number of
+    samples drawn. With a `time_limit` (seconds), stops once it has passed and at
+    least `min_samples` were drawn. Module-level so that process pools can run it.
+    """
+    deadline = time.monotonic() + time_limit if time_limit is not None else None
+    players = game.players
+    n = len(players)
+    index = {p.id: i for i, p in enumerate(players)}
+
+    # Copies grouped by airline: copy_player[k] is the movement of copy k.
+    airlines = sorted(unions)
+    copy_airline: List[int] = []
+    copy_player: List[int] = []
+    for a, airline in enumerate(airlines):
+        for pid in sorted(unions[airline]):
+            copy_airline.append(a)
+            copy_player.append(index[pid])
+    copy_airline = np.array(copy_airline, dtype=np.int64)
+    copy_player = np.array(copy_player, dtype=np.int64)
+    num_copies = len(copy_player)
+
+    # Copies sorted by movement, to find each movement's earliest copy with reduceat.
+    by_player = np.argsort(copy_player, kind="stable")
+    player_starts = np.flatnonzero(np.r_[True, np.diff(copy_player[by_player]) != 0])
+    present = np.zeros(n, dtype=bool)
+    present[copy_player] = True
+    if not present.all():
+        missing = [players[i].id for i in np.flatnonzero(~present)]
+        raise ValueError(f"Movements without an airline: {missing}")
+
+    rng = np.random.default_rng(seed_sequence)
+    batch_size = max(1, min(progress_interval, MAX_BATCH_CELLS // max(1, num_copies * n)))
+
+    sums = np.zeros(n)
+    squared_sums = np.zeros(n)
+    drawn = 0
+    while drawn < num_samples:
+        if (
+            deadline is not None
+            and drawn >= min_samples
+            and time.monotonic() >= deadline
+        ):
+            break
+        if monitor is not None:
+            monitor.update(drawn, num_samples)
+        count = min(batch_size, num_samples - drawn)
+        if deadline is not None and drawn < min_samples:
+            # Reach the minimum first, so a deadline that has already passed costs
+            # only those samples.
+            count = min(count, min_samples - drawn)
+
+        # Two-level ordering: sort copies by (airline rank, random key within airline).
+        airline_rank = np.argsort(rng.random((count, len(airlines))), axis=1)
+        keys = airline_rank[:, copy_airline] + rng.random((count, num_copies))
+        orders = np.argsort(keys, axis=1)
+
+        if vectorised:
+            per_sample = _credit_batched(game, orders, copy_player, by_player, player_starts)
+        else:
+            per_sample = _credit_sequential(game, orders, copy_player)
+
+        sums += per_sample.sum(axis=0)
+        squared_sums += (per_sample * per_sample).sum(axis=0)
+        drawn += count
+
+    return sums, squared_sums, drawn
+
+
+def _credit_sequential(
+    game: CooperativeGame, orders: np.ndarray, copy_player: np.ndarray
+) -> np.ndarray:
+    players = game.players
+    per_sample = np.zeros((len(orders), len(players)))
+    for row, order in enumerate(orders):
+        coalition: List[Player] = []
+        seen = set()
+        current_cost = 0.0
+        for k in order:
+            i = int(copy_player[k])
+            if i in seen:
+                continue
+            seen.add(i)
+            coalition = coalition + [players[i]]
+            new_cost = game.calculate_characteristic_function(coalition)
+            per_sample[row, i] += new_cost - current_cost
+            current_cost = new_cost
+    return per_sample
+
+
+def _credit_batched(
+    game: CooperativeGame,
+    orders: np.ndarray,
+    copy_player: np.ndarray,
+    by_player: np.ndarray,
+    player_starts: np.ndarray,
+) -> np.ndarray:
+    count, num_copies = orders.shape
+    n = len(game.players)
+
+    # position[b, k] = step at which copy k arrives in sample b
+    position = np.empty_like(orders)
+    np.put_along_axis(position, orders, np.arange(num_copies)[None, :], axis=1)
+    # A movement joins the coalition with its earliest copy.
+    joins = np.minimum.reduceat(position[:, by_player], player_starts, axis=1)
+
+    worths = prefix_worths(game, joins, num_copies)
+    marginals = np.diff(worths, axis=1, prepend=0.0)
+
+    per_sample = np.zeros((count, n))
+    rows = np.repeat(np.arange(count), num_copies)
+    np.add.at(per_sample, (rows, copy_player[orders].ravel()), marginals.ravel())
+    return per_sample
@@ -0,0 +1,92 @@
+import time
+from typing import Optional
+
+import numpy as np
+
+from src.services.shapley_calculator_interface import ShapleyCalculator
+from src.services.calculation_monitor import CalculationMonitor
+
+from src.domain.congestion_airport_game import CongestionAirportGame
+
+from src.models.enums.algorithm_type import AlgorithmType
+from src.models.entities.calculation_result import CalculationResult
+from src.models.entities.array_calculation_result import ArrayCalculationResult
+
+
+class CongestionAirportCalculator(ShapleyCalculator):
+    """
+    Calculates the Shapley value of a CongestionAirportGame in O(N log N).
+
+    Split the runway into segments: with distinct requirements l_1 < ... < l_L,
+    segment k has length d_k = l_k - l_{k-1}, is used by the r_k players needing at
+    least l_k, and the other players have M_k movements in total. Writing
+    L(S) * M(S) as the sum over segments of d_k * M(S) * [S uses segment k], each
+    segment's maintenance game is a sum of two-player patterns with Shapley values:
+
+    - a user i of segment k pays rate * d_k * m_i for its own movements;
+    - a non-user j pays rate * d_k * m_j * r_k / (r_k + 1): its movements only cost
+      maintenance once some user is present, which happens before j in r_k of r_k + 1
+      relative orders;
+    - the remaining rate * d_k * m_j / (r_k + 1) is split equally among the users.
+
+    So player i at level K pays
+
+        slot_cost * m_i
+        + sum_{k <= K} [d_k / r_k + rate * d_k * M_k / (r_k (r_k + 1))]
+        + rate * m_i * l_K
+        + rate * m_i * sum_{k > K} d_k * r_k / (r_k + 1)
+
+    which one sort, a prefix sum and a suffix sum evaluate for all players.
+    """
+
+    def calculate(
+        self, game: CongestionAirportGame, monitor: Optional[CalculationMonitor] = None
+    ) -> CalculationResult:
+        return self.calculate_array(game, monitor).to_calculation_result()
+
+    def calculate_array(
+        self, game: CongestionAirportGame, monitor: Optional[CalculationMonitor] = None
+    ) -> ArrayCalculationResult:
+        start_time = time.time()
+        players = game.players
+        if not players:
+            raise ValueError("Game has no players")
+        if monitor is not None:
+            monitor.update(0, 1)
+
+        rate = game.maintenance_rate
+        costs = np.array([p.cost for p in players], dtype=float)
+        movements = np.array([game.movements_of(p) for p in players], dtype=float)
+
+        levels, inverse, counts = np.unique(costs, return_inverse=True, return_counts=True)
+        inverse = inverse.ravel()
+        deltas = np.diff(levels, prepend=0.0)
+        below = np.cumsum(counts) - counts
+        users = len(costs) - below
+        # Movements of players strictly below each level (the segment's non-users).
+        level_movements = np.bincount(inverse, weights=movements, minlength=len(levels))
+        outside = np.cumsum(level_movements) - level_movements
+
+        user_terms = deltas / users + rate * deltas * outside / (users * (users + 1.0))
+        through = np.cumsum(user_terms)
+        non_user_terms = deltas * users / (users + 1.0)
+        # sum over segments strictly above each level
+        above = np.cumsum(non_user_terms[::-1])[::-1] - non_user_terms
+
+        shares = (
+            game.slot_cost * movements
+            + through[inverse]
+            + rate * movements * (levels[inverse] + above[inverse])
+        )
+
+        if monitor is not None:
+            monitor.update(1, 1)
+        end_time = time.time()
+
+        return ArrayCalculationResult(
+            values=shares,
+            player_index=game.player_index,
+            total_cost=game.calculate_characteristic_function(players),
+            execution_time=end_time - start_time,
+            algorithm_used=AlgorithmType.CONGESTION_SHAPLEY,
+        )
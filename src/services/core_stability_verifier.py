@@ -0,0 +1,216 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.domain.cooperative_game import CooperativeGame
+from src.domain.airport_game import AirportGame
+from src.domain.airport_game_coalition import AirportGameWithCoalitionConfiguration
+from src.domain.congestion_airport_game import CongestionAirportGame
+from src.domain.tree_game import TreeGame
+
+from src.models.entities.core_stability_report import CoreStabilityReport
+
+
+class CoreStabilityVerifier:
+    """
+    Checks all 2^N - 1 core constraints x(S) <= c(S) of an airport-structured or tree
+    game without enumerating coalitions, and reports the most-violated coalition.
+
+    - Airport games (classic, code-sharing and congestion-aware): c(S) depends on the
+      highest "level" in S (runway cost in the classic game, aircraft type in the
+      code-sharing game) and, with congestion, on S's movements at a price per
+      movement that grows with that level. Among coalitions whose highest level is
+      L, x(S) - c(S) is largest for S = one member at level L (the one gaining the
+      most, unless one with a positive gain is already included) plus every player
+      at level L or below whose share exceeds the price of its movements. Sorting by
+      level covers every coalition in O(N log N).
+    - Tree games: an edge is paid once any member below it joins, so the best
+      coalition within each subtree follows from its children's, in one O(N) pass
+      from the leaves up.
+    """
+
+    def __init__(self, tolerance: float = 1e-9):
+        """
+        Args:
+            tolerance: Allowed rounding error, relative to the grand coalition's cost.
+        """
+        self.tolerance = tolerance
+
+    def verify(
+        self, game: CooperativeGame, allocation: Dict[str, float]
+    ) -> CoreStabilityReport:
+        """
+        Args:
+            game: An AirportGame, AirportGameWithCoalitionConfiguration,
+                CongestionAirportGame or TreeGame.
+            allocation: Player ID -> cost share (e.g. `CalculationResult.shapley_values`).
+
+        Raises:
+            ValueError: If the game is of another kind, or the allocation misses players.
+        """
+        players = game.players
+        ids = [p.id for p in players]
+        missing = [pid for pid in ids if pid not in allocation]
+        if missing:
+            raise ValueError(f"Allocation is missing player ids: {missing}")
+
+        shares = np.array([allocation[pid] for pid in ids], dtype=float)
+        if isinstance(game, TreeGame):
+            max_violation, members = self._most_violated_tree(game, shares)
+        else:
+            max_violation, members = self._most_violated_by_level(game, shares)
+        coalition = [ids[i] for i in sorted(members)]
+
+        total_cost = game.calculate_characteristic_function(players)
+        efficiency_gap = float(shares.sum() - total_cost)
+        tolerance = self.tolerance * max(1.0, abs(total_cost))
+        return CoreStabilityReport(
+            in_core=abs(efficiency_gap) <= tolerance and max_violation <= tolerance,
+            efficiency_gap=efficiency_gap,
+            max_violation=max_violation,
+            most_violated_coalition=coalition,
+        )
+
+    def _most_violated_by_level(
+        self, game: CooperativeGame, shares: np.ndarray
+    ) -> Tuple[float, List[int]]:
+        levels, level_costs, movements, rate, slot_cost = self._levels(game)
+
+        order = np.argsort(levels, kind="stable")
+        sorted_levels = levels[order]
+        sorted_shares = shares[order]
+        sorted_movements = movements[order]
+
+        # Tie groups of equal level: [starts[g], ends[g]) in sorted order.
+        group_starts = np.flatnonzero(np.r_[True, np.diff(sorted_levels) != 0])
+        group_ends = np.r_[group_starts[1:], len(order)]
+        num_groups = len(group_starts)
+        group_of = np.repeat(np.arange(num_groups), group_ends - group_starts)
+        group_costs = level_costs[order][group_starts]
+        # Price of a movement once a group's level is built (non-decreasing).
+        group_prices = rate * group_costs + slot_cost
+
+        # A player gains (share above the price of its movements) from its own group
+        # up to the last group whose price is below its share per movement.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            per_movement = np.where(
+                sorted_movements > 0,
+                sorted_shares / sorted_movements,
+                np.where(sorted_shares > 0, np.inf, -np.inf),
+            )
+        gain_ends = np.searchsorted(group_prices, per_movement, side="left")
+        gains = gain_ends > group_of
+
+        def through_group(values):
+            # Sum of `values` over the players gaining in each group.
+            added = np.bincount(group_of[gains], values[gains], minlength=num_groups + 1)
+            removed = np.bincount(gain_ends[gains], values[gains], minlength=num_groups + 1)
+            return np.cumsum(added - removed)[:num_groups]
+
+        gain_totals = (
+            through_group(sorted_shares) - group_prices * through_group(sorted_movements)
+        )
+        # Best single member of each group (needed if nobody in the group gains).
+        own_gains = sorted_shares - group_prices[group_of] * sorted_movements
+        group_best = np.maximum.reduceat(own_gains, group_starts)
+        group_has_gain = group_best > 0
+        best_totals = gain_totals + np.where(group_has_gain, 0.0, group_best)
+
+        excess = best_totals - group_costs
+        worst = int(np.argmax(excess))
+
+        end = group_ends[worst]
+        price = group_prices[worst]
+        members = np.flatnonzero(
+            sorted_shares[:end] - price * sorted_movements[:end] > 0
+        ).tolist()
+        if not group_has_gain[worst]:
+            start = group_starts[worst]
+            members.append(start + int(np.argmax(own_gains[start:end])))
+        return float(excess[worst]), [int(order[i]) for i in members]
+
+    @staticmethod
+    def _levels(game: CooperativeGame):
+        """
+        Returns each player's level, the cost of building up to that level, each
+        player's movements, and the maintenance rate and slot cost that price them.
+        """
+        n = len(game.players)
+        if isinstance(game, AirportGameWithCoalitionConfiguration):
+            types = np.array([p.type for p in game.players], dtype=np.int64)
+            return types, np.asarray(game.c, dtype=float)[types], np.zeros(n), 0.0, 0.0
+        if isinstance(game, AirportGame):
+            costs = np.array([p.cost for p in game.players], dtype=float)
+            return costs, costs, np.zeros(n), 0.0, 0.0
+        if isinstance(game, CongestionAirportGame):
+            costs = np.array([p.cost for p in game.players], dtype=float)
+            movements = np.array(
+                [game.movements_of(p) for p in game.players], dtype=float
+            )
+            return costs, costs, movements, game.maintenance_rate, game.slot_cost
+        raise ValueError(
+            f"Core verification is not supported for {type(game).__name__}; it needs "
+            "an airport-structured or tree game"
+        )
+
+    @staticmethod
+    def _most_violated_tree(game: TreeGame, shares: np.ndarray) -> Tuple[float, List[int]]:
+        """
+        best[v]: largest x(S) - (cost of S's edges below v) over coalitions S of
+        players at or below v, including the empty one; best_nonempty[v] the same
+        over non-empty S.
+        """
+        at_node: Dict[str, List[int]] = {}
+        for i, p in enumerate(game.players):
+            at_node.setdefault(p.node, []).append(i)
+        children: Dict[str, List[str]] = {}
+        for node in game.order[1:]:
+            children.setdefault(game.parent[node], []).append(node)
+
+        best: Dict[str, float] = {}
+        best_nonempty: Dict[str, float] = {}
+        # How best_nonempty[v] is reached when best[v] <= 0: a player at v or a child.
+        nonempty_choice: Dict[str, Tuple[str, object]] = {}
+        for node in reversed(game.order):
+            local = [shares[i] for i in at_node.get(node, [])]
+            below = [
+                (
+                    child,
+                    best[child] - game.edge_cost[child],
+                    best_nonempty[child] - game.edge_cost[child],
+                )
+                for child in children.get(node, [])
+            ]
+            best[node] = sum(s for s in local if s > 0) + sum(
+                gain for _, gain, _ in below if gain > 0
+            )
+            choice: Tuple[str, object] = ("none", None)
+            value = -np.inf
+            if local:
+                k = int(np.argmax(local))
+                choice, value = ("player", at_node[node][k]), local[k]
+            for child, _, gain in below:
+                if gain > value:
+                    choice, value = ("child", child), gain
+            best_nonempty[node] = best[node] if best[node] > 0 else value
+            nonempty_choice[node] = choice
+
+        members: List[int] = []
+        # (node, nonempty): collect the coalition attaining best / best_nonempty.
+        stack = [(game.root, True)]
+        while stack:
+            node, nonempty = stack.pop()
+            if not nonempty or best[node] > 0:
+                members.extend(i for i in at_node.get(node, []) if shares[i] > 0)
+                stack.extend(
+                    (child, False)
+                    for child in children.get(node, [])
+                    if best[child] - game.edge_cost[child] > 0
+                )
+                continue
+            kind, target = nonempty_choice[node]
+            if kind == "player":
+                members.append(target)
+            elif kind == "child":
+                stack.append((target, True))
+        return float(best_nonempty[game.root]), members
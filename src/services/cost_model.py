@@ -0,0 +1,130 @@
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models.enums.algorithm_type import AlgorithmType
+
+from src.infrastructure.configuration_loader import ConfigurationLoader
+
+
+class CostModel:
+    """
+    Predicts calculator runtimes from problem size.
+
+    Each algorithm's runtime is modelled as a linear combination of work terms
+    (e.g. N! * N^2 coalition evaluations for the exact calculator). The coefficients
+    are seconds per unit of work and are fitted from benchmark measurements
+    (see `tests/benchmark_performance.py --calibrate`).
+    """
+
+    # Fitted with tests/benchmark_performance.py on the reference development machine.
+    DEFAULT_COEFFICIENTS: Dict[str, List[float]] = {
+        AlgorithmType.EXACT.value: [2.4e-8],
+        AlgorithmType.APPROXIMATE.value: [4.5e-7, 4.2e-9],
+        AlgorithmType.CONFIGURATION_VALUE.value: [6.0e-7],
+        AlgorithmType.CONFIGURATION_VALUE_SAMPLING.value: [4.5e-7, 4.2e-9],
+        AlgorithmType.AIRPORT_SHAPLEY.value: [3.0e-8],
+        AlgorithmType.BANZHAF.value: [3.0e-8],
+        AlgorithmType.SEMIVALUE.value: [3.0e-8],
+        AlgorithmType.NUCLEOLUS.value: [3.0e-8, 1.0e-9],
+        AlgorithmType.TREE_SHAPLEY.value: [1.0e-6],
+        AlgorithmType.DECOMPOSITION.value: [1.2e-7],
+        AlgorithmType.CONGESTION_SHAPLEY.value: [4.0e-8],
+    }
+
+    # Closed-form airport semivalues: one sort of the player costs.
+    SEMIVALUE_ALGORITHMS = (
+        AlgorithmType.AIRPORT_SHAPLEY,
+        AlgorithmType.BANZHAF,
+        AlgorithmType.SEMIVALUE,
+        AlgorithmType.CONGESTION_SHAPLEY,
+    )
+
+    def __init__(self, coefficients: Optional[Dict[str, Sequence[float]]] = None):
+        self.coefficients: Dict[str, List[float]] = {
+            k: list(v) for k, v in self.DEFAULT_COEFFICIENTS.items()
+        }
+        if coefficients:
+            self.coefficients.update({k: list(v) for k, v in coefficients.items()})
+
+    @classmethod
+    def from_configuration(cls) -> "CostModel":
+        """
+        Uses coefficients from the "cost_model" entry of the loaded configuration, if any.
+        """
+        return cls(ConfigurationLoader().get_value("cost_model"))
+
+    @staticmethod
+    def work_terms(
+        algorithm: AlgorithmType,
+        num_players: int,
+        num_samples: Optional[int] = None,
+        num_types: Optional[int] = None,
+    ) -> List[float]:
+        """
+        Returns the work terms whose weighted sum gives the predicted runtime.
+        Terms may be +inf when the work is astronomically large.
+        """
+        n = num_players
+        if algorithm == AlgorithmType.EXACT:
+            # N! permutations, each building N coalitions of average size N/2.
+            log_work = math.lgamma(n + 1) + 2 * math.log(max(n, 1))
+            return [math.exp(log_work) if log_work < 700 else math.inf]
+        if algorithm in (
+            AlgorithmType.APPROXIMATE,
+            AlgorithmType.CONFIGURATION_VALUE_SAMPLING,
+        ):
+            m = num_samples if num_samples is not None else 1000
+            return [float(m * n), float(m * n * n)]
+        if algorithm == AlgorithmType.CONFIGURATION_VALUE:
+            return [float(n * (num_types or 1))]
+        if algorithm in CostModel.SEMIVALUE_ALGORITHMS:
+            return [n * math.log2(n + 1)]
+        if algorithm == AlgorithmType.DECOMPOSITION:
+            # One closed-form airport Shapley value per facility (typically a handful).
+            return [n * math.log2(n + 1)]
+        if algorithm == AlgorithmType.NUCLEOLUS:
+            # One sort, then O(N) per stage; N stages in the worst case.
+            return [n * math.log2(n + 1), float(n * n)]
+        if algorithm == AlgorithmType.TREE_SHAPLEY:
+            # Two passes over the tree; edges are bounded by the nodes players use.
+            return [float(n)]
+        raise ValueError(f"No cost model for algorithm: {algorithm}")
+
+    def predict(
+        self,
+        algorithm: AlgorithmType,
+        num_players: int,
+        num_samples: Optional[int] = None,
+        num_types: Optional[int] = None,
+    ) -> float:
+        terms = self.work_terms(algorithm, num_players, num_samples, num_types)
+        coefficients = self.coefficients[algorithm.value]
+        return sum(c * t for c, t in zip(coefficients, terms) if c != 0)
+
+    def fit(
+        self,
+        algorithm: AlgorithmType,
+        measurements: Sequence[Tuple[int, Optional[int], Optional[int], float]],
+    ) -> List[float]:
+        """
+        Fits the coefficients for one algorithm by non-negative least squares.
+
+        Args:
+            measurements: (num_players, num_samples, num_types, seconds) tuples.
+
+        Returns:
+            The fitted coefficients, which also replace the current ones.
+        """
+        X = np.array(
+            [self.work_terms(algorithm, n, m, t) for n, m, t, _ in measurements],
+            dtype=float,
+        )
+        y = np.array([seconds for *_, seconds in measurements], dtype=float)
+        # Weight by 1/y so that small and large runs count by relative error.
+        w = 1.0 / np.maximum(y, 1e-9)
+        coefficients, *_ = np.linalg.lstsq(X * w[:, None], y * w, rcond=None)
+        coefficients = np.clip(coefficients, 0.0, None).tolist()
+        self.coefficients[algorithm.value] = coefficients
+        return coefficients
@@ -0,0 +1,116 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.services.shapley_calculator_interface import ShapleyCalculator
+from src.services.calculation_monitor import CalculationMonitor
+from src.services.exact_shapley_calculator import ExactShapleyCalculator
+from src.services.airport_semivalue_calculator import AirportSemivalueCalculator
+from src.services.tree_shapley_calculator import TreeShapleyCalculator
+from src.services.congestion_airport_calculator import CongestionAirportCalculator
+
+from src.domain.cooperative_game import CooperativeGame
+from src.domain.composite_game import CompositeGame
+from src.domain.airport_game import AirportGame
+from src.domain.tree_game import TreeGame
+from src.domain.congestion_airport_game import CongestionAirportGame
+
+from src.models.enums.algorithm_type import AlgorithmType
+from src.models.entities.calculation_result import CalculationResult
+from src.models.entities.semivalue_weighting import SemivalueWeighting
+
+
+class DecompositionShapleyCalculator(ShapleyCalculator):
+    """
+    Calculates the Shapley value of a CompositeGame by additivity: each component
+    (facility) is solved with the fastest calculator for its structure, the
+    components run concurrently, and the shares are summed.
+
+    - Airport components use the closed-form O(N log N) airport Shapley value.
+    - Tree components use the O(N + E) tree allocation.
+    - Congestion-aware airport components use the O(N log N) closed form.
+    - Nested composite games are decomposed again.
+    - Any other component falls back to `fallback` (exact enumeration by default).
+
+    The per-component shares are kept in `CalculationResult.component_values`.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        fallback: Optional[ShapleyCalculator] = None,
+    ):
+        """
+        Args:
+            max_workers: Threads used to solve components concurrently
+                (default: one per component).
+            fallback: Calculator for components without a specialised one.
+        """
+        self.max_workers = max_workers
+        self.fallback = fallback or ExactShapleyCalculator()
+
+    def calculator_for(self, component: CooperativeGame) -> ShapleyCalculator:
+        if isinstance(component, AirportGame):
+            return AirportSemivalueCalculator(
+                SemivalueWeighting.shapley(), AlgorithmType.AIRPORT_SHAPLEY
+            )
+        if isinstance(component, TreeGame):
+            return TreeShapleyCalculator()
+        if isinstance(component, CongestionAirportGame):
+            return CongestionAirportCalculator()
+        if isinstance(component, CompositeGame):
+            return DecompositionShapleyCalculator(self.max_workers, self.fallback)
+        return self.fallback
+
+    def calculate(
+        self, game: CompositeGame, monitor: Optional[CalculationMonitor] = None
+    ) -> CalculationResult:
+        start_time = time.time()
+        players = game.players
+        if not players:
+            raise ValueError("Game has no players")
+        if not game.components:
+            raise ValueError("Composite game has no components")
+
+        components = game.components
+        # A component nobody uses costs nothing and charges nobody.
+        used = {name: c for name, c in components.items() if c.players}
+        results: Dict[str, CalculationResult] = {}
+        workers = self.max_workers or len(used)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {
+                executor.submit(self.calculator_for(component).calculate, component): name
+                for name, component in used.items()
+            }
+            try:
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    if monitor is not None:
+                        monitor.update(len(results), len(used))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        ids = [p.id for p in players]
+        totals = np.zeros(len(ids))
+        component_values: Dict[str, Dict[str, float]] = {}
+        # Sum in the game's component order so the result does not depend on timing.
+        # Players outside a component pay nothing for it.
+        for name in components:
+            values = results[name].shapley_values if name in results else {}
+            shares = [values.get(pid, 0.0) for pid in ids]
+            totals += shares
+            component_values[name] = dict(zip(ids, shares))
+
+        end_time = time.time()
+        return CalculationResult(
+            shapley_values=dict(zip(ids, totals.tolist())),
+            total_cost=sum(result.total_cost for result in results.values()),
+            execution_time=end_time - start_time,
+            algorithm_used=AlgorithmType.DECOMPOSITION,
+            is_exact=all(r.is_exact for r in results.values()),
+            component_values=component_values,
+        )
@@ -1,14 +1,24 @@
+import math
 import time
 import itertools
-from typing import List
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 from src.services.shapley_calculator_interface import ShapleyCalculator
+from src.services.calculation_monitor import CalculationMonitor
+from src.services.calculation_checkpointer import CalculationCheckpointer
+from src.services.marginal_contributions import (
+    max_orderings_per_batch,
+    permutation_marginals,
+)
 
 from src.domain.cooperative_game import CooperativeGame
 
 from src.models.entities.player import Player
 from src.models.enums.algorithm_type import AlgorithmType
 from src.models.entities.calculation_result import CalculationResult
+from src.models.entities.calculation_checkpoint import CalculationCheckpoint
 
 
 class ExactShapleyCalculator(ShapleyCalculator):
@@ -17,7 +27,19 @@ class ExactShapleyCalculator(ShapleyCalculator):
     Complexity is O(N!).
     """
 
-    def calculate(self, game: CooperativeGame) -> CalculationResult:
+    PROGRESS_INTERVAL = 1000
+
+    def __init__(self, checkpointer: Optional[CalculationCheckpointer] = None):
+        """
+        Args:
+            checkpointer: If given, the enumeration position and running sums are saved
+                periodically, and a matching checkpoint is resumed from on start.
+        """
+        self.checkpointer = checkpointer
+
+    def calculate(
+        self, game: CooperativeGame, monitor: Optional[CalculationMonitor] = None
+    ) -> CalculationResult:
         """
         Calculates exact Shapley values by iterating over all permutations of players.
 
@@ -37,43 +59,112 @@ class ExactShapleyCalculator(ShapleyCalculator):
 
         Use this calculator when the number of players is small (e.g., N <= 10), as the
         factorial complexity makes it infeasible for larger groups.
+
+        Games with `supports_batch_evaluation` have the prefix coalitions of each block
+        of permutations evaluated in a single vectorised call.
+
+        Raises CalculationDeadlineExceededError if the monitor's deadline passes first,
+        since a partial enumeration is not a meaningful estimate.
         """
         start_time = time.time()
         players = game.players
-        shapley_values = {player.id: 0.0 for player in players}
+        player_ids = [player.id for player in players]
+        sums = np.zeros(len(players))
+
+        # Iterate lazily: materialising N! permutations would exhaust memory long before time.
+        num_permutations = math.factorial(len(players))
+        orders = itertools.permutations(range(len(players)))
+        index = 0
+
+        checkpoint = (
+            self.checkpointer.load(AlgorithmType.EXACT, player_ids)
+            if self.checkpointer is not None
+            else None
+        )
+        if checkpoint is not None:
+            # permutations() has a fixed order, so skipping the processed prefix and
+            # continuing the sums reproduces the uninterrupted run exactly.
+            index = checkpoint.position
+            sums = np.array(checkpoint.sums, dtype=float)
+            orders = itertools.islice(orders, index, None)
+
+        while True:
+            chunk = list(itertools.islice(orders, self.PROGRESS_INTERVAL))
+            if not chunk:
+                break
+
+            if monitor is not None:
+                monitor.update(index, num_permutations)
+                monitor.check_deadline()
+            if self.checkpointer is not None:
+                self.checkpointer.maybe_save(
+                    lambda: CalculationCheckpoint(
+                        algorithm=AlgorithmType.EXACT,
+                        player_ids=player_ids,
+                        position=index,
+                        sums=sums.tolist(),
+                    )
+                )
+
+            if game.supports_batch_evaluation:
+                self._accumulate_batched(game, chunk, sums)
+            else:
+                self._accumulate(game, chunk, sums)
+            index += len(chunk)
+
+        # Average the marginal contributions
+        shapley_values = {
+            player_id: float(total / num_permutations)
+            for player_id, total in zip(player_ids, sums)
+        }
 
-        permutations = list(itertools.permutations(players))
-        num_permutations = len(permutations)
+        end_time = time.time()
+        total_cost = game.calculate_characteristic_function(players)
+
+        return CalculationResult(
+            shapley_values=shapley_values,
+            total_cost=total_cost,
+            execution_time=end_time - start_time,
+            algorithm_used=AlgorithmType.EXACT,
+        )
 
-        for perm in permutations:
+    @staticmethod
+    def _accumulate(
+        game: CooperativeGame, orders: List[Tuple[int, ...]], sums: np.ndarray
+    ) -> None:
+        """
+        Adds the marginal contributions along each ordering to `sums`, evaluating one
+        coalition at a time.
+        """
+        players = game.players
+        for order in orders:
             current_coalition: List[Player] = []
             current_cost = 0.0
 
-            for player in perm:
+            for i in order:
                 # Calculate marginal contribution
                 # cost(S U {i}) - cost(S)
                 # Here S is current_coalition
                 # We need to construct the new coalition to calculate its cost
 
-                new_coalition = current_coalition + [player]
+                new_coalition = current_coalition + [players[i]]
                 new_cost = game.calculate_characteristic_function(new_coalition)
-                marginal_contribution = new_cost - current_cost
-
-                shapley_values[player.id] += marginal_contribution
+                sums[i] += new_cost - current_cost
 
                 current_coalition = new_coalition
                 current_cost = new_cost
 
-        # Average the marginal contributions
-        for player_id in shapley_values:
-            shapley_values[player_id] /= num_permutations
-
-        end_time = time.time()
-        total_cost = game.calculate_characteristic_function(players)
-
-        return CalculationResult(
-            shapley_values=shapley_values,
-            total_cost=total_cost,
-            execution_time=end_time - start_time,
-            algorithm_used=AlgorithmType.EXACT,
-        )
+    @staticmethod
+    def _accumulate_batched(
+        game: CooperativeGame, orders: List[Tuple[int, ...]], sums: np.ndarray
+    ) -> None:
+        """
+        Same as `_accumulate`, but evaluates all prefix coalitions of a batch of
+        orderings with one `evaluate_coalitions` call.
+        """
+        batch_size = max_orderings_per_batch(len(game.players))
+        for start in range(0, len(orders), batch_size):
+            batch = np.array(orders[start : start + batch_size], dtype=np.int64)
+            marginals = permutation_marginals(game, batch)
+            # add.at applies the additions in order, matching the one-by-one sums.
+            np.add.at(sums, batch.ravel(), marginals.ravel())
@@ -0,0 +1,63 @@
+import numpy as np
+
+from src.domain.cooperative_game import CooperativeGame
+
+
+# Upper bound on membership cells (coalitions x N) evaluated in one batch call.
+MAX_BATCH_CELLS = 1 << 22
+
+
+def max_orderings_per_batch(num_players: int) -> int:
+    """
+    Returns how many orderings `permutation_marginals` should take at once: as many
+    as fit their N prefix coalitions within MAX_BATCH_CELLS (at least one; larger
+    orderings are evaluated in blocks of prefixes).
+    """
+    return max(1, MAX_BATCH_CELLS // max(1, num_players * num_players))
+
+
+def prefix_worths(game: CooperativeGame, joins: np.ndarray, num_steps: int) -> np.ndarray:
+    """
+    Evaluates the growing coalitions of several arrival sequences.
+
+    Args:
+        game: A game with `supports_batch_evaluation`.
+        joins: (P, N) array; joins[p, i] is the step at which player i joins in
+            sequence p.
+        num_steps: Number of steps per sequence.
+
+    Returns:
+        (P, num_steps) array whose entry [p, t] is the worth of the players with
+        joins[p] <= t. Coalitions are built in blocks of at most MAX_BATCH_CELLS
+        cells, so memory stays linear in N even when one sequence alone has more.
+    """
+    num_sequences, n = joins.shape
+    worths = np.empty(num_sequences * num_steps)
+    rows = max(1, MAX_BATCH_CELLS // max(1, n))
+    for start in range(0, len(worths), rows):
+        flat = np.arange(start, min(start + rows, len(worths)))
+        sequence, step = np.divmod(flat, num_steps)
+        membership = joins[sequence] <= step[:, None]
+        worths[start : start + len(flat)] = game.evaluate_coalitions(membership)
+    return worths.reshape(num_sequences, num_steps)
+
+
+def permutation_marginals(game: CooperativeGame, orders: np.ndarray) -> np.ndarray:
+    """
+    Computes marginal contributions along orderings with one batch evaluation.
+
+    Args:
+        game: A game with `supports_batch_evaluation`.
+        orders: (P, N) array; row p lists player indices in arrival order.
+
+    Returns:
+        (P, N) array where entry [p, k] is the marginal contribution of player
+        orders[p, k] when joining the players before it.
+    """
+    num_orders, n = orders.shape
+    # rank[p, i] = position of player i in ordering p
+    rank = np.empty_like(orders)
+    np.put_along_axis(rank, orders, np.arange(n)[None, :], axis=1)
+    # Prefix coalition k of ordering p contains the players ranked at most k.
+    worths = prefix_worths(game, rank, n)
+    return np.diff(worths, axis=1, prepend=0.0)
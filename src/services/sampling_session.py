@@ -0,0 +1,239 @@
+import math
+import time
+import random
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+from src.domain.cooperative_game import CooperativeGame
+
+from src.models.entities.player import Player
+from src.models.enums.algorithm_type import AlgorithmType
+from src.models.entities.calculation_result import CalculationResult
+from src.models.entities.sampling_session_state import SamplingSessionState
+from src.models.entities.calculation_checkpoint import CalculationCheckpoint
+
+from src.services.calculation_monitor import CalculationMonitor
+from src.services.calculation_checkpointer import CalculationCheckpointer
+from src.services.marginal_contributions import (
+    max_orderings_per_batch,
+    permutation_marginals,
+)
+
+
+class SamplingSession:
+    """
+    Accumulates Monte Carlo permutation samples for one game.
+
+    The session keeps running sums and squared sums of each player's marginal
+    contributions, the sample count and its RNG, so an estimate can be refined by
+    drawing only the additional samples. Sessions can be exported with `to_state`,
+    resumed with `from_state`, and combined with `merge` (e.g. sessions sampled on
+    other machines with different seeds).
+
+    A seeded session that is extended from m to m' samples gives exactly the
+    estimate of a fresh m'-sample run with the same seed.
+    """
+
+    PROGRESS_INTERVAL = 100
+
+    # Deadline runs draw at least this many samples in total, so that the estimate
+    # comes with a standard error.
+    MIN_ANYTIME_SAMPLES = 2
+
+    def __init__(
+        self,
+        game: CooperativeGame,
+        seed: Optional[int] = None,
+        game_key: Optional[str] = None,
+    ):
+        self.game = game
+        self.game_key = game_key
+        self.player_ids: List[str] = [p.id for p in game.players]
+        self.sums = np.zeros(len(self.player_ids))
+        self.squared_sums = np.zeros(len(self.player_ids))
+        self.num_samples = 0
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+
+    def add_samples(
+        self,
+        num_samples: int,
+        monitor: Optional[CalculationMonitor] = None,
+        checkpointer: Optional[CalculationCheckpointer] = None,
+    ) -> int:
+        """
+        Draws `num_samples` more permutations, or, if the monitor carries a deadline,
+        keeps drawing until it passes (at least one sample per call, and at least
+        MIN_ANYTIME_SAMPLES in the session).
+        With a checkpointer, the session state is saved periodically while drawing.
+
+        Returns:
+            The number of samples drawn by this call.
+        """
+        anytime = monitor is not None and monitor.deadline is not None
+        start_time = time.time()
+        n = len(self.player_ids)
+        batch_size = (
+            min(self.PROGRESS_INTERVAL, max_orderings_per_batch(n))
+            if self.game.supports_batch_evaluation
+            else 1
+        )
+
+        drawn = 0
+        while True:
+            if anytime:
+                if (
+                    drawn > 0
+                    and self.num_samples >= self.MIN_ANYTIME_SAMPLES
+                    and monitor.deadline_reached()
+                ):
+                    break
+            elif drawn >= num_samples:
+                break
+
+            if drawn % self.PROGRESS_INTERVAL == 0:
+                if checkpointer is not None:
+                    checkpointer.maybe_save(self.to_checkpoint)
+
+                if monitor is not None:
+                    if anytime:
+                        elapsed = time.time() - start_time
+                        monitor.update(
+                            int(elapsed * 1000),
+                            int((elapsed + monitor.time_remaining()) * 1000),
+                        )
+                    else:
+                        monitor.update(drawn, num_samples)
+
+            # Stop batches at progress boundaries so checkpoints and updates keep their cadence.
+            count = min(batch_size, self.PROGRESS_INTERVAL - drawn % self.PROGRESS_INTERVAL)
+            if not anytime:
+                count = min(count, num_samples - drawn)
+
+            # Generate random permutations (shuffling indices draws the same stream as players)
+            orders = []
+            for _ in range(count):
+                order = list(range(n))
+                self.rng.shuffle(order)
+                orders.append(order)
+
+            if self.game.supports_batch_evaluation:
+                self._accumulate_batched(np.array(orders, dtype=np.int64))
+            else:
+                self._accumulate(orders)
+
+            drawn += count
+            self.num_samples += count
+
+        return drawn
+
+    def _accumulate(self, orders: List[List[int]]) -> None:
+        players = self.game.players
+        for order in orders:
+            current_coalition: List[Player] = []
+            current_cost = 0.0
+
+            for i in order:
+                new_coalition = current_coalition + [players[i]]
+                new_cost = self.game.calculate_characteristic_function(new_coalition)
+                marginal_contribution = new_cost - current_cost
+
+                self.sums[i] += marginal_contribution
+                self.squared_sums[i] += marginal_contribution * marginal_contribution
+
+                current_coalition = new_coalition
+                current_cost = new_cost
+
+    def _accumulate_batched(self, orders: np.ndarray) -> None:
+        marginals = permutation_marginals(self.game, orders).ravel()
+        indices = orders.ravel()
+        # add.at applies the additions in order, matching the one-by-one sums.
+        np.add.at(self.sums, indices, marginals)
+        np.add.at(self.squared_sums, indices, marginals * marginals)
+
+    def estimate(
+        self,
+        execution_time: float = 0.0,
+        algorithm: AlgorithmType = AlgorithmType.APPROXIMATE,
+    ) -> CalculationResult:
+        """
+        Returns the current estimate with per-player standard errors (None with a
+        single sample, whose spread is unknown).
+        """
+        if self.num_samples == 0:
+            raise ValueError("The sampling session has no samples yet")
+
+        m = self.num_samples
+        shapley_values = {}
+        standard_errors = {}
+        for pid, total, squared_total in zip(
+            self.player_ids, self.sums.tolist(), self.squared_sums.tolist()
+        ):
+            mean = total / m
+            variance = max(0.0, squared_total / m - mean**2)
+            shapley_values[pid] = mean
+            if m > 1:
+                # Unbiased variance m / (m - 1) * variance, divided by m.
+                standard_errors[pid] = math.sqrt(variance / (m - 1))
+
+        return CalculationResult(
+            shapley_values=shapley_values,
+            total_cost=self.game.calculate_characteristic_function(self.game.players),
+            execution_time=execution_time,
+            algorithm_used=algorithm,
+            is_exact=False,
+            standard_errors=standard_errors if m > 1 else None,
+            num_samples_used=m,
+        )
+
+    def merge(self, other: "SamplingSession") -> None:
+        """
+        Adds another session's samples to this one. Both must sample the same game and
+        should use independent random streams (different seeds).
+        """
+        self.merge_state(other.to_state())
+
+    def merge_state(self, state: SamplingSessionState) -> None:
+        if state.game_key != self.game_key or state.player_ids != self.player_ids:
+            raise ValueError("Cannot merge sampling sessions of different games")
+        self.sums += np.array(state.sums, dtype=float)
+        self.squared_sums += np.array(state.squared_sums, dtype=float)
+        self.num_samples += state.num_samples
+
+    def to_state(self) -> SamplingSessionState:
+        version, internal_state, gauss_next = self.rng.getstate()
+        return SamplingSessionState(
+            game_key=self.game_key,
+            player_ids=self.player_ids,
+            sums=self.sums.tolist(),
+            squared_sums=self.squared_sums.tolist(),
+            num_samples=self.num_samples,
+            rng_state=[version, list(internal_state), gauss_next],
+        )
+
+    def to_checkpoint(self) -> CalculationCheckpoint:
+        return CalculationCheckpoint(
+            algorithm=AlgorithmType.APPROXIMATE,
+            player_ids=self.player_ids,
+            sampling=self.to_state(),
+        )
+
+    @classmethod
+    def from_state(
+        cls, game: CooperativeGame, state: SamplingSessionState
+    ) -> "SamplingSession":
+        """
+        Resumes a session for `game` from a snapshot taken with `to_state`.
+        """
+        session = cls(game, game_key=state.game_key)
+        if session.player_ids != state.player_ids:
+            raise ValueError("Sampling session state does not match the game's players")
+        session.sums = np.array(state.sums, dtype=float)
+        session.squared_sums = np.array(state.squared_sums, dtype=float)
+        session.num_samples = state.num_samples
+        if state.rng_state is not None:
+            version, internal_state, gauss_next = state.rng_state
+            session.rng.setstate((version, tuple(internal_state), gauss_next))
+        return session
@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from src.domain.cooperative_game import CooperativeGame
 
 from src.models.entities.calculation_result import CalculationResult
+from src.models.entities.array_calculation_result import ArrayCalculationResult
+
+from src.services.calculation_monitor import CalculationMonitor
 
 
 class ShapleyCalculator(ABC):
@@ -11,14 +15,31 @@ class ShapleyCalculator(ABC):
     """
 
     @abstractmethod
-    def calculate(self, game: CooperativeGame) -> CalculationResult:
+    def calculate(
+        self, game: CooperativeGame, monitor: Optional[CalculationMonitor] = None
+    ) -> CalculationResult:
         """
         Calculates the Shapley values for the given game.
 
         Args:
             game: The cooperative game instance.
+            monitor: Optional progress/cancellation handle. Long-running calculators
+                call `monitor.update` periodically.
 
         Returns:
             A CalculationResult object containing the Shapley values and metadata.
         """
         pass
+
+    def calculate_array(
+        self, game: CooperativeGame, monitor: Optional[CalculationMonitor] = None
+    ) -> ArrayCalculationResult:
+        """
+        Like `calculate`, but returns the values as one array over `game.player_index`.
+
+        The default packs the result of `calculate`; calculators that compute the
+        values as an array anyway override it to skip the per-player dict.
+        """
+        return ArrayCalculationResult.from_calculation_result(
+            self.calculate(game, monitor), game.player_index
+        )
@@ -0,0 +1,60 @@
+import time
+from typing import Dict, Optional
+
+from src.services.shapley_calculator_interface import ShapleyCalculator
+from src.services.calculation_monitor import CalculationMonitor
+
+from src.domain.tree_game import TreeGame
+
+from src.models.enums.algorithm_type import AlgorithmType
+from src.models.entities.calculation_result import CalculationResult
+
+
+class TreeShapleyCalculator(ShapleyCalculator):
+    """
+    Calculates the Shapley value of a standard tree game in O(N + E).
+
+    A tree game is the sum of one game per edge, in which the edge's cost is paid by
+    anyone whose node lies below it. By symmetry each of those games is shared equally
+    among its users, so a player pays, for every edge on its root path, the edge cost
+    divided by the number of players downstream of that edge.
+
+    One bottom-up pass over the tree counts the users below each edge, and one
+    top-down pass accumulates cost / users along each root path.
+    """
+
+    def calculate(
+        self, game: TreeGame, monitor: Optional[CalculationMonitor] = None
+    ) -> CalculationResult:
+        start_time = time.time()
+        players = game.players
+        if not players:
+            raise ValueError("Game has no players")
+
+        users: Dict[str, int] = {node: 0 for node in game.order}
+        for p in players:
+            users[p.node] += 1
+        for node in reversed(game.order):
+            if node in game.parent:
+                users[game.parent[node]] += users[node]
+
+        if monitor is not None:
+            monitor.update(len(game.order), 2 * len(game.order))
+
+        # share[node] = what one player at `node` pays for the path from the root.
+        share: Dict[str, float] = {}
+        for node in game.order:
+            if node in game.parent:
+                share[node] = share[game.parent[node]] + (
+                    game.edge_cost[node] / users[node] if users[node] else 0.0
+                )
+            else:
+                share[node] = 0.0
+
+        end_time = time.time()
+        return CalculationResult(
+            shapley_values={p.id: share[p.node] for p in players},
+            total_cost=game.calculate_characteristic_function(players),
+            execution_time=end_time - start_time,
+            algorithm_used=AlgorithmType.TREE_SHAPLEY,
+        )
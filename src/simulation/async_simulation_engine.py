@@ -0,0 +1,213 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from src.models.entities.game_configuration import GameConfiguration
+from src.models.entities.calculation_result import CalculationResult
+
+from src.services.calculation_monitor import CalculationMonitor
+
+from src.simulation.simulation_engine import SimulationEngine
+from src.simulation.job_manager import JobLimitExceededError
+
+from src.infrastructure.metrics_registry import MetricsRegistry
+
+
+class _Flight:
+    """
+    One computation shared by every request for the same configuration.
+    """
+
+    def __init__(self, task: "asyncio.Future[CalculationResult]", monitor: CalculationMonitor):
+        self.task = task
+        self.monitor = monitor
+        self.waiters = 0
+
+
+class AsyncSimulationEngine:
+    """
+    Asyncio front end for a SimulationEngine.
+
+    Calculations run on a managed thread pool, so the event loop is never blocked.
+
+    - Single flight: concurrent requests for an identical reproducible configuration
+      (see `SimulationEngine.reproducible_key`) share one computation and its result.
+      If every waiter is cancelled, the shared computation is cancelled too.
+    - Backpressure: at most `max_pending` calculations may be queued or running; further
+      requests wait for a slot, or fail with JobLimitExceededError after
+      `wait_timeout_seconds` if that is set.
+
+    Use from a single event loop.
+    """
+
+    def __init__(
+        self,
+        simulation_engine: Optional[SimulationEngine] = None,
+        max_workers: int = 4,
+        max_pending: int = 32,
+        wait_timeout_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            simulation_engine: Engine to run on (shares its caches and sessions).
+            max_workers: Threads executing calculations.
+            max_pending: Calculations allowed to be queued or running at once.
+            wait_timeout_seconds: How long a request may wait for a free slot before
+                being rejected; None waits indefinitely.
+        """
+        self.simulation_engine = simulation_engine or SimulationEngine()
+        self.max_pending = max_pending
+        self.wait_timeout_seconds = wait_timeout_seconds
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="AsyncSimulation"
+        )
+        self._slots = asyncio.Semaphore(max_pending)
+        self._flights: Dict[str, _Flight] = {}
+
+        metrics = MetricsRegistry()
+        self._pending = metrics.gauge(
+            "async_simulations_pending",
+            "Calculations queued or running on the async engine's executor.",
+        )
+        self._coalesced_total = metrics.counter(
+            "async_simulations_coalesced_total",
+            "Requests served by joining an identical calculation already in flight.",
+        )
+
+    async def run_simulation(
+        self,
+        config: GameConfiguration,
+        deadline_seconds: Optional[float] = None,
+    ) -> CalculationResult:
+        """
+        Async variant of `SimulationEngine.run_simulation`.
+        """
+        # Deadline runs depend on timing, so they are never shared.
+        key = (
+            self.simulation_engine.reproducible_key(config)
+            if deadline_seconds is None
+            else None
+        )
+        if key is None:
+            monitor = CalculationMonitor()
+            return await self._submit(
+                monitor, self.simulation_engine.run_simulation, config, monitor, deadline_seconds
+            )
+
+        flight = self._flights.get(key)
+        if flight is None:
+            monitor = CalculationMonitor()
+            task = asyncio.ensure_future(
+                self._submit(monitor, self.simulation_engine.run_simulation, config, monitor)
+            )
+            flight = _Flight(task, monitor)
+            self._flights[key] = flight
+            task.add_done_callback(functools.partial(self._land, key, flight))
+        else:
+            self._coalesced_total.inc()
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Unregister first, so a request arriving now starts a fresh flight
+                # instead of joining one that is being cancelled.
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                flight.monitor.cancel()
+                flight.task.cancel()
+            raise
+
+    async def run_batch(
+        self,
+        configs: Sequence[GameConfiguration],
+        return_exceptions: bool = False,
+    ) -> List[Union[CalculationResult, Exception]]:
+        """
+        Async variant of `SimulationEngine.run_batch` (one executor slot for the batch).
+        """
+        return await self._submit(
+            None, self.simulation_engine.run_batch, list(configs), return_exceptions
+        )
+
+    async def run_sweep(
+        self,
+        config: GameConfiguration,
+        grid: Dict[str, Sequence[Any]],
+        return_exceptions: bool = False,
+    ) -> List[Tuple[Dict[str, Any], Union[CalculationResult, Exception]]]:
+        """
+        Async variant of `SimulationEngine.run_sweep` (one executor slot for the sweep).
+        """
+        return await self._submit(
+            None, self.simulation_engine.run_sweep, config, grid, return_exceptions
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """Distinct shared calculations currently in flight."""
+        return len(self._flights)
+
+    def close(self) -> None:
+        """
+        Stops accepting work; calculations already submitted finish in the background.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self) -> "AsyncSimulationEngine":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    async def _submit(
+        self, monitor: Optional[CalculationMonitor], fn: Callable, *args
+    ) -> Any:
+        await self._acquire_slot()
+        loop = asyncio.get_running_loop()
+        self._pending.inc()
+        future = self._executor.submit(fn, *args)
+        # The slot is held until the thread is done, even if the awaiting task is cancelled.
+        future.add_done_callback(functools.partial(self._release_slot_threadsafe, loop))
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if monitor is not None:
+                monitor.cancel()
+            raise
+
+    async def _acquire_slot(self) -> None:
+        if self.wait_timeout_seconds is None:
+            await self._slots.acquire()
+            return
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.wait_timeout_seconds)
+        except asyncio.TimeoutError:
+            raise JobLimitExceededError(
+                f"All {self.max_pending} calculation slots are busy; retry later."
+            ) from None
+
+    def _release_slot_threadsafe(self, loop: asyncio.AbstractEventLoop, _future) -> None:
+        # Runs on the worker thread. Once the loop is closed there is nobody left to
+        # hand the slot back to.
+        if loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self._release_slot)
+        except RuntimeError:
+            # The loop closed between the check and the call.
+            pass
+
+    def _release_slot(self) -> None:
+        self._pending.dec()
+        self._slots.release()
+
+    def _land(self, key: str, flight: _Flight, task: asyncio.Future) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        # Retrieve the outcome so an error nobody awaited is not reported as unhandled.
+        if not task.cancelled():
+            task.exception()
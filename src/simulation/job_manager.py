@@ -0,0 +1,171 @@
+import uuid
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+from src.models.enums.job_status import JobStatus
+from src.models.entities.game_configuration import GameConfiguration
+from src.models.entities.calculation_result import CalculationResult
+
+from src.services.calculation_monitor import (
+    CalculationMonitor,
+    CalculationCancelledError,
+)
+
+from src.simulation.simulation_engine import SimulationEngine
+
+from src.infrastructure.metrics_registry import MetricsRegistry
+
+
+class JobLimitExceededError(Exception):
+    """
+    Raised when a job is rejected because a concurrency limit has been reached.
+    """
+
+
+class SimulationJob:
+    """
+    Handle to a simulation submitted to the JobManager.
+    """
+
+    def __init__(self, user_id: str, config: GameConfiguration):
+        self.job_id = uuid.uuid4().hex
+        self.user_id = user_id
+        self.config = config
+        self.monitor = CalculationMonitor()
+        self.future: Optional[Future] = None
+        self._started = threading.Event()
+
+    @property
+    def progress(self) -> float:
+        return self.monitor.progress
+
+    @property
+    def status(self) -> JobStatus:
+        if self.future is None or not self._started.is_set():
+            if self.future is not None and self.future.cancelled():
+                return JobStatus.CANCELLED
+            return JobStatus.QUEUED
+        if not self.future.done():
+            return JobStatus.RUNNING
+        error = self.future.exception()
+        if error is None:
+            return JobStatus.COMPLETED
+        if isinstance(error, CalculationCancelledError):
+            return JobStatus.CANCELLED
+        return JobStatus.FAILED
+
+    def result(self, timeout: Optional[float] = None) -> CalculationResult:
+        return self.future.result(timeout=timeout)
+
+    def cancel(self) -> None:
+        """
+        Cancels the job: a queued job never starts, a running one stops at its next progress update.
+        """
+        self.monitor.cancel()
+        if self.future is not None:
+            self.future.cancel()
+
+
+class JobManager:
+    """
+    Runs simulations on a bounded background executor.
+
+    At most `max_concurrent_jobs` simulations execute at once; up to `max_queued_jobs`
+    more may wait. Each user (e.g. a UI session) may have at most `max_jobs_per_user`
+    jobs queued or running, so one heavy user cannot starve everyone else.
+    """
+
+    def __init__(
+        self,
+        simulation_engine: SimulationEngine,
+        max_concurrent_jobs: int = 2,
+        max_jobs_per_user: int = 1,
+        max_queued_jobs: int = 16,
+    ):
+        self.simulation_engine = simulation_engine
+        self.max_concurrent_jobs = max_concurrent_jobs
+        self.max_jobs_per_user = max_jobs_per_user
+        self.max_queued_jobs = max_queued_jobs
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_jobs, thread_name_prefix="SimulationJob"
+        )
+        self._jobs: Dict[str, SimulationJob] = {}
+        self._active_per_user: Dict[str, int] = {}
+        self._queued = 0
+        self._lock = threading.Lock()
+
+        metrics = MetricsRegistry()
+        self._queue_depth = metrics.gauge(
+            "simulation_jobs_queued", "Background simulation jobs waiting for a worker."
+        )
+        self._running = metrics.gauge(
+            "simulation_jobs_running", "Background simulation jobs currently running."
+        )
+
+    def submit(self, user_id: str, config: GameConfiguration) -> SimulationJob:
+        """
+        Queues a simulation for background execution.
+
+        Raises:
+            JobLimitExceededError: If the user or the global queue is at its limit.
+        """
+        with self._lock:
+            if self._active_per_user.get(user_id, 0) >= self.max_jobs_per_user:
+                raise JobLimitExceededError(
+                    f"You already have {self.max_jobs_per_user} simulation(s) running. "
+                    "Wait for it to finish or cancel it."
+                )
+            if self._queued >= self.max_queued_jobs:
+                raise JobLimitExceededError(
+                    "The server is busy. Please try again in a moment."
+                )
+
+            job = SimulationJob(user_id, config)
+            self._jobs[job.job_id] = job
+            self._active_per_user[user_id] = self._active_per_user.get(user_id, 0) + 1
+            self._queued += 1
+            self._queue_depth.set(self._queued)
+
+        job.future = self._executor.submit(self._execute, job)
+        job.future.add_done_callback(lambda _: self._release(job))
+        return job
+
+    def get(self, job_id: str) -> Optional[SimulationJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> None:
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        for job in jobs:
+            job.cancel()
+        self._executor.shutdown(wait=True)
+
+    def _execute(self, job: SimulationJob) -> CalculationResult:
+        with self._lock:
+            self._queued -= 1
+            self._queue_depth.set(self._queued)
+        job._started.set()
+        self._running.inc()
+        try:
+            return self.simulation_engine.run_simulation(job.config, job.monitor)
+        finally:
+            self._running.dec()
+
+    def _release(self, job: SimulationJob) -> None:
+        with self._lock:
+            if not job._started.is_set():
+                # Cancelled before a worker picked it up.
+                self._queued -= 1
+                self._queue_depth.set(self._queued)
+            self._active_per_user[job.user_id] -= 1
+            if self._active_per_user[job.user_id] == 0:
+                del self._active_per_user[job.user_id]
+            self._jobs.pop(job.job_id, None)
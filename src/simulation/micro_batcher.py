@@ -0,0 +1,129 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+from src.models.entities.game_configuration import GameConfiguration
+from src.models.entities.calculation_result import CalculationResult
+
+from src.simulation.simulation_engine import SimulationEngine
+
+from src.infrastructure.metrics_registry import MetricsRegistry
+
+
+class MicroBatcherClosedError(RuntimeError):
+    """
+    Raised when a request is submitted to a MicroBatcher that has been shut down.
+    """
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-configuration requests into `SimulationEngine.run_batch`
+    calls, so that many small closed-form runs arriving together are solved with one
+    vectorised computation instead of one engine call each.
+
+    A dispatcher thread waits for a request, then collects more for up to
+    `max_delay_seconds` (or until `max_batch_size` are queued) and runs them as a
+    batch. Meant for cheap requests: a slow configuration delays everyone in its batch.
+    """
+
+    BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+    def __init__(
+        self,
+        simulation_engine: SimulationEngine,
+        max_batch_size: int = 64,
+        max_delay_seconds: float = 0.002,
+    ):
+        self.simulation_engine = simulation_engine
+        self.max_batch_size = max_batch_size
+        self.max_delay_seconds = max_delay_seconds
+        self._queue: "queue.Queue[Optional[Tuple[GameConfiguration, Future]]]" = queue.Queue()
+        # Guards _closed so that nothing is queued behind the shutdown sentinel.
+        self._lock = threading.Lock()
+        self._closed = False
+        self._batch_size = MetricsRegistry().histogram(
+            "simulation_micro_batch_size",
+            "Requests coalesced into one micro-batch.",
+            self.BATCH_SIZE_BUCKETS,
+        )
+
+        self._thread = threading.Thread(
+            target=self._dispatch_loop, name="MicroBatcher", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, config: GameConfiguration) -> Future:
+        """
+        Queues `config` for the next batch and returns a Future for its result.
+
+        Raises:
+            MicroBatcherClosedError: If the batcher has been shut down.
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise MicroBatcherClosedError("MicroBatcher has been shut down")
+            self._queue.put((config, future))
+        return future
+
+    def run(
+        self, config: GameConfiguration, timeout: Optional[float] = None
+    ) -> CalculationResult:
+        return self.submit(config).result(timeout=timeout)
+
+    def shutdown(self) -> None:
+        """
+        Stops the dispatcher after the requests already queued have been served.
+        Later calls to `submit` raise MicroBatcherClosedError.
+        """
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._queue.put(None)
+        self._thread.join()
+
+    def _dispatch_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stopping = False
+            deadline = time.monotonic() + self.max_delay_seconds
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._dispatch(batch)
+            if stopping:
+                return
+
+    def _dispatch(self, batch: List[Tuple[GameConfiguration, Future]]) -> None:
+        live = [(c, f) for c, f in batch if f.set_running_or_notify_cancel()]
+        if not live:
+            return
+        self._batch_size.observe(len(live))
+        try:
+            outcomes = self.simulation_engine.run_batch(
+                [c for c, _ in live], return_exceptions=True
+            )
+        except BaseException as e:
+            for _, future in live:
+                future.set_exception(e)
+            return
+        for (_, future), outcome in zip(live, outcomes):
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
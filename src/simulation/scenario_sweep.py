@@ -0,0 +1,37 @@
+import itertools
+from typing import Any, Dict, List, Sequence, Tuple
+
+from src.models.entities.game_configuration import GameConfiguration
+
+
+def expand_sweep(
+    config: GameConfiguration, grid: Dict[str, Sequence[Any]]
+) -> List[Tuple[Dict[str, Any], GameConfiguration]]:
+    """
+    Expands a parameter grid into one configuration per combination.
+
+    Args:
+        config: Base configuration shared by every scenario.
+        grid: GameConfiguration field -> values to try, e.g.
+            {"algorithm": ["exact", "approximate"], "seed": [0, 1, 2]}.
+
+    Returns:
+        (overrides, configuration) pairs in row-major order of the grid. Each
+        configuration is validated like one built from scratch.
+    """
+    unknown = sorted(set(grid) - set(GameConfiguration.model_fields))
+    if unknown:
+        raise ValueError(f"Unknown GameConfiguration fields in sweep grid: {unknown}")
+    empty = sorted(field for field, values in grid.items() if len(values) == 0)
+    if empty:
+        raise ValueError(f"Sweep grid fields without values: {empty}")
+
+    fields = list(grid)
+    base = config.model_dump()
+    scenarios = []
+    for combination in itertools.product(*(grid[f] for f in fields)):
+        overrides = dict(zip(fields, combination))
+        scenarios.append(
+            (overrides, GameConfiguration.model_validate({**base, **overrides}))
+        )
+    return scenarios
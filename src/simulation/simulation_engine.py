@@ -1,13 +1,59 @@
+import time
+import uuid
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
 from src.models.enums.algorithm_type import AlgorithmType
 from src.models.entities.game_configuration import GameConfiguration
 from src.models.entities.calculation_result import CalculationResult
+from src.models.entities.array_calculation_result import ArrayCalculationResult
+from src.models.entities.sampling_session_state import SamplingSessionState
+from src.models.entities.semivalue_weighting import SemivalueWeighting
+from src.models.entities.core_stability_report import CoreStabilityReport
 
 from src.domain.airport_game import AirportGame
 from src.domain.airport_game_coalition import AirportGameWithCoalitionConfiguration
+from src.domain.cooperative_game import CooperativeGame
+from src.domain.tree_game import TreeGame
+from src.domain.composite_game import CompositeGame
+from src.domain.congestion_airport_game import CongestionAirportGame
 
 from src.services.calculator_factory import CalculatorFactory
+from src.services.calculation_monitor import (
+    CalculationMonitor,
+    CalculationCancelledError,
+    CalculationDeadlineExceededError,
+)
+from src.services.cost_model import CostModel
+from src.services.core_stability_verifier import CoreStabilityVerifier
+from src.services.airport_semivalue_engine import AirportSemivalueEngine
+from src.services.approximate_shapley_calculator import ApproximateShapleyCalculator
+from src.services.sampling_session import SamplingSession
+from src.services.calculation_checkpointer import CalculationCheckpointer
+
+from src.simulation.scenario_sweep import expand_sweep
 
 from src.infrastructure.logger_service import LoggerService
+from src.infrastructure.metrics_registry import MetricsRegistry
+from src.infrastructure.checkpoint_store import CheckpointStore
+from src.infrastructure.result_cache import (
+    ResultCache,
+    compute_cache_key,
+    compute_game_key,
+    compute_run_key,
+)
+
+
+class ConfigurationValidationError(ValueError):
+    """
+    Raised when a GameConfiguration is missing inputs required by its algorithm.
+    `reason` is a short machine-readable code used as a metrics label.
+    """
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
 
 
 class SimulationEngine:
@@ -15,39 +61,695 @@ class SimulationEngine:
     Orchestrates the execution of game simulations.
     """
 
-    def __init__(self):
+    # Closed-form airport semivalues that run_batch solves together in one vectorised call.
+    BATCHED_ALGORITHMS = (
+        AlgorithmType.AIRPORT_SHAPLEY,
+        AlgorithmType.BANZHAF,
+        AlgorithmType.SEMIVALUE,
+    )
+
+    # Algorithms that work on any cooperative game, and so also on tree games.
+    TREE_GAME_ALGORITHMS = (
+        AlgorithmType.EXACT,
+        AlgorithmType.APPROXIMATE,
+        AlgorithmType.CONFIGURATION_VALUE_SAMPLING,
+        AlgorithmType.TREE_SHAPLEY,
+    )
+    # Algorithms that work on congestion-aware airport games.
+    CONGESTION_GAME_ALGORITHMS = (
+        AlgorithmType.EXACT,
+        AlgorithmType.APPROXIMATE,
+        AlgorithmType.CONFIGURATION_VALUE_SAMPLING,
+        AlgorithmType.CONGESTION_SHAPLEY,
+    )
+    # Algorithms that work on multi-facility (composite) games.
+    COMPOSITE_GAME_ALGORITHMS = (
+        AlgorithmType.EXACT,
+        AlgorithmType.APPROXIMATE,
+        AlgorithmType.CONFIGURATION_VALUE_SAMPLING,
+        AlgorithmType.DECOMPOSITION,
+    )
+
+    LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0, 300.0)
+    PLAYER_COUNT_BUCKETS = (2, 5, 10, 20, 50, 100, 500, 1000, 10000, 100000, 1000000)
+    DEFAULT_NUM_SAMPLES = 1000
+    # Least time a deadline run's sampling fallback gets after a failed exact attempt.
+    MIN_FALLBACK_SECONDS = 0.01
+
+    def __init__(
+        self,
+        result_cache: Optional[ResultCache] = None,
+        max_sampling_sessions: int = 32,
+        checkpoint_directory: Optional[str] = None,
+        checkpoint_interval_seconds: float = 60.0,
+    ):
+        """
+        Args:
+            result_cache: Cache used to serve repeated configurations. Defaults to an
+                in-memory LRU; pass a ResultCache with `disk_directory` for a persistent tier.
+            max_sampling_sessions: How many approximate-run sampling sessions to keep so
+                that a rerun with more samples only draws the additional ones.
+            checkpoint_directory: If given, exact and sampling runs periodically save
+                their partial state there, and a rerun of the same configuration
+                (e.g. after a restart) resumes from it with an identical result.
+            checkpoint_interval_seconds: Minimum time between checkpoint writes.
+        """
         self.logger = LoggerService().get_logger()
+        self.result_cache = result_cache if result_cache is not None else ResultCache()
+        self.max_sampling_sessions = max_sampling_sessions
+        self._sampling_sessions: "OrderedDict[Tuple[str, Optional[int]], SamplingSession]" = OrderedDict()
+        self._sessions_lock = threading.Lock()
+        self.checkpoint_store = (
+            CheckpointStore(checkpoint_directory) if checkpoint_directory else None
+        )
+        self.checkpoint_interval_seconds = checkpoint_interval_seconds
 
-    def run_simulation(self, config: GameConfiguration) -> CalculationResult:
+        metrics = MetricsRegistry()
+        self._runs_total = metrics.counter(
+            "simulation_runs_total",
+            "Completed simulation runs by algorithm.",
+            ["algorithm"],
+        )
+        self._errors_total = metrics.counter(
+            "simulation_errors_total",
+            "Failed simulation runs by failure reason.",
+            ["reason"],
+        )
+        self._duration_seconds = metrics.histogram(
+            "simulation_duration_seconds",
+            "Wall-clock latency of SimulationEngine.run_simulation.",
+            self.LATENCY_BUCKETS,
+            ["algorithm"],
+        )
+        self._player_count = metrics.histogram(
+            "simulation_players",
+            "Number of players per simulation request.",
+            self.PLAYER_COUNT_BUCKETS,
+            ["algorithm"],
+        )
+        self._in_flight = metrics.gauge(
+            "simulation_in_flight",
+            "Simulations currently executing.",
+        )
+
+    def run_simulation(
+        self,
+        config: GameConfiguration,
+        monitor: Optional[CalculationMonitor] = None,
+        deadline_seconds: Optional[float] = None,
+        as_array: bool = False,
+    ) -> Union[CalculationResult, ArrayCalculationResult]:
         """
         Runs a single simulation based on the provided configuration.
+
+        Args:
+            config: The game configuration.
+            monitor: Optional handle for progress reporting and cooperative cancellation.
+            deadline_seconds: Optional wall-clock budget. Sampling algorithms refine their
+                estimate until it expires; the exact algorithm either finishes in time or
+                falls back to a sampling estimate. `result.is_exact` and
+                `result.budget_used` record what happened.
+            as_array: Return an ArrayCalculationResult (values in `config.players`
+                order) instead of a dict per player. Closed-form calculators then never
+                build the dict, which matters for very large games. Such runs bypass the
+                result cache.
         """
+        if deadline_seconds is not None:
+            monitor = monitor or CalculationMonitor()
+            monitor.deadline = time.monotonic() + deadline_seconds
+            if config.algorithm == AlgorithmType.AUTO and not config.time_budget_seconds:
+                config = config.model_copy(
+                    update={"time_budget_seconds": deadline_seconds}
+                )
+
+        if config.algorithm == AlgorithmType.AUTO:
+            plan = CalculatorFactory.plan(config)
+            self.logger.info(
+                f"AUTO selected {plan.algorithm.value} "
+                f"(predicted {plan.predicted_seconds:.3f}s): {plan.reason}"
+            )
+            config = config.model_copy(
+                update={"algorithm": plan.algorithm, "num_samples": plan.num_samples}
+            )
+
+        algorithm = config.algorithm.value
+        run_id = uuid.uuid4().hex
+        self._player_count.observe(len(config.players), algorithm=algorithm)
+        self._in_flight.inc()
+        start = time.perf_counter()
+        try:
+            if as_array:
+                result = self._run(config, run_id, monitor, as_array=True)
+            else:
+                result = self._run_cached(config, run_id, monitor)
+        except ConfigurationValidationError as e:
+            self._errors_total.inc(reason=e.reason)
+            raise
+        except CalculationCancelledError:
+            self._errors_total.inc(reason="cancelled")
+            self.logger.info("Simulation cancelled.", extra={"run_id": run_id})
+            raise
+        except Exception:
+            self._errors_total.inc(reason="calculation_error")
+            raise
+        finally:
+            self._in_flight.dec()
+
+        elapsed = time.perf_counter() - start
+        self._runs_total.inc(algorithm=algorithm)
+        self._duration_seconds.observe(elapsed, algorithm=algorithm)
+        if deadline_seconds is not None:
+            result = result.model_copy(
+                update={"budget_used": elapsed / deadline_seconds}
+            )
+        return result
+
+    def _run_cached(
+        self,
+        config: GameConfiguration,
+        run_id: str,
+        monitor: Optional[CalculationMonitor],
+    ) -> CalculationResult:
+        cache_key = compute_cache_key(config)
+        if cache_key is not None:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(
+                    f"Serving simulation result from cache (key {cache_key[:12]}).",
+                    extra={"run_id": run_id, "algorithm": config.algorithm.value},
+                )
+                return cached
+
+        result = self._run(config, run_id, monitor)
+        # Deadline runs that ended as estimates depend on timing, not just the configuration.
+        if cache_key is not None and (result.is_exact or not self._has_deadline(monitor)):
+            self.result_cache.put(cache_key, result)
+        return result
+
+    def _run(
+        self,
+        config: GameConfiguration,
+        run_id: str,
+        monitor: Optional[CalculationMonitor],
+        as_array: bool = False,
+    ) -> Union[CalculationResult, ArrayCalculationResult]:
+        log_context = {
+            "run_id": run_id,
+            "algorithm": config.algorithm.value,
+            "num_players": len(config.players),
+        }
+        self.logger.info(
+            f"Starting simulation with {len(config.players)} players using {config.algorithm} algorithm.",
+            extra=log_context,
+        )
+
+        game = self._build_game(config)
+
+        checkpointer = self._create_checkpointer(config, monitor)
+        calculator = CalculatorFactory.create_calculator(
+            config.algorithm,
+            config.num_samples,
+            config.seed,
+            checkpointer,
+            self._semivalue_weighting(config),
+            config.sampling_mode,
+            config.num_workers,
+        )
+
+        if config.algorithm == AlgorithmType.EXACT and self._has_deadline(monitor):
+            result = self._run_exact_with_deadline(config, game, calculator, monitor)
+        elif config.algorithm == AlgorithmType.APPROXIMATE:
+            result = self._run_sampling(config, game, monitor, checkpointer)
+        elif as_array:
+            result = calculator.calculate_array(game, monitor)
+        else:
+            result = calculator.calculate(game, monitor)
+        if as_array and not isinstance(result, ArrayCalculationResult):
+            result = ArrayCalculationResult.from_calculation_result(result, game.player_index)
+
+        if checkpointer is not None:
+            checkpointer.clear()
 
         self.logger.info(
-            f"Starting simulation with {len(config.players)} players using {config.algorithm} algorithm."
+            f"Simulation completed in {result.execution_time:.4f} seconds.",
+            extra={**log_context, "timings": {"execution_time": result.execution_time}},
         )
+        return result
+
+    def run_batch(
+        self,
+        configs: Sequence[GameConfiguration],
+        return_exceptions: bool = False,
+    ) -> List[Union[CalculationResult, Exception]]:
+        """
+        Runs many configurations in one call, returning results in the same order.
+
+        Identical reproducible configurations are computed once. Closed-form airport
+        semivalue runs (AIRPORT_SHAPLEY, BANZHAF, SEMIVALUE) are grouped by weighting
+        and each group is solved with a single vectorised AirportSemivalueEngine call;
+        everything else goes through `run_simulation`.
 
-        if config.algorithm == AlgorithmType.CONFIGURATION_VALUE:
+        Args:
+            configs: The configurations to run.
+            return_exceptions: If True, a failed configuration yields its exception in
+                place of a result; otherwise the first failure is raised.
+        """
+        results: List[Union[CalculationResult, Exception, None]] = [None] * len(configs)
+        first_by_key: Dict[str, int] = {}
+        duplicates: Dict[int, int] = {}
+        groups: "OrderedDict[SemivalueWeighting, List[int]]" = OrderedDict()
+        keys: Dict[int, Optional[str]] = {}
+
+        for i, config in enumerate(configs):
+            key = self.reproducible_key(config)
+            if key is not None:
+                if key in first_by_key:
+                    duplicates[i] = first_by_key[key]
+                    continue
+                first_by_key[key] = i
+            keys[i] = key
+
+            if config.algorithm in self.BATCHED_ALGORITHMS:
+                groups.setdefault(self._semivalue_weighting(config), []).append(i)
+                continue
+            try:
+                results[i] = self.run_simulation(config)
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results[i] = e
+
+        for weighting, indices in groups.items():
+            outcomes = self._run_semivalue_batch(
+                [configs[i] for i in indices], [keys[i] for i in indices], weighting
+            )
+            for i, outcome in zip(indices, outcomes):
+                if isinstance(outcome, Exception) and not return_exceptions:
+                    raise outcome
+                results[i] = outcome
+
+        for i, first in duplicates.items():
+            results[i] = results[first]
+        return results
+
+    def run_sweep(
+        self,
+        config: GameConfiguration,
+        grid: Dict[str, Sequence[Any]],
+        return_exceptions: bool = False,
+    ) -> List[Tuple[Dict[str, Any], Union[CalculationResult, Exception]]]:
+        """
+        Runs `config` once per combination of the parameter grid (see `expand_sweep`)
+        as one batch, and returns (overrides, result) pairs.
+        """
+        scenarios = expand_sweep(config, grid)
+        results = self.run_batch([c for _, c in scenarios], return_exceptions)
+        return [(overrides, result) for (overrides, _), result in zip(scenarios, results)]
+
+    def _run_semivalue_batch(
+        self,
+        configs: List[GameConfiguration],
+        cache_keys: List[Optional[str]],
+        weighting: SemivalueWeighting,
+    ) -> List[Union[CalculationResult, Exception]]:
+        start = time.perf_counter()
+        outcomes: List[Union[CalculationResult, Exception, None]] = [None] * len(configs)
+        games: List[AirportGame] = []
+        positions: List[int] = []
+        for k, (config, key) in enumerate(zip(configs, cache_keys)):
+            self._player_count.observe(len(config.players), algorithm=config.algorithm.value)
+            cached = self.result_cache.get(key) if key is not None else None
+            if cached is not None:
+                self._runs_total.inc(algorithm=config.algorithm.value)
+                outcomes[k] = cached
+                continue
+            try:
+                games.append(self._build_game(config))
+                positions.append(k)
+            except ConfigurationValidationError as e:
+                self._errors_total.inc(reason=e.reason)
+                outcomes[k] = e
+
+        if games:
+            values = AirportSemivalueEngine().compute_batch(games, weighting)
+            # The games are solved together; each result records its share of the time.
+            elapsed = (time.perf_counter() - start) / len(games)
+            for k, game, shares in zip(positions, games, values):
+                algorithm = configs[k].algorithm
+                result = CalculationResult(
+                    shapley_values=shares,
+                    total_cost=game.calculate_characteristic_function(game.players),
+                    execution_time=elapsed,
+                    algorithm_used=algorithm,
+                )
+                if cache_keys[k] is not None:
+                    self.result_cache.put(cache_keys[k], result)
+                self._runs_total.inc(algorithm=algorithm.value)
+                self._duration_seconds.observe(elapsed, algorithm=algorithm.value)
+                outcomes[k] = result
+            self.logger.info(
+                f"Solved {len(games)} {weighting.name} runs in one vectorised batch "
+                f"({elapsed * len(games):.4f} seconds)."
+            )
+        return outcomes
+
+    @staticmethod
+    def reproducible_key(config: GameConfiguration) -> Optional[str]:
+        """
+        Returns a key shared by configurations that always produce the same result,
+        so identical requests may share one computation, or None if they must not
+        (unseeded sampling; AUTO, which may resolve to unseeded sampling).
+        """
+        if config.algorithm == AlgorithmType.AUTO:
+            return None
+        return compute_cache_key(config)
+
+    @staticmethod
+    def _semivalue_weighting(config: GameConfiguration) -> Optional[SemivalueWeighting]:
+        if config.algorithm == AlgorithmType.AIRPORT_SHAPLEY:
+            return SemivalueWeighting.shapley()
+        if config.algorithm == AlgorithmType.BANZHAF:
+            return SemivalueWeighting.banzhaf()
+        if config.algorithm == AlgorithmType.SEMIVALUE:
+            return SemivalueWeighting.beta_weighted(
+                config.semivalue_alpha or 1.0, config.semivalue_beta or 1.0
+            )
+        return None
+
+    def verify_core(
+        self, config: GameConfiguration, result: CalculationResult
+    ) -> CoreStabilityReport:
+        """
+        Checks whether `result`'s allocation lies in the core of the configured game,
+        and reports the most-violated coalition.
+        """
+        # Check against the game that was actually solved (AUTO resolves to one).
+        config = config.model_copy(update={"algorithm": result.algorithm_used})
+        return CoreStabilityVerifier().verify(
+            self._build_game(config), result.shapley_values
+        )
+
+    def _build_game(self, config: GameConfiguration) -> CooperativeGame:
+        # CONFIGURATION_VALUE_SAMPLING estimates the configuration value of any game:
+        # the code-sharing airport game when runway cost steps are given, otherwise
+        # the game the rest of the configuration describes.
+        if config.algorithm == AlgorithmType.CONFIGURATION_VALUE or (
+            config.algorithm == AlgorithmType.CONFIGURATION_VALUE_SAMPLING
+            and config.runway_cost_steps
+        ):
             self._validate_configuration_value_inputs(config)
 
-            game = AirportGameWithCoalitionConfiguration(
+            return AirportGameWithCoalitionConfiguration(
                 players=config.players,
                 runway_cost_steps=config.runway_cost_steps,
             )
-        else:
-            self._validate_classic_airport_inputs(config)
-            game = AirportGame(config.players)
+        if config.algorithm == AlgorithmType.CONFIGURATION_VALUE_SAMPLING:
+            self._validate_airline_inputs(config)
 
-        calculator = CalculatorFactory.create_calculator(
-            config.algorithm, config.num_samples
+        if config.facilities is not None or config.algorithm == AlgorithmType.DECOMPOSITION:
+            return self._build_composite_game(config)
+
+        if config.tree_edges is not None or config.algorithm == AlgorithmType.TREE_SHAPLEY:
+            return self._build_tree_game(config)
+
+        if (
+            config.maintenance_rate is not None
+            or config.slot_cost is not None
+            or config.algorithm == AlgorithmType.CONGESTION_SHAPLEY
+        ):
+            return self._build_congestion_game(config)
+
+        self._validate_classic_airport_inputs(config)
+        return AirportGame(config.players)
+
+    def _build_composite_game(self, config: GameConfiguration) -> CompositeGame:
+        """
+        Builds one airport game per facility over the players that use it, each with
+        its requirement for that facility as its cost.
+        """
+        if config.algorithm not in self.COMPOSITE_GAME_ALGORITHMS:
+            raise ConfigurationValidationError(
+                "unsupported_game",
+                f"{config.algorithm.value} does not support multi-facility games; use "
+                f"{[a.value for a in self.COMPOSITE_GAME_ALGORITHMS]}."
+            )
+        if not config.facilities:
+            raise ConfigurationValidationError(
+                "missing_facilities",
+                "DECOMPOSITION requires config.facilities."
+            )
+        self._validate_single_game_kind(config)
+
+        ids = {p.id for p in config.players}
+        components = {}
+        for facility in config.facilities:
+            if facility.name in components:
+                raise ConfigurationValidationError(
+                    "invalid_facility", f"Duplicate facility name: {facility.name!r}"
+                )
+            unknown = sorted(set(facility.player_costs) - ids)
+            if unknown:
+                raise ConfigurationValidationError(
+                    "invalid_facility",
+                    f"Facility {facility.name!r} lists unknown player ids: {unknown}"
+                )
+            negative = sorted(pid for pid, c in facility.player_costs.items() if c < 0)
+            if negative:
+                raise ConfigurationValidationError(
+                    "invalid_facility",
+                    f"Facility {facility.name!r} has negative costs for player ids: {negative}"
+                )
+            # Only the facility's users take part in its game: a zero requirement
+            # would be an invalid Player.cost, and non-users do not change the cost.
+            components[facility.name] = AirportGame(
+                [
+                    p.model_copy(update={"cost": facility.player_costs[p.id]})
+                    for p in config.players
+                    if facility.player_costs.get(p.id, 0.0) > 0
+                ]
+            )
+        return CompositeGame(config.players, components)
+
+    def _validate_single_game_kind(self, config: GameConfiguration) -> None:
+        """
+        Facilities, tree edges and congestion rates each select a different game.
+        """
+        kinds = [
+            name
+            for name, present in (
+                ("facilities", config.facilities is not None),
+                ("tree_edges", config.tree_edges is not None),
+                (
+                    "maintenance_rate/slot_cost",
+                    config.maintenance_rate is not None or config.slot_cost is not None,
+                ),
+            )
+            if present
+        ]
+        if len(kinds) > 1:
+            raise ConfigurationValidationError(
+                "unsupported_game", f"Configure only one of {kinds}."
+            )
+
+    def _build_congestion_game(self, config: GameConfiguration) -> CongestionAirportGame:
+        if config.algorithm not in self.CONGESTION_GAME_ALGORITHMS:
+            raise ConfigurationValidationError(
+                "unsupported_game",
+                f"{config.algorithm.value} does not support congestion-aware games; use "
+                f"{[a.value for a in self.CONGESTION_GAME_ALGORITHMS]}."
+            )
+        self._validate_classic_airport_inputs(config)
+        return CongestionAirportGame(
+            config.players,
+            maintenance_rate=config.maintenance_rate or 0.0,
+            slot_cost=config.slot_cost or 0.0,
         )
 
-        result = calculator.calculate(game)
+    def _build_tree_game(self, config: GameConfiguration) -> TreeGame:
+        if config.algorithm not in self.TREE_GAME_ALGORITHMS:
+            raise ConfigurationValidationError(
+                "unsupported_game",
+                f"{config.algorithm.value} needs an airport game; tree games support "
+                f"{[a.value for a in self.TREE_GAME_ALGORITHMS]}."
+            )
+        self._validate_single_game_kind(config)
+        if not config.tree_edges:
+            raise ConfigurationValidationError(
+                "missing_tree_edges",
+                "TREE_SHAPLEY requires config.tree_edges."
+            )
+        missing = [p.id for p in config.players if p.node is None]
+        if missing:
+            raise ConfigurationValidationError(
+                "missing_node",
+                f"Tree games require Player.node. Missing node for player ids: {missing}"
+            )
+        try:
+            return TreeGame(config.players, config.tree_edges)
+        except ValueError as e:
+            raise ConfigurationValidationError("invalid_tree", str(e)) from e
 
-        self.logger.info(
-            f"Simulation completed in {result.execution_time:.4f} seconds."
+    def _run_exact_with_deadline(
+        self,
+        config: GameConfiguration,
+        game: AirportGame,
+        calculator,
+        monitor: CalculationMonitor,
+    ) -> CalculationResult:
+        """
+        Runs the exact calculator if the cost model predicts it finishes before the
+        deadline, and falls back to an anytime sampling estimate otherwise (or if the
+        prediction turns out wrong).
+        """
+        fallback = ApproximateShapleyCalculator(seed=config.seed)
+
+        def run_fallback() -> CalculationResult:
+            # The exact attempt may have used up the budget; the estimate still gets a
+            # minimum slice so it rests on more than a handful of samples.
+            monitor.deadline = max(
+                monitor.deadline, time.monotonic() + self.MIN_FALLBACK_SECONDS
+            )
+            return fallback.calculate(game, monitor)
+
+        predicted = CostModel.from_configuration().predict(
+            AlgorithmType.EXACT, len(config.players)
         )
-        return result
+        if predicted > monitor.time_remaining():
+            self.logger.info(
+                f"Exact run predicted to take {predicted:.3f}s, more than the deadline allows; "
+                "returning a sampling estimate instead."
+            )
+            return run_fallback()
+
+        try:
+            return calculator.calculate(game, monitor)
+        except CalculationDeadlineExceededError:
+            self.logger.info(
+                "Exact run hit the deadline; returning a sampling estimate instead."
+            )
+            return run_fallback()
+
+    def _run_sampling(
+        self,
+        config: GameConfiguration,
+        game: AirportGame,
+        monitor: Optional[CalculationMonitor],
+        checkpointer: Optional[CalculationCheckpointer] = None,
+    ) -> CalculationResult:
+        """
+        Runs the approximate calculator incrementally: samples already drawn for the
+        same game (and seed) are reused, and only the missing ones are drawn.
+
+        A seeded session that already holds more samples than requested cannot
+        reproduce the smaller run, so a fresh session is started instead; unseeded
+        runs simply reuse the larger estimate.
+        """
+        start_time = time.time()
+        requested = config.num_samples or self.DEFAULT_NUM_SAMPLES
+        key = (compute_game_key(config), config.seed)
+
+        with self._sessions_lock:
+            session = self._sampling_sessions.get(key)
+            if session is None or (
+                config.seed is not None and session.num_samples > requested
+            ):
+                session = self._new_sampling_session(config, game, key[0], checkpointer)
+            self._store_session(key, session)
+
+        with session.lock:
+            reused = session.num_samples
+            session.add_samples(
+                max(0, requested - session.num_samples), monitor, checkpointer
+            )
+            if reused:
+                self.logger.info(
+                    f"Extended sampling session from {reused} to {session.num_samples} samples."
+                )
+            return session.estimate(time.time() - start_time)
+
+    def _new_sampling_session(
+        self,
+        config: GameConfiguration,
+        game: AirportGame,
+        game_key: str,
+        checkpointer: Optional[CalculationCheckpointer],
+    ) -> SamplingSession:
+        checkpoint = (
+            checkpointer.load(AlgorithmType.APPROXIMATE, [p.id for p in game.players])
+            if checkpointer is not None
+            else None
+        )
+        if checkpoint is not None and checkpoint.sampling is not None:
+            self.logger.info(
+                f"Resuming sampling from checkpoint at {checkpoint.sampling.num_samples} samples."
+            )
+            return SamplingSession.from_state(game, checkpoint.sampling)
+        return SamplingSession(game, seed=config.seed, game_key=game_key)
+
+    def _create_checkpointer(
+        self, config: GameConfiguration, monitor: Optional[CalculationMonitor]
+    ) -> Optional[CalculationCheckpointer]:
+        # Deadline runs depend on timing, so resuming them could not reproduce anything.
+        if self.checkpoint_store is None or self._has_deadline(monitor):
+            return None
+        if config.algorithm not in (AlgorithmType.EXACT, AlgorithmType.APPROXIMATE):
+            return None
+        return CalculationCheckpointer(
+            self.checkpoint_store,
+            compute_run_key(config),
+            self.checkpoint_interval_seconds,
+        )
+
+    def export_sampling_session(
+        self, config: GameConfiguration
+    ) -> Optional[SamplingSessionState]:
+        """
+        Returns a serializable snapshot of the sampling session kept for `config`,
+        or None if no approximate run of that game (and seed) has been made.
+        """
+        with self._sessions_lock:
+            session = self._sampling_sessions.get(
+                (compute_game_key(config), config.seed)
+            )
+        if session is None:
+            return None
+        with session.lock:
+            return session.to_state()
+
+    def merge_sampling_session(
+        self, config: GameConfiguration, state: SamplingSessionState
+    ) -> None:
+        """
+        Adds samples drawn elsewhere (e.g. exported from another engine) to the
+        session for `config`. Only unseeded configurations accept merges, because a
+        merged seeded session would no longer match a fresh run with that seed.
+        """
+        if config.seed is not None:
+            raise ValueError("Sampling sessions can only be merged into unseeded runs")
+        game_key = compute_game_key(config)
+        key = (game_key, None)
+        with self._sessions_lock:
+            session = self._sampling_sessions.get(key)
+            if session is None:
+                session = SamplingSession(self._build_game(config), game_key=game_key)
+            self._store_session(key, session)
+        with session.lock:
+            session.merge_state(state)
+
+    def _store_session(
+        self, key: Tuple[str, Optional[int]], session: SamplingSession
+    ) -> None:
+        # Caller holds self._sessions_lock.
+        if self.max_sampling_sessions <= 0:
+            return
+        self._sampling_sessions[key] = session
+        self._sampling_sessions.move_to_end(key)
+        while len(self._sampling_sessions) > self.max_sampling_sessions:
+            self._sampling_sessions.popitem(last=False)
+
+    @staticmethod
+    def _has_deadline(monitor: Optional[CalculationMonitor]) -> bool:
+        return monitor is not None and monitor.deadline is not None
 
     def _validate_classic_airport_inputs(self, config: GameConfiguration) -> None:
         """
@@ -56,10 +758,27 @@ class SimulationEngine:
 
         missing = [p.id for p in config.players if getattr(p, "cost", None) is None]
         if missing:
-            raise ValueError(
+            raise ConfigurationValidationError(
+                "missing_cost",
                 f"Classic AirportGame requires Player.cost. Missing cost for player ids: {missing}"
             )
 
+    def _validate_airline_inputs(self, config: GameConfiguration) -> None:
+        """
+        Validates the airline structure the configuration value is defined over.
+        """
+
+        missing_airlines = [
+            p.id
+            for p in config.players
+            if not getattr(p, "airlines", None) or len(getattr(p, "airlines", [])) == 0
+        ]
+        if missing_airlines:
+            raise ConfigurationValidationError(
+                "missing_airlines",
+                f"{config.algorithm.value} requires Player.airlines (code-sharing sets). Missing for player ids: {missing_airlines}"
+            )
+
     def _validate_configuration_value_inputs(self, config: GameConfiguration) -> None:
         """
         Validates the inputs for the configuration value algorithm.
@@ -67,7 +786,8 @@ class SimulationEngine:
         """
 
         if not getattr(config, "runway_cost_steps", None):
-            raise ValueError(
+            raise ConfigurationValidationError(
+                "missing_runway_cost_steps",
                 "CONFIGURATION_VALUE requires config.runway_cost_steps = [c1..cT]."
             )
 
@@ -75,23 +795,17 @@ class SimulationEngine:
             p.id for p in config.players if getattr(p, "type", None) is None
         ]
         if missing_type:
-            raise ValueError(
+            raise ConfigurationValidationError(
+                "missing_type",
                 f"CONFIGURATION_VALUE requires Player.type (τ(i)). Missing for player ids: {missing_type}"
             )
 
-        missing_airlines = [
-            p.id
-            for p in config.players
-            if not getattr(p, "airlines", None) or len(getattr(p, "airlines", [])) == 0
-        ]
-        if missing_airlines:
-            raise ValueError(
-                f"CONFIGURATION_VALUE requires Player.airlines (code-sharing sets). Missing for player ids: {missing_airlines}"
-            )
+        self._validate_airline_inputs(config)
 
         max_type = max(getattr(p, "type") for p in config.players)
         if len(config.runway_cost_steps) < max_type:
-            raise ValueError(
+            raise ConfigurationValidationError(
+                "insufficient_runway_cost_steps",
                 f"runway_cost_steps has length {len(config.runway_cost_steps)} "
                 f"but max Player.type is {max_type}. Need at least {max_type} entries."
             )
@@ -0,0 +1,344 @@
+import socket
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from src.models.entities.game_configuration import GameConfiguration
+from src.models.entities.calculation_result import CalculationResult
+
+from src.simulation.simulation_engine import ConfigurationValidationError
+from src.simulation.scenario_sweep import expand_sweep
+
+from src.infrastructure.frame_protocol import send_frame, recv_frame
+from src.infrastructure.logger_service import LoggerService
+from src.infrastructure.metrics_registry import MetricsRegistry
+
+
+class RemoteCalculationError(Exception):
+    """
+    A configuration failed on a worker, or could not be run because its task was
+    lost too often. `reason` is a short machine-readable code.
+    """
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+def encode_outcome(outcome: Union[CalculationResult, Exception]) -> Dict[str, Any]:
+    """
+    Serializes a run_batch outcome for the wire.
+    """
+    if isinstance(outcome, CalculationResult):
+        return {"result": outcome.model_dump(mode="json")}
+    if isinstance(outcome, ConfigurationValidationError):
+        return {"error": outcome.reason, "message": str(outcome), "invalid_configuration": True}
+    return {"error": getattr(outcome, "reason", "calculation_error"), "message": str(outcome)}
+
+
+def decode_outcome(payload: Dict[str, Any]) -> Union[CalculationResult, Exception]:
+    if "result" in payload:
+        return CalculationResult.model_validate(payload["result"])
+    if payload.get("invalid_configuration"):
+        return ConfigurationValidationError(payload["error"], payload["message"])
+    return RemoteCalculationError(payload["error"], payload["message"])
+
+
+class _Task:
+    def __init__(self, task_id: str, indices: List[int], configurations: List[dict]):
+        self.task_id = task_id
+        self.indices = indices
+        self.configurations = configurations
+        self.losses = 0
+        # Workers currently running this task (more than one once it has been stolen).
+        self.running: Dict[str, float] = {}
+        self.done = False
+
+
+class SweepCoordinator:
+    """
+    Distributes SimulationEngine batch work over TCP to SweepWorker processes,
+    typically on other hosts.
+
+    A batch is split into tasks of `task_size` configurations. Workers pull one task
+    at a time and run it with `SimulationEngine.run_batch`, so fast workers simply take
+    more tasks. Once the queue is empty, an idle worker steals the task that has been
+    running longest elsewhere (for at least `steal_after_seconds`) and runs a copy;
+    whichever copy finishes first wins, so a slow or stuck host cannot hold up the batch.
+    If a worker disconnects, its unfinished tasks are queued again; a task lost more
+    than `max_retries` times fails with RemoteCalculationError("worker_lost").
+
+    Protocol (length-prefixed JSON frames, see frame_protocol):
+        worker -> {"type": "hello", "worker_id"}
+        worker -> {"type": "request"}
+        coordinator -> {"type": "task", "task_id", "configurations"} | {"type": "wait"}
+                       | {"type": "shutdown"}
+        worker -> {"type": "result", "task_id", "outcomes"}
+
+    One batch runs at a time; workers stay connected between batches.
+    """
+
+    POLL_SECONDS = 0.5
+
+    def __init__(
+        self,
+        port: int = 7700,
+        host: str = "127.0.0.1",
+        task_size: int = 8,
+        max_retries: int = 3,
+        steal_after_seconds: float = 2.0,
+    ):
+        """
+        Args:
+            port: Port workers connect to; 0 picks a free port (see `port` after `start`).
+            host: Interface to listen on; use "0.0.0.0" for workers on other hosts.
+            task_size: Configurations per task.
+            max_retries: Times a task may be re-queued after its worker was lost.
+            steal_after_seconds: How long a task must have run before an idle worker
+                may start a duplicate of it.
+        """
+        self.host = host
+        self.port = port
+        self.task_size = task_size
+        self.max_retries = max_retries
+        self.steal_after_seconds = steal_after_seconds
+        self.logger = LoggerService().get_logger()
+
+        self._condition = threading.Condition()
+        self._batch_lock = threading.Lock()
+        self._pending: Deque[_Task] = deque()
+        self._tasks: Dict[str, _Task] = {}
+        self._outcomes: List[Optional[Union[CalculationResult, Exception]]] = []
+        self._remaining = 0
+        self._workers: Dict[str, Set[str]] = {}
+        self._listener: Optional[socket.socket] = None
+        self._stopping = False
+
+        metrics = MetricsRegistry()
+        self._tasks_total = metrics.counter(
+            "distributed_tasks_total",
+            "Distributed sweep task events (assigned, stolen, requeued, completed, failed).",
+            ["event"],
+        )
+        self._workers_connected = metrics.gauge(
+            "distributed_workers_connected", "Sweep workers connected to the coordinator."
+        )
+
+    @property
+    def num_workers(self) -> int:
+        with self._condition:
+            return len(self._workers)
+
+    def start(self) -> None:
+        if self._listener is not None:
+            return
+        self._stopping = False
+        self._listener = socket.create_server((self.host, self.port))
+        self.port = self._listener.getsockname()[1]
+        threading.Thread(
+            target=self._accept_loop, name="SweepCoordinator", daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        """
+        Tells connected workers to shut down and stops listening.
+        """
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+
+    def wait_for_workers(self, count: int, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until at least `count` workers are connected; False on timeout.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: len(self._workers) >= count, timeout)
+
+    def run_batch(
+        self,
+        configs: Sequence[GameConfiguration],
+        timeout: Optional[float] = None,
+    ) -> List[Union[CalculationResult, Exception]]:
+        """
+        Runs `configs` on the connected workers and returns the outcomes in order: a
+        CalculationResult, or the exception for a configuration that failed.
+
+        Raises:
+            TimeoutError: If the batch does not finish within `timeout` seconds.
+        """
+        with self._batch_lock:
+            with self._condition:
+                self._outcomes = [None] * len(configs)
+                self._remaining = 0
+                for start in range(0, len(configs), self.task_size):
+                    indices = list(range(start, min(start + self.task_size, len(configs))))
+                    task = _Task(
+                        uuid.uuid4().hex,
+                        indices,
+                        [configs[i].model_dump(mode="json") for i in indices],
+                    )
+                    self._tasks[task.task_id] = task
+                    self._pending.append(task)
+                    self._remaining += 1
+                self._condition.notify_all()
+                self.logger.info(
+                    f"Distributing {len(configs)} configurations as {self._remaining} tasks "
+                    f"over {len(self._workers)} workers."
+                )
+
+                finished = self._condition.wait_for(lambda: self._remaining == 0, timeout)
+                outcomes = self._outcomes
+                self._pending.clear()
+                self._tasks.clear()
+                if not finished:
+                    raise TimeoutError(
+                        f"Distributed batch did not finish within {timeout} seconds"
+                    )
+            return outcomes
+
+    def run_sweep(
+        self,
+        config: GameConfiguration,
+        grid: Dict[str, Sequence[Any]],
+        timeout: Optional[float] = None,
+    ) -> List[Tuple[Dict[str, Any], Union[CalculationResult, Exception]]]:
+        """
+        Distributed variant of `SimulationEngine.run_sweep`.
+        """
+        scenarios = expand_sweep(config, grid)
+        outcomes = self.run_batch([c for _, c in scenarios], timeout)
+        return [(overrides, outcome) for (overrides, _), outcome in zip(scenarios, outcomes)]
+
+    def _accept_loop(self) -> None:
+        listener = self._listener
+        while True:
+            try:
+                connection, _ = listener.accept()
+            except OSError:
+                return  # listener closed by stop()
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(
+                target=self._serve_worker, args=(connection,), daemon=True
+            ).start()
+
+    def _serve_worker(self, connection: socket.socket) -> None:
+        worker_id = None
+        try:
+            hello = recv_frame(connection)
+            if not hello or hello.get("type") != "hello":
+                return
+            worker_id = f"{hello.get('worker_id') or 'worker'}-{uuid.uuid4().hex[:8]}"
+            with self._condition:
+                self._workers[worker_id] = set()
+                self._workers_connected.set(len(self._workers))
+                self._condition.notify_all()
+            self.logger.info(f"Sweep worker {worker_id} connected.")
+
+            while True:
+                message = recv_frame(connection)
+                if message is None:
+                    return
+                if message.get("type") == "request":
+                    send_frame(connection, self._next_assignment(worker_id))
+                elif message.get("type") == "result":
+                    self._complete(worker_id, message["task_id"], message["outcomes"])
+        except (ConnectionError, OSError) as e:
+            self.logger.warning(f"Lost sweep worker {worker_id}: {e}")
+        finally:
+            connection.close()
+            if worker_id is not None:
+                self._worker_lost(worker_id)
+
+    def _next_assignment(self, worker_id: str) -> Dict[str, Any]:
+        deadline = time.monotonic() + self.POLL_SECONDS
+        with self._condition:
+            while not self._stopping:
+                task = self._take_task(worker_id)
+                if task is not None:
+                    task.running[worker_id] = time.monotonic()
+                    self._workers[worker_id].add(task.task_id)
+                    return {
+                        "type": "task",
+                        "task_id": task.task_id,
+                        "configurations": task.configurations,
+                    }
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return {"type": "wait"}
+                self._condition.wait(min(remaining, self.steal_after_seconds))
+            return {"type": "shutdown"}
+
+    def _take_task(self, worker_id: str) -> Optional[_Task]:
+        # Caller holds the condition.
+        while self._pending:
+            task = self._pending.popleft()
+            if not task.done:
+                self._tasks_total.inc(event="assigned")
+                return task
+
+        now = time.monotonic()
+        candidates = [
+            task
+            for task in self._tasks.values()
+            if not task.done
+            and task.running
+            and worker_id not in task.running
+            and now - min(task.running.values()) >= self.steal_after_seconds
+        ]
+        if not candidates:
+            return None
+        task = min(candidates, key=lambda t: min(t.running.values()))
+        self._tasks_total.inc(event="stolen")
+        self.logger.info(f"Worker {worker_id} stole task {task.task_id[:8]}.")
+        return task
+
+    def _complete(self, worker_id: str, task_id: str, outcomes: List[Dict[str, Any]]) -> None:
+        with self._condition:
+            self._workers.get(worker_id, set()).discard(task_id)
+            task = self._tasks.get(task_id)
+            if task is None or task.done:
+                return  # a stolen copy finished first, or the batch is over
+            for index, payload in zip(task.indices, outcomes):
+                self._outcomes[index] = decode_outcome(payload)
+            self._finish(task)
+            self._tasks_total.inc(event="completed")
+
+    def _worker_lost(self, worker_id: str) -> None:
+        with self._condition:
+            for task_id in self._workers.pop(worker_id, set()):
+                task = self._tasks.get(task_id)
+                if task is None or task.done:
+                    continue
+                task.running.pop(worker_id, None)
+                if task.running:
+                    continue  # another copy is still running
+                task.losses += 1
+                if task.losses > self.max_retries:
+                    error = RemoteCalculationError(
+                        "worker_lost",
+                        f"Task lost {task.losses} times with its worker; giving up.",
+                    )
+                    for index in task.indices:
+                        self._outcomes[index] = error
+                    self._finish(task)
+                    self._tasks_total.inc(event="failed")
+                else:
+                    self._pending.appendleft(task)
+                    self._tasks_total.inc(event="requeued")
+            self._workers_connected.set(len(self._workers))
+            self._condition.notify_all()
+
+    def _finish(self, task: _Task) -> None:
+        # Caller holds the condition.
+        task.done = True
+        for other in task.running:
+            if other in self._workers:
+                self._workers[other].discard(task.task_id)
+        task.running.clear()
+        self._remaining -= 1
+        self._condition.notify_all()
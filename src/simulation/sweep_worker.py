@@ -0,0 +1,107 @@
+import socket
+import threading
+import time
+from typing import Optional
+
+from src.models.entities.game_configuration import GameConfiguration
+
+from src.simulation.simulation_engine import SimulationEngine
+from src.simulation.sweep_coordinator import encode_outcome
+
+from src.infrastructure.frame_protocol import send_frame, recv_frame
+from src.infrastructure.logger_service import LoggerService
+
+
+class SweepWorker:
+    """
+    Connects to a SweepCoordinator, then repeatedly pulls a task, runs it with
+    `SimulationEngine.run_batch` and sends the outcomes back, until the coordinator
+    shuts down or the connection is lost.
+    """
+
+    def __init__(
+        self,
+        coordinator_host: str,
+        coordinator_port: int,
+        simulation_engine: Optional[SimulationEngine] = None,
+        worker_id: Optional[str] = None,
+        connect_timeout_seconds: float = 30.0,
+    ):
+        self.coordinator_host = coordinator_host
+        self.coordinator_port = coordinator_port
+        self.simulation_engine = simulation_engine or SimulationEngine()
+        self.worker_id = worker_id or socket.gethostname()
+        self.connect_timeout_seconds = connect_timeout_seconds
+        self.tasks_completed = 0
+        self.logger = LoggerService().get_logger()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def run(self) -> None:
+        """
+        Serves tasks until the coordinator shuts down, the connection drops, or `stop`
+        is called. Retries the initial connection for `connect_timeout_seconds`.
+        """
+        connection = self._connect()
+        try:
+            send_frame(connection, {"type": "hello", "worker_id": self.worker_id})
+            while not self._stop.is_set():
+                send_frame(connection, {"type": "request"})
+                message = recv_frame(connection)
+                if message is None or message.get("type") == "shutdown":
+                    return
+                if message.get("type") != "task":
+                    continue
+                configs = [
+                    GameConfiguration.model_validate(c) for c in message["configurations"]
+                ]
+                outcomes = self.simulation_engine.run_batch(configs, return_exceptions=True)
+                send_frame(
+                    connection,
+                    {
+                        "type": "result",
+                        "task_id": message["task_id"],
+                        "outcomes": [encode_outcome(o) for o in outcomes],
+                    },
+                )
+                self.tasks_completed += 1
+        except (ConnectionError, OSError) as e:
+            self.logger.warning(f"Sweep worker lost the coordinator: {e}")
+        finally:
+            connection.close()
+
+    def start(self) -> None:
+        """
+        Runs the worker on a daemon thread.
+        """
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self.run, name=f"SweepWorker-{self.worker_id}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops after the current task (and its result) has been handled.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _connect(self) -> socket.socket:
+        deadline = time.monotonic() + self.connect_timeout_seconds
+        delay = 0.1
+        while True:
+            try:
+                connection = socket.create_connection(
+                    (self.coordinator_host, self.coordinator_port), timeout=10
+                )
+                # Tasks may take long; only the connect itself is time-limited.
+                connection.settimeout(None)
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                return connection
+            except OSError:
+                if time.monotonic() + delay > deadline:
+                    raise
+                time.sleep(delay)
+                delay = min(delay * 2, 2.0)
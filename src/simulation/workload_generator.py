@@ -0,0 +1,243 @@
+from typing import Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from src.domain.compiled_game import CompiledGame
+from src.models.entities.player import Player
+
+
+class AircraftCategory:
+    """
+    A runway-requirement class of aircraft and its share of movements.
+    """
+
+    def __init__(self, name: str, share: float, min_runway: float, max_runway: float):
+        self.name = name
+        self.share = share
+        self.min_runway = min_runway
+        self.max_runway = max_runway
+
+
+# Typical mix at a large hub, smallest runway requirement first.
+DEFAULT_CATEGORIES = (
+    AircraftCategory("Regional turboprop", 0.18, 1000.0, 1600.0),
+    AircraftCategory("Narrow-body jet", 0.62, 1600.0, 2500.0),
+    AircraftCategory("Wide-body jet", 0.17, 2500.0, 3300.0),
+    AircraftCategory("Very large aircraft", 0.03, 3300.0, 4000.0),
+)
+
+
+class WorkloadChunk:
+    """
+    Columns for `len(costs)` consecutive movements, starting at movement `start`.
+
+    The airlines of movement `start + j` (operator first, then code-share partners)
+    are `airline_indices[airline_offsets[j]:airline_offsets[j + 1]]`.
+    """
+
+    def __init__(
+        self,
+        start: int,
+        costs: np.ndarray,
+        types: np.ndarray,
+        airline_offsets: np.ndarray,
+        airline_indices: np.ndarray,
+    ):
+        self.start = start
+        self.costs = costs
+        self.types = types
+        self.airline_offsets = airline_offsets
+        self.airline_indices = airline_indices
+
+    def __len__(self) -> int:
+        return len(self.costs)
+
+    def player_ids(self) -> List[str]:
+        return [f"F{i + 1}" for i in range(self.start, self.start + len(self.costs))]
+
+
+class WorkloadGenerator:
+    """
+    Seeded generator of realistic airport traffic, produced as columns.
+
+    - Airline sizes are heavy-tailed: the k-th largest airline operates a share of
+      movements proportional to 1 / k^airline_size_exponent (Zipf).
+    - Each airline has its own fleet mix, drawn around the global category mix
+      (`fleet_concentration` controls how alike airlines are), so regional carriers
+      and long-haul carriers coexist.
+    - A movement's runway requirement is uniform within its aircraft category; the
+      category bounds are also the runway cost steps c_1..c_|T|.
+    - A fraction `codeshare_density` of movements is also marketed by 1 to
+      `max_codeshare_partners` other airlines, preferring large ones.
+
+    Movements are drawn in blocks of BLOCK_SIZE, each from its own seed, so
+    `generate_chunks` can stream any number of movements and the same seed gives
+    the same workload whatever the chunk size.
+    """
+
+    BLOCK_SIZE = 1 << 14
+
+    def __init__(
+        self,
+        seed: Optional[int] = None,
+        num_airlines: int = 50,
+        airline_size_exponent: float = 1.1,
+        codeshare_density: float = 0.2,
+        max_codeshare_partners: int = 2,
+        fleet_concentration: float = 20.0,
+        categories: Sequence[AircraftCategory] = DEFAULT_CATEGORIES,
+    ):
+        if num_airlines < 1:
+            raise ValueError("num_airlines must be at least 1")
+        if not 0 <= codeshare_density <= 1:
+            raise ValueError("codeshare_density must be between 0 and 1")
+        fleet_seed, self._chunk_seed = np.random.SeedSequence(seed).spawn(2)
+        self.categories = list(categories)
+        self.codeshare_density = codeshare_density
+        self.max_codeshare_partners = min(max_codeshare_partners, num_airlines - 1)
+        self.airline_ids = [f"A{k + 1}" for k in range(num_airlines)]
+
+        rng = np.random.default_rng(fleet_seed)
+        weights = 1.0 / np.arange(1, num_airlines + 1) ** airline_size_exponent
+        self.airline_shares = weights / weights.sum()
+        mix = np.array([c.share for c in self.categories], dtype=float)
+        mix = mix / mix.sum()
+        # Row a: cumulative category probabilities of airline a's fleet.
+        self._fleet_cdf = np.cumsum(
+            rng.dirichlet(mix * fleet_concentration, size=num_airlines), axis=1
+        )
+        self._min_runway = np.array([c.min_runway for c in self.categories])
+        self._max_runway = np.array([c.max_runway for c in self.categories])
+
+    @property
+    def runway_cost_steps(self) -> List[float]:
+        return [c.max_runway for c in self.categories]
+
+    def generate_chunks(
+        self, num_movements: int, chunk_size: int = 1_000_000
+    ) -> Iterator[WorkloadChunk]:
+        """
+        Yields the workload as WorkloadChunks of at most `chunk_size` movements.
+        """
+        for start in range(0, num_movements, chunk_size):
+            yield self._chunk(start, min(chunk_size, num_movements - start))
+
+    def generate(self, num_movements: int, chunk_size: int = 1_000_000) -> CompiledGame:
+        """
+        Generates `num_movements` movements straight into a CompiledGame (no Player
+        models), e.g. to save as a snapshot or run with CompiledGameCalculator.
+        """
+        player_ids: List[str] = []
+        costs, types, counts, indices = [], [], [], []
+        for chunk in self.generate_chunks(num_movements, chunk_size):
+            player_ids.extend(chunk.player_ids())
+            costs.append(chunk.costs)
+            types.append(chunk.types)
+            counts.append(np.diff(chunk.airline_offsets))
+            indices.append(chunk.airline_indices)
+
+        offsets = np.zeros(num_movements + 1, dtype=np.int64)
+        if num_movements:
+            np.cumsum(np.concatenate(counts), out=offsets[1:])
+        return CompiledGame.from_columns(
+            player_ids=player_ids,
+            costs=np.concatenate(costs) if costs else np.zeros(0),
+            types=np.concatenate(types) if types else None,
+            incidence=(
+                self.airline_ids,
+                offsets,
+                np.concatenate(indices) if indices else np.zeros(0, dtype=np.int32),
+            ),
+            runway_cost_steps=np.array(self.runway_cost_steps),
+        )
+
+    def players(self, num_movements: int, with_airlines: bool = True) -> List[Player]:
+        """
+        The first `num_movements` movements as Player models, for small interactive
+        games. With `with_airlines`, players also get their type and airlines.
+        """
+        players = []
+        for chunk in self.generate_chunks(num_movements):
+            ids = chunk.player_ids()
+            operators = chunk.airline_indices[chunk.airline_offsets[:-1]]
+            for j, (cost, category) in enumerate(zip(chunk.costs.tolist(), chunk.types.tolist())):
+                airlines = chunk.airline_indices[
+                    chunk.airline_offsets[j] : chunk.airline_offsets[j + 1]
+                ]
+                name = f"{self.airline_ids[operators[j]]} {self.categories[category - 1].name}"
+                if with_airlines:
+                    players.append(
+                        Player(
+                            id=ids[j],
+                            name=name,
+                            cost=cost,
+                            type=category,
+                            airlines=frozenset(self.airline_ids[a] for a in airlines),
+                        )
+                    )
+                else:
+                    players.append(Player(id=ids[j], name=name, cost=cost))
+        return players
+
+    def _chunk(self, start: int, size: int) -> WorkloadChunk:
+        first, last = start // self.BLOCK_SIZE, (start + size - 1) // self.BLOCK_SIZE
+        blocks = [self._block(b) for b in range(first, last + 1)]
+        skip = start - first * self.BLOCK_SIZE
+        costs, category, members = (
+            np.concatenate(column)[skip : skip + size] for column in zip(*blocks)
+        )
+
+        counts = (members >= 0).sum(axis=1)
+        offsets = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        indices = members[members >= 0].astype(np.int32)
+        return WorkloadChunk(start, costs, (category + 1).astype(np.int32), offsets, indices)
+
+    def _block(self, index: int):
+        """
+        Movements index * BLOCK_SIZE onwards: (costs, category, members), where row j of
+        members is the operator, its code-share partners, then -1 padding.
+        """
+        # Keyed by block index, so every call replays the same stream.
+        rng = np.random.default_rng(
+            np.random.SeedSequence(
+                self._chunk_seed.entropy, spawn_key=self._chunk_seed.spawn_key + (index,)
+            )
+        )
+        size = self.BLOCK_SIZE
+        operators = rng.choice(len(self.airline_ids), size=size, p=self.airline_shares)
+
+        # Category from the operator's fleet mix (inverse CDF).
+        u = rng.random(size)
+        category = (u[:, None] > self._fleet_cdf[operators]).sum(axis=1)
+        category = np.minimum(category, len(self.categories) - 1)
+        low, high = self._min_runway[category], self._max_runway[category]
+        costs = np.round(low + rng.random(size) * (high - low), -1)
+        costs = np.clip(costs, low + 10.0, high)
+
+        partners = self._codeshare_partners(rng, operators)
+        return costs, category, np.concatenate([operators[:, None], partners], axis=1)
+
+    def _codeshare_partners(
+        self, rng: np.random.Generator, operators: np.ndarray
+    ) -> np.ndarray:
+        """
+        (size, max_codeshare_partners) array of partner airline indices, -1 for none.
+        Duplicates and the operator itself are dropped.
+        """
+        size, k = len(operators), self.max_codeshare_partners
+        partners = np.full((size, k), -1, dtype=np.int64)
+        if k == 0 or self.codeshare_density == 0:
+            return partners
+        shared = rng.random(size) < self.codeshare_density
+        num_partners = rng.integers(1, k + 1, size=size)
+        drawn = rng.choice(len(self.airline_ids), size=(size, k), p=self.airline_shares)
+        keep = shared[:, None] & (np.arange(k) < num_partners[:, None])
+        keep &= drawn != operators[:, None]
+        for column in range(1, k):
+            earlier = np.where(keep[:, :column], drawn[:, :column], -1)
+            keep[:, column] &= (drawn[:, column, None] != earlier).all(axis=1)
+        partners[keep] = drawn[keep]
+        # Pack the kept partners to the left so rows read operator, partners..., -1...
+        order = np.argsort(partners < 0, axis=1, kind="stable")
+        return np.take_along_axis(partners, order, axis=1)
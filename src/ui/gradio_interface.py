@@ -1,14 +1,23 @@
-import random
 import gradio as gr
-from typing import List
-import matplotlib.pyplot as plt
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from concurrent.futures import CancelledError
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 
 from src.models.entities.player import Player
 from src.models.entities.game_configuration import GameConfiguration
+from src.models.entities.session_state import SessionState
 
 from src.models.enums.algorithm_type import AlgorithmType
 
+from src.services.calculation_monitor import CalculationCancelledError
+from src.services.calculator_factory import CalculatorFactory
+from src.services.algorithm_selector import AlgorithmSelector
+
 from src.simulation.simulation_engine import SimulationEngine
+from src.simulation.job_manager import JobManager, JobLimitExceededError
+from src.simulation.workload_generator import WorkloadGenerator
+
+from src.ui.result_renderer import ResultRenderer
 
 
 class GradioInterface:
@@ -16,213 +25,249 @@ class GradioInterface:
     Gradio-based web interface.
     """
 
-    def __init__(self):
-        self.simulation_engine = SimulationEngine()
-        self.players: List[Player] = []
+    PROGRESS_POLL_SECONDS = 0.5
+
+    def __init__(
+        self,
+        simulation_engine: Optional[SimulationEngine] = None,
+        max_concurrent_jobs: int = 2,
+        max_jobs_per_user: int = 1,
+    ):
+        self.simulation_engine = simulation_engine or SimulationEngine()
+        self.renderer = ResultRenderer()
+        self.job_manager = JobManager(
+            self.simulation_engine,
+            max_concurrent_jobs=max_concurrent_jobs,
+            max_jobs_per_user=max_jobs_per_user,
+        )
+        # session hash -> id of the job currently running for that session
+        self._session_jobs: Dict[str, str] = {}
 
-    def generate_players(self, num_players: int, algorithm: str):
+    def generate_players(
+        self, num_players: int, algorithm: str, session: Optional[SessionState] = None
+    ):
+        session = session or SessionState()
         try:
             if num_players <= 0:
-                return "ERROR: Number must be positive.", "", "", ""
+                return "ERROR: Number must be positive.", "", "", "", session
 
             algo = AlgorithmType(algorithm)
-            self.players = []
             player_list = []
 
             if algo == AlgorithmType.CONFIGURATION_VALUE:
-                runway_steps = [1500, 2500, 3500]
-                runway_steps_text = ", ".join(map(str, runway_steps))
-
-                airlines = [f"A{i+1}" for i in range(max(2, min(5, num_players)))]
+                generator = WorkloadGenerator(
+                    num_airlines=max(2, min(5, num_players)), codeshare_density=0.35
+                )
+                runway_steps = generator.runway_cost_steps
+                runway_steps_text = ", ".join(f"{c:g}" for c in runway_steps)
+                players = generator.players(num_players)
                 codeshare_lines = []
 
-                for i in range(num_players):
-                    t = random.randint(1, 3)
-                    k = random.choice([1, 1, 2])
-                    chosen = sorted(random.sample(airlines, k=k))
-
-                    p = Player(
-                        id=f"F{i+1}",
-                        name=f"Flight {i+1}",
-                        type=t,
-                        airlines=frozenset(chosen),
-                        cost=runway_steps[t - 1],
-                    )
-                    self.players.append(p)
-
+                for p in players:
+                    chosen = sorted(p.airlines)
                     player_list.append(
                         f"{p.name}: Size Category {p.type}, Airlines: {', '.join(chosen)}"
                     )
                     codeshare_lines.append(f"{p.id}: {', '.join(chosen)}")
 
                 status = f"✅ Generated {num_players} test flight operations with code-sharing alliances."
+                new_session = SessionState(
+                    players=players,
+                    runway_cost_steps=[float(c) for c in runway_steps],
+                    codeshare={p.id: p.airlines for p in players},
+                )
                 return (
                     status,
                     "\n".join(player_list),
                     runway_steps_text,
                     "\n".join(codeshare_lines),
+                    new_session,
                 )
 
             else:
                 runway_steps_text = ""
                 codeshare_text = ""
-                for i in range(num_players):
-                    runway_length = random.randint(1000, 4000)
-                    p = Player(
-                        id=f"P{i+1}", name=f"Airline {i+1}", cost=float(runway_length)
-                    )
-                    self.players.append(p)
+                players = WorkloadGenerator().players(num_players, with_airlines=False)
+                for p in players:
                     player_list.append(f"{p.name}: Requires {p.cost:.0f}m runway")
 
-                status = f"Successfully generated {num_players} airlines!"
-                return status, "\n".join(player_list), runway_steps_text, codeshare_text
+                status = f"Successfully generated {num_players} aircraft movements!"
+                return (
+                    status,
+                    "\n".join(player_list),
+                    runway_steps_text,
+                    codeshare_text,
+                    SessionState(players=players),
+                )
 
         except Exception as e:
-            return f"ERROR: {str(e)}", "", "", ""
+            return f"ERROR: {str(e)}", "", "", "", session
 
     def run_simulation(
-        self, algorithm: str, num_samples: int, runway_steps: str, codeshare_text: str
+        self,
+        algorithm: str,
+        num_samples: int,
+        runway_steps: str,
+        codeshare_text: str,
+        target_accuracy_pct: Optional[float] = None,
+        time_budget: Optional[float] = None,
+        session: Optional[SessionState] = None,
+        request: gr.Request = None,
     ):
         """
-        Run the simulation with the current players and settings.
+        Run the simulation with the session's players and settings.
+
+        The calculation is submitted to the background JobManager; this handler streams
+        progress updates until the job finishes, fails or is cancelled.
 
         Args:
             algorithm: Algorithm type ("exact" or "approximate")
             num_samples: Number of samples for approximate algorithm
+            target_accuracy_pct: Target accuracy for the automatic choice (% of total cost)
+            time_budget: Time budget for the automatic choice (seconds)
+            session: Per-session state holding the generated players
 
-        Returns:
-            Tuple of (results text, matplotlib figure)
+        Yields:
+            Tuples of (results text, matplotlib figure, updated session state)
         """
-        if not self.players:
-            return "WARNING: Please generate airlines first.", None
+        session = session or SessionState()
+        if not session.players:
+            yield "WARNING: Please generate airlines first.", None, session
+            return
 
         try:
-            algo = AlgorithmType(algorithm)
+            config, session = self._build_configuration(
+                session, algorithm, num_samples, runway_steps, codeshare_text
+            )
+            if config.algorithm == AlgorithmType.AUTO:
+                config = config.model_copy(
+                    update={
+                        "target_accuracy": (target_accuracy_pct or 0) / 100 or None,
+                        "time_budget_seconds": time_budget or None,
+                    }
+                )
+            job = self.job_manager.submit(self._user_id(request), config)
+        except JobLimitExceededError as e:
+            yield f"WARNING: {str(e)}", None, session
+            return
+        except Exception as e:
+            yield f"ERROR: {str(e)}", None, session
+            return
 
-            if self.players and all(
-                getattr(p, "type", None) is not None for p in self.players
-            ):
+        self._session_jobs[job.user_id] = job.job_id
+        try:
+            while True:
                 try:
-                    steps = self._parse_steps(runway_steps)
-                    for p in self.players:
-                        if 1 <= p.type <= len(steps):
-                            p.cost = steps[p.type - 1]
-                except (ValueError, IndexError):
-                    pass
+                    result = job.result(timeout=self.PROGRESS_POLL_SECONDS)
+                    break
+                except FuturesTimeoutError:
+                    yield (
+                        f"Running {config.algorithm.value.replace('_', ' ')} simulation... "
+                        f"{job.progress:.0%} complete",
+                        None,
+                        session,
+                    )
 
-            samples = num_samples if algo == AlgorithmType.APPROXIMATE else None
+            session = session.model_copy(update={"last_result": result})
+            core_note = None
+            try:
+                core_report = self.simulation_engine.verify_core(config, result)
+            except ValueError as e:
+                core_report, core_note = None, str(e)
+            yield self.renderer.format_summary(
+                result, core_report, core_note
+            ), self.renderer.create_plot(result), session
+
+        except (CalculationCancelledError, CancelledError):
+            yield "Simulation cancelled.", None, session
+        except Exception as e:
+            yield f"ERROR: {str(e)}", None, session
+        finally:
+            # Also reached when Gradio closes the generator (page closed or event cancelled).
+            job.cancel()
+            self._session_jobs.pop(job.user_id, None)
+
+    def cancel_simulation(self, request: gr.Request = None) -> str:
+        """Cancel the running simulation of the calling session, if any."""
+        job_id = self._session_jobs.get(self._user_id(request))
+        if job_id is None:
+            return "No simulation is running."
+        self.job_manager.cancel(job_id)
+        return "Cancelling simulation..."
+
+    def _build_configuration(
+        self,
+        session: SessionState,
+        algorithm: str,
+        num_samples: int,
+        runway_steps: str,
+        codeshare_text: str,
+    ) -> Tuple[GameConfiguration, SessionState]:
+        """
+        Builds the GameConfiguration for a run together with the updated session state.
+        Players are replaced by updated copies; the session's own objects are never mutated.
+        """
+        algo = AlgorithmType(algorithm)
+        players = session.players
 
-            if algo == AlgorithmType.CONFIGURATION_VALUE:
+        if players and all(getattr(p, "type", None) is not None for p in players):
+            try:
                 steps = self._parse_steps(runway_steps)
-
-                if codeshare_text.strip():
-                    self._apply_codeshare(codeshare_text)
-                else:
-                    missing = [
-                        p.id for p in self.players if not getattr(p, "airlines", None)
-                    ]
-                    if missing:
-                        return (
-                            "ERROR: Missing airline mappings. Please fill 'Airline Alliance Mapping' box or Regenerate.",
-                            None,
-                        )
-
-                config = GameConfiguration(
-                    players=self.players,
-                    algorithm=algo,
-                    num_samples=None,
-                    runway_cost_steps=steps,
-                )
-            else:
-                config = GameConfiguration(
-                    players=self.players, algorithm=algo, num_samples=samples
+                players = [
+                    (
+                        p.model_copy(update={"cost": steps[p.type - 1]})
+                        if 1 <= p.type <= len(steps)
+                        else p
+                    )
+                    for p in players
+                ]
+                session = session.model_copy(
+                    update={"players": players, "runway_cost_steps": steps}
                 )
+            except (ValueError, IndexError):
+                pass
 
-            result = self.simulation_engine.run_simulation(config)
-
-            return self._format_results(result), self._create_plot(result)
-
-        except Exception as e:
-            return f"ERROR: {str(e)}", None
-
-    def _format_results(self, result) -> str:
-        """Format calculation results as readable text."""
-        cost_per_meter = 1000
-        total_cost_dollars = result.total_cost * cost_per_meter
-
-        lines = [
-            "=" * 60,
-            "SIMULATION RESULTS",
-            "=" * 60,
-            f"\n Algorithm: {result.algorithm_used.value.replace('_', ' ').title()}",
-            f" Runway Length Built: {result.total_cost:.0f} meters",
-            f" Total Construction Cost: ${total_cost_dollars:,.0f}",
-            f" Execution Time: {result.execution_time:.4f} seconds",
-            "\n" + "=" * 60,
-            " FAIR COST ALLOCATION (Shapley Values)",
-            "=" * 60,
-            "Each airline's fair share of the runway construction cost:",
-            "",
-        ]
-
-        for pid, val in result.shapley_values.items():
-            cost_dollars = val * cost_per_meter
-            percentage = (val / result.total_cost * 100) if result.total_cost > 0 else 0
-            lines.append(f"{pid}: ${cost_dollars:,.0f} ({percentage:.1f}% of total)")
-
-        total_allocated = sum(result.shapley_values.values())
-        total_allocated_dollars = total_allocated * cost_per_meter
-        lines.append("\n" + "=" * 60)
-        lines.append(f"✓ Total Allocated: ${total_allocated_dollars:,.0f}")
-        lines.append(
-            f"✓ Verification: {'PASSED' if abs(total_allocated - result.total_cost) < 0.01 else 'FAILED'}"
-        )
-        lines.append("=" * 60)
-
-        return "\n".join(lines)
-
-    def _create_plot(self, result) -> plt.Figure:
-        """Create a bar chart visualization of Shapley values."""
-        fig, ax = plt.subplots(figsize=(10, 6))
+        samples = num_samples if algo == AlgorithmType.APPROXIMATE else None
 
-        cost_per_meter = 1000
-        ids = list(result.shapley_values.keys())
-        values_dollars = [v * cost_per_meter for v in result.shapley_values.values()]
+        if algo == AlgorithmType.CONFIGURATION_VALUE:
+            steps = self._parse_steps(runway_steps)
 
-        bars = ax.bar(
-            ids,
-            values_dollars,
-            color="#4A90E2",
-            alpha=0.8,
-            edgecolor="#2E5C8A",
-            linewidth=2,
-        )
+            if codeshare_text.strip():
+                codeshare = self._parse_codeshare(codeshare_text)
+                players = self._apply_codeshare(players, codeshare)
+                session = session.model_copy(
+                    update={"players": players, "codeshare": codeshare}
+                )
+            else:
+                missing = [p.id for p in players if not getattr(p, "airlines", None)]
+                if missing:
+                    raise ValueError(
+                        "Missing airline mappings. Please fill 'Airline Alliance Mapping' box or Regenerate."
+                    )
 
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(
-                bar.get_x() + bar.get_width() / 2.0,
-                height,
-                f"${height:,.0f}",
-                ha="center",
-                va="bottom",
-                fontweight="bold",
+            config = GameConfiguration(
+                players=players,
+                algorithm=algo,
+                num_samples=None,
+                runway_cost_steps=steps,
             )
+            return config, session
 
-        ax.set_ylabel("Fair Cost Share ($)", fontsize=12, fontweight="bold")
-        ax.set_xlabel("Airline", fontsize=12, fontweight="bold")
-        ax.set_title(
-            "Runway Construction Cost Allocation (Shapley Values)",
-            fontsize=14,
-            fontweight="bold",
-            pad=20,
-        )
-        ax.grid(axis="y", alpha=0.3, linestyle="--")
+        config = GameConfiguration(players=players, algorithm=algo, num_samples=samples)
+        return config, session
 
-        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f"${x:,.0f}"))
+    @staticmethod
+    def _user_id(request: Optional[gr.Request]) -> str:
+        if request is None or getattr(request, "session_hash", None) is None:
+            return "anonymous"
+        return request.session_hash
 
-        plt.tight_layout()
-        return fig
+    def show_results_page(self, page: float, session: Optional[SessionState] = None):
+        """Return one page of the results table for the session's latest result."""
+        if session is None or session.last_result is None:
+            return [], ""
+        rows, total_pages = self.renderer.table_page(session.last_result, int(page or 1))
+        return rows, f"Page {min(max(1, int(page or 1)), total_pages)} of {total_pages}"
 
     def _parse_steps(self, text: str) -> List[float]:
         parts = [p.strip() for p in text.split(",") if p.strip()]
@@ -230,7 +275,7 @@ class GradioInterface:
             raise ValueError("Please provide runway steps like: 1500, 2500, 3500")
         return [float(x) for x in parts]
 
-    def _apply_codeshare(self, text: str) -> None:
+    def _parse_codeshare(self, text: str) -> Dict[str, FrozenSet[str]]:
         mapping = {}
         for line in text.splitlines():
             line = line.strip()
@@ -240,9 +285,13 @@ class GradioInterface:
             pid = left.strip()
             airlines = [a.strip() for a in right.split(",") if a.strip()]
             mapping[pid] = frozenset(airlines)
+        return mapping
 
+    def _apply_codeshare(
+        self, players: List[Player], mapping: Dict[str, FrozenSet[str]]
+    ) -> List[Player]:
         new_players = []
-        for p in self.players:
+        for p in players:
             if p.id not in mapping:
                 raise ValueError(f"Missing code-sharing mapping for {p.id}")
             new_players.append(
@@ -254,12 +303,13 @@ class GradioInterface:
                     cost=p.cost,
                 )
             )
-        self.players = new_players
+        return new_players
 
     def on_algorithm_change(self, algorithm: str):
         algo = AlgorithmType(algorithm)
         show_paper = algo == AlgorithmType.CONFIGURATION_VALUE
         show_samples = algo == AlgorithmType.APPROXIMATE
+        show_auto = algo == AlgorithmType.AUTO
 
         return (
             gr.update(visible=show_samples),
@@ -267,8 +317,51 @@ class GradioInterface:
             gr.update(visible=show_paper),
             #gr.update(visible=not show_paper),  # Hide standard summary if specialized boxes are shown
             gr.update(visible=True),  # Keep summary visible as requested
+            gr.update(visible=show_auto),
+            gr.update(visible=show_auto),
         )
 
+    def preview_plan(
+        self,
+        num_players: int,
+        algorithm: str,
+        num_samples: int,
+        target_accuracy_pct: float,
+        time_budget: float,
+        session: Optional[SessionState] = None,
+    ) -> str:
+        """Describe which algorithm will run and its predicted runtime, before running it."""
+        try:
+            algo = AlgorithmType(algorithm)
+            n = len(session.players) if session and session.players else int(num_players)
+            placeholder = [Player(id=f"P{i+1}", name="", cost=1.0) for i in range(n)]
+            config = GameConfiguration(
+                players=placeholder,
+                algorithm=algo,
+                num_samples=num_samples if algo == AlgorithmType.APPROXIMATE else None,
+                target_accuracy=(target_accuracy_pct or 0) / 100 or None,
+                time_budget_seconds=time_budget or None,
+            )
+            if algo == AlgorithmType.CONFIGURATION_VALUE:
+                return f"**Plan:** configuration value (closed form) for {n:,} flights."
+
+            plan = CalculatorFactory.plan(config)
+            predicted = AlgorithmSelector.format_seconds(plan.predicted_seconds)
+            text = (
+                f"**Plan:** {plan.algorithm.value.replace('_', ' ')} for {n:,} players, "
+                f"predicted runtime ~{predicted}."
+            )
+            if plan.num_samples:
+                text += (
+                    f" {plan.num_samples:,} samples, standard error ≤ "
+                    f"{plan.expected_relative_error:.2%} of total cost."
+                )
+            if algo == AlgorithmType.AUTO:
+                text += f"\n\n{plan.reason}"
+            return text
+        except Exception as e:
+            return f"Plan unavailable: {str(e)}"
+
     def create_interface(self) -> gr.Blocks:
         """
         Create the Gradio interface.
@@ -308,17 +401,20 @@ class GradioInterface:
                 """
             )
 
+            session_state = gr.State(SessionState())
+
             with gr.Row():
                 with gr.Column(scale=1):
                     gr.Markdown("## Configuration")
 
                     num_players_slider = gr.Slider(
                         minimum=2,
-                        maximum=10,
+                        maximum=2000,
                         value=3,
                         step=1,
                         label="Number of Airlines",
-                        info="Airlines operating at the airport with different runway needs",
+                        info="Airlines operating at the airport with different runway needs. "
+                        "Use 'Automatic' for large airports.",
                     )
 
                     generate_btn = gr.Button(
@@ -339,11 +435,15 @@ class GradioInterface:
 
                     algorithm_radio = gr.Radio(
                         choices=[
+                            ("Automatic (choose by size, accuracy and time)", "auto"),
                             ("Exact (Standard Shapley)", "exact"),
                             ("Approximate (Monte Carlo)", "approximate"),
+                            ("Shapley, Closed Form (Airport Structure)", "airport_shapley"),
+                            ("Banzhaf Value (Closed Form)", "banzhaf"),
+                            ("Nucleolus (Airport Structure)", "nucleolus"),
                             ("Code-Sharing (Configuration Value)", "configuration_value"),
                         ],
-                        value="exact",
+                        value="auto",
                         label="Coalition Model & Algorithm",
                         info="Select 'Exact/Approximate' for standard cost-sharing or 'Code-Sharing' for networked airline alliances.",
                     )
@@ -358,10 +458,31 @@ class GradioInterface:
                         visible=False,
                     )
 
-                    run_btn = gr.Button(
-                        "Run Simulation", variant="primary", size="lg"
+                    accuracy_slider = gr.Slider(
+                        minimum=0.1,
+                        maximum=5.0,
+                        value=1.0,
+                        step=0.1,
+                        label="Target Accuracy (% of total cost)",
+                        info="Acceptable standard error of each airline's share",
+                        visible=True,
+                    )
+
+                    time_budget_box = gr.Number(
+                        value=10,
+                        minimum=0.1,
+                        label="Time Budget (seconds)",
+                        visible=True,
                     )
 
+                    plan_box = gr.Markdown()
+
+                    with gr.Row():
+                        run_btn = gr.Button(
+                            "Run Simulation", variant="primary", size="lg"
+                        )
+                        cancel_btn = gr.Button("Cancel", variant="stop", size="lg")
+
                     runway_steps_box = gr.Textbox(
                         label="Infrastructure Cost Segments (c1, c2, ...)",
                         lines=1,
@@ -388,6 +509,18 @@ class GradioInterface:
 
                     plot_output = gr.Plot(label="Cost Allocation Visualization")
 
+                    with gr.Row():
+                        page_number = gr.Number(
+                            value=1, precision=0, minimum=1, label="Results Page"
+                        )
+                        page_info = gr.Markdown()
+
+                    results_table = gr.Dataframe(
+                        headers=["Rank", "Player", "Share ($)", "Share (%)"],
+                        label="Full Allocation",
+                        interactive=False,
+                    )
+
             gr.Markdown(
                 """
                 ---
@@ -418,38 +551,95 @@ class GradioInterface:
 
             generate_btn.click(
                 fn=self.generate_players,
-                inputs=[num_players_slider, algorithm_radio],
-                outputs=[status_box, players_display, runway_steps_box, codeshare_box],
+                inputs=[num_players_slider, algorithm_radio, session_state],
+                outputs=[
+                    status_box,
+                    players_display,
+                    runway_steps_box,
+                    codeshare_box,
+                    session_state,
+                ],
             )
 
             algorithm_radio.change(
                 fn=self.on_algorithm_change,
                 inputs=[algorithm_radio],
-                outputs=[samples_slider, runway_steps_box, codeshare_box, players_display],
+                outputs=[
+                    samples_slider,
+                    runway_steps_box,
+                    codeshare_box,
+                    players_display,
+                    accuracy_slider,
+                    time_budget_box,
+                ],
             )
 
-            run_btn.click(
+            plan_inputs = [
+                num_players_slider,
+                algorithm_radio,
+                samples_slider,
+                accuracy_slider,
+                time_budget_box,
+                session_state,
+            ]
+            for component in plan_inputs:
+                component.change(
+                    fn=self.preview_plan, inputs=plan_inputs, outputs=[plan_box]
+                )
+            interface.load(fn=self.preview_plan, inputs=plan_inputs, outputs=[plan_box])
+
+            # Heavy work is bounded by the JobManager, so the streaming handler itself
+            # must not be throttled by Gradio's per-event concurrency limit.
+            run_event = run_btn.click(
                 fn=self.run_simulation,
                 inputs=[
                     algorithm_radio,
                     samples_slider,
                     runway_steps_box,
                     codeshare_box,
+                    accuracy_slider,
+                    time_budget_box,
+                    session_state,
                 ],
-                outputs=[results_text, plot_output],
+                outputs=[results_text, plot_output, session_state],
+                concurrency_limit=None,
+            )
+
+            run_event.then(
+                fn=self.show_results_page,
+                inputs=[page_number, session_state],
+                outputs=[results_table, page_info],
+            )
+
+            page_number.change(
+                fn=self.show_results_page,
+                inputs=[page_number, session_state],
+                outputs=[results_table, page_info],
+            )
+
+            cancel_btn.click(
+                fn=self.cancel_simulation,
+                inputs=None,
+                outputs=[status_box],
+                cancels=[run_event],
             )
 
         return interface
 
-    def launch(self, share: bool = False, server_port: int = 7860):
+    def launch(
+        self, share: bool = False, server_port: int = 7860, concurrency_limit: int = 8
+    ):
         """
         Launch the Gradio interface.
 
         Args:
             share: Whether to create a public sharing link
             server_port: Port to run the server on
+            concurrency_limit: Requests handled in parallel per event (e.g. several
+                users generating airlines at once)
         """
         interface = self.create_interface()
+        interface.queue(default_concurrency_limit=concurrency_limit)
         interface.launch(share=share, server_port=server_port, server_name="0.0.0.0")
 
 
@@ -0,0 +1,263 @@
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+
+from src.models.enums.algorithm_type import AlgorithmType
+from src.models.entities.calculation_result import CalculationResult
+from src.models.entities.core_stability_report import CoreStabilityReport
+
+
+class ResultRenderer:
+    """
+    Turns a CalculationResult into the text summary, chart and table shown in the UI.
+
+    Small results are rendered in full (one line and one bar per player). Beyond
+    `detail_threshold` players the summary and chart switch to aggregate views
+    (distribution histogram and top-k), and the full allocation is only available
+    page by page through `table_page`, so rendering cost stays flat as N grows.
+
+    Figures are created with `matplotlib.figure.Figure` instead of `pyplot`, so they
+    are never registered in pyplot's global figure manager and are released as soon
+    as Gradio drops its reference.
+    """
+
+    COST_PER_METER = 1000
+
+    SOLUTION_NAMES = {
+        AlgorithmType.BANZHAF: "Banzhaf Values",
+        AlgorithmType.SEMIVALUE: "Semivalues",
+        AlgorithmType.NUCLEOLUS: "Nucleolus",
+    }
+
+    # Allocations that are not budget-balanced: their shares need not add up to the total.
+    NON_EFFICIENT_ALGORITHMS = {AlgorithmType.BANZHAF, AlgorithmType.SEMIVALUE}
+
+    def __init__(self, detail_threshold: int = 50, top_k: int = 20, page_size: int = 100):
+        self.detail_threshold = detail_threshold
+        self.top_k = top_k
+        self.page_size = page_size
+
+    def format_summary(
+        self,
+        result: CalculationResult,
+        core_report: Optional[CoreStabilityReport] = None,
+        core_note: Optional[str] = None,
+    ) -> str:
+        """
+        Format calculation results as readable text, with the core check if given, or
+        `core_note` saying why it could not be made.
+        """
+        cost_per_meter = self.COST_PER_METER
+        total_cost_dollars = result.total_cost * cost_per_meter
+        ids, values = self._as_arrays(result)
+
+        lines = [
+            "=" * 60,
+            "SIMULATION RESULTS",
+            "=" * 60,
+            f"\n Algorithm: {result.algorithm_used.value.replace('_', ' ').title()}",
+            f" Runway Length Built: {result.total_cost:.0f} meters",
+            f" Total Construction Cost: ${total_cost_dollars:,.0f}",
+            f" Execution Time: {result.execution_time:.4f} seconds",
+            (
+                " Result: Exact"
+                if result.is_exact
+                else f" Result: Estimate from {result.num_samples_used or 0:,} sampled orderings"
+            ),
+            "\n" + "=" * 60,
+            f" FAIR COST ALLOCATION ({self._solution_name(result)})",
+            "=" * 60,
+        ]
+
+        if len(ids) <= self.detail_threshold:
+            lines.append("Each airline's fair share of the runway construction cost:")
+            lines.append("")
+            for pid, val in zip(ids, values):
+                lines.append(self._format_share(pid, val, result))
+        else:
+            lines.append(f"{len(ids):,} players. Distribution of fair shares:")
+            lines.append("")
+            for label, q in (("Min", 0), ("Median", 50), ("Max", 100)):
+                lines.append(
+                    f"{label}: ${np.percentile(values, q) * cost_per_meter:,.0f}"
+                )
+            lines.append(f"Mean: ${values.mean() * cost_per_meter:,.0f}")
+            lines.append("")
+            lines.append(f"Top {self.top_k} shares:")
+            for i in self._top_k_indices(values):
+                lines.append(self._format_share(ids[i], values[i], result))
+            lines.append("")
+            lines.append("The full allocation is available in the results table.")
+
+        total_allocated = float(values.sum())
+        total_allocated_dollars = total_allocated * cost_per_meter
+        lines.append("\n" + "=" * 60)
+        lines.append(f"✓ Total Allocated: ${total_allocated_dollars:,.0f}")
+        if result.algorithm_used in self.NON_EFFICIENT_ALGORITHMS:
+            lines.append(
+                f"Note: {self._solution_name(result)} are not budget-balanced, "
+                "so the shares need not add up to the total cost."
+            )
+        else:
+            lines.append(
+                f"✓ Verification: {'PASSED' if abs(total_allocated - result.total_cost) < 0.01 else 'FAILED'}"
+            )
+        if result.component_values:
+            lines.append("\nPer-facility breakdown:")
+            for name, shares in result.component_values.items():
+                lines.append(
+                    f"  {name}: ${sum(shares.values()) * cost_per_meter:,.0f}"
+                )
+        if core_report is not None:
+            lines.append(self._format_core(core_report))
+        elif core_note is not None:
+            lines.append(f"Core: NOT CHECKED - {core_note}")
+        lines.append("=" * 60)
+
+        return "\n".join(lines)
+
+    def create_plot(self, result: CalculationResult) -> Figure:
+        """Create a bar chart (small N) or a histogram and top-k chart (large N)."""
+        ids, values = self._as_arrays(result)
+        values_dollars = values * self.COST_PER_METER
+
+        if len(ids) <= self.detail_threshold:
+            fig = Figure(figsize=(10, 6))
+            ax = fig.add_subplot(1, 1, 1)
+            self._draw_bars(ax, list(ids), values_dollars, annotate=True)
+            ax.set_xlabel("Airline", fontsize=12, fontweight="bold")
+            ax.set_title(
+                f"Runway Construction Cost Allocation ({self._solution_name(result)})",
+                fontsize=14,
+                fontweight="bold",
+                pad=20,
+            )
+        else:
+            fig = Figure(figsize=(14, 6))
+            hist_ax = fig.add_subplot(1, 2, 1)
+            hist_ax.hist(
+                values_dollars,
+                bins=min(50, max(10, int(math.sqrt(len(ids))))),
+                color="#4A90E2",
+                alpha=0.8,
+                edgecolor="#2E5C8A",
+            )
+            hist_ax.set_xlabel("Fair Cost Share ($)", fontsize=12, fontweight="bold")
+            hist_ax.set_ylabel("Number of Players", fontsize=12, fontweight="bold")
+            hist_ax.set_title(
+                f"Distribution of Shares ({len(ids):,} players)",
+                fontsize=14,
+                fontweight="bold",
+            )
+            hist_ax.xaxis.set_major_formatter(
+                plt.FuncFormatter(lambda x, p: f"${x:,.0f}")
+            )
+
+            top_ax = fig.add_subplot(1, 2, 2)
+            top = self._top_k_indices(values)
+            self._draw_bars(
+                top_ax, [str(ids[i]) for i in top], values_dollars[top], annotate=False
+            )
+            top_ax.tick_params(axis="x", labelrotation=90)
+            top_ax.set_title(
+                f"Top {len(top)} Shares", fontsize=14, fontweight="bold"
+            )
+
+        fig.tight_layout()
+        return fig
+
+    def table_page(
+        self, result: CalculationResult, page: int
+    ) -> Tuple[List[List[object]], int]:
+        """
+        Returns one page of the allocation table (sorted by share, largest first)
+        and the total number of pages. Pages are 1-based and clamped to the valid range.
+        """
+        ids, values = self._as_arrays(result)
+        total_pages = max(1, math.ceil(len(ids) / self.page_size))
+        page = min(max(1, int(page)), total_pages)
+
+        order = np.argsort(-values, kind="stable")
+        start = (page - 1) * self.page_size
+        rows = []
+        for rank, i in enumerate(order[start : start + self.page_size], start=start + 1):
+            share = float(values[i])
+            percentage = (
+                share / result.total_cost * 100 if result.total_cost > 0 else 0.0
+            )
+            rows.append(
+                [
+                    rank,
+                    str(ids[i]),
+                    round(share * self.COST_PER_METER, 2),
+                    round(percentage, 3),
+                ]
+            )
+        return rows, total_pages
+
+    def _as_arrays(self, result: CalculationResult) -> Tuple[np.ndarray, np.ndarray]:
+        ids = np.array(list(result.shapley_values.keys()), dtype=object)
+        values = np.fromiter(
+            result.shapley_values.values(), dtype=float, count=len(ids)
+        )
+        return ids, values
+
+    def _format_core(self, report: CoreStabilityReport) -> str:
+        if report.in_core:
+            return "✓ Core: STABLE (no group of airlines pays more than building alone)"
+        if report.max_violation <= 0.01 / self.COST_PER_METER:
+            return (
+                "Core: NOT IN CORE - no group of airlines overpays, but the shares "
+                "do not add up to the total cost"
+            )
+        members = report.most_violated_coalition
+        shown = ", ".join(members[:10]) + (", ..." if len(members) > 10 else "")
+        return (
+            f"✗ Core: VIOLATED - {len(members):,} airline(s) ({shown}) would pay "
+            f"${report.max_violation * self.COST_PER_METER:,.0f} more than building alone"
+        )
+
+    def _solution_name(self, result: CalculationResult) -> str:
+        return self.SOLUTION_NAMES.get(result.algorithm_used, "Shapley Values")
+
+    def _top_k_indices(self, values: np.ndarray) -> np.ndarray:
+        k = min(self.top_k, len(values))
+        top = np.argpartition(-values, k - 1)[:k]
+        return top[np.argsort(-values[top], kind="stable")]
+
+    def _format_share(self, pid: str, value: float, result: CalculationResult) -> str:
+        cost_dollars = value * self.COST_PER_METER
+        percentage = (value / result.total_cost * 100) if result.total_cost > 0 else 0
+        line = f"{pid}: ${cost_dollars:,.0f} ({percentage:.1f}% of total)"
+        if result.standard_errors is not None and pid in result.standard_errors:
+            line += f" ± ${result.standard_errors[pid] * self.COST_PER_METER:,.0f}"
+        return line
+
+    def _draw_bars(self, ax, labels: List[str], values_dollars, annotate: bool) -> None:
+        bars = ax.bar(
+            labels,
+            values_dollars,
+            color="#4A90E2",
+            alpha=0.8,
+            edgecolor="#2E5C8A",
+            linewidth=2,
+        )
+
+        if annotate:
+            for bar in bars:
+                height = bar.get_height()
+                ax.text(
+                    bar.get_x() + bar.get_width() / 2.0,
+                    height,
+                    f"${height:,.0f}",
+                    ha="center",
+                    va="bottom",
+                    fontweight="bold",
+                )
+
+        ax.set_ylabel("Fair Cost Share ($)", fontsize=12, fontweight="bold")
+        ax.grid(axis="y", alpha=0.3, linestyle="--")
+        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f"${x:,.0f}"))
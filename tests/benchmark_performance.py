@@ -1,7 +1,9 @@
+import json
 import time
+import argparse
 import numpy as np
 import matplotlib.pyplot as plt
-from typing import List
+from typing import List, Optional
 import os
 import sys
 
@@ -12,12 +14,35 @@ from src.models.entities.player import Player
 from src.models.enums.algorithm_type import AlgorithmType
 from src.models.entities.game_configuration import GameConfiguration
 from src.simulation.simulation_engine import SimulationEngine
+from src.domain.airport_game import AirportGame
+from src.services.cost_model import CostModel
+from src.services.exact_shapley_calculator import ExactShapleyCalculator
+from src.services.approximate_shapley_calculator import ApproximateShapleyCalculator
+from src.services.compiled_game_calculator import CompiledGameCalculator
+from src.simulation.workload_generator import WorkloadGenerator
 
-def generate_random_players(n: int) -> List[Player]:
-    return [
-        Player(id=f"P{i}", name=f"Airline {i}", cost=float(np.random.randint(1000, 4000)))
-        for i in range(n)
-    ]
+def generate_random_players(n: int, seed: Optional[int] = None) -> List[Player]:
+    return WorkloadGenerator(seed=seed).players(n, with_airlines=False)
+
+def benchmark_workload(num_movements: int, seed: int = 0):
+    """
+    Closed-form allocations on a generated production-scale airport, built and
+    computed entirely in columnar form.
+    """
+    print(f"\nBenchmark: Synthetic airport with {num_movements:,} movements")
+    start = time.perf_counter()
+    game = WorkloadGenerator(seed=seed).generate(num_movements)
+    game.player_index  # decode the interned IDs up front
+    print(f"Generated in {time.perf_counter() - start:.2f} s "
+          f"({game.num_airlines} airlines, {len(game.incidence_airlines) / num_movements:.2f} airlines per movement)")
+
+    print("| Algorithm | Time (s) | Movements/s |")
+    print("|-----------|----------|-------------|")
+    for algorithm in [AlgorithmType.AIRPORT_SHAPLEY, AlgorithmType.BANZHAF, AlgorithmType.CONFIGURATION_VALUE]:
+        start = time.perf_counter()
+        CompiledGameCalculator(algorithm).calculate(game)
+        elapsed = time.perf_counter() - start
+        print(f"| {algorithm.value} | {elapsed:.3f} | {num_movements / elapsed:,.0f} |")
 
 def benchmark_scaling():
     engine = SimulationEngine()
@@ -83,6 +108,55 @@ def benchmark_convergence():
         rmse = np.sqrt(np.mean((exact_values - approx_values)**2))
         print(f"| {s} | {result_approx.execution_time:.4f} | {rmse:.2f} |")
 
+def calibrate_cost_model(output_path: str):
+    """
+    Fits the CostModel used for automatic algorithm selection and writes it as a
+    configuration file that can be passed to main.py --config.
+    """
+    model = CostModel()
+
+    exact_runs = []
+    for n in [5, 6, 7, 8]:
+        game = AirportGame(generate_random_players(n))
+        result = ExactShapleyCalculator().calculate(game)
+        exact_runs.append((n, None, None, result.execution_time))
+
+    approx_runs = []
+    for n, samples in [(10, 2000), (25, 1000), (50, 500), (100, 200), (200, 100)]:
+        game = AirportGame(generate_random_players(n))
+        result = ApproximateShapleyCalculator(num_samples=samples).calculate(game)
+        approx_runs.append((n, samples, None, result.execution_time))
+
+    model.fit(AlgorithmType.EXACT, exact_runs)
+    model.fit(AlgorithmType.APPROXIMATE, approx_runs)
+
+    print("\nCalibrated cost model coefficients (seconds per unit of work):")
+    for algorithm, coefficients in model.coefficients.items():
+        print(f"  {algorithm}: {coefficients}")
+
+    with open(output_path, "w") as f:
+        json.dump({"cost_model": model.coefficients}, f, indent=2)
+    print(f"Written to {output_path}")
+
 if __name__ == "__main__":
-    benchmark_scaling()
-    benchmark_convergence()
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--calibrate",
+        metavar="OUTPUT_JSON",
+        help="Fit the automatic-selection cost model and write it to OUTPUT_JSON",
+    )
+    parser.add_argument(
+        "--workload",
+        type=int,
+        metavar="MOVEMENTS",
+        help="Benchmark the closed-form algorithms on a generated airport with MOVEMENTS movements",
+    )
+    args = parser.parse_args()
+
+    if args.calibrate:
+        calibrate_cost_model(args.calibrate)
+    elif args.workload:
+        benchmark_workload(args.workload)
+    else:
+        benchmark_scaling()
+        benchmark_convergence()
@@ -0,0 +1,159 @@
+import json
+import time
+import argparse
+import threading
+import http.client
+import numpy as np
+from typing import List, Optional
+from urllib.parse import urlparse
+import os
+import sys
+
+# Add the project root to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.api.api_server import ApiServer
+from src.simulation.simulation_engine import SimulationEngine
+from src.simulation.workload_generator import WorkloadGenerator
+
+
+def workload_configurations(seed: int, count: int, num_players: int, algorithm: str) -> List[dict]:
+    """
+    `count` request bodies, each a slice of one generated airport workload.
+    """
+    chunk = next(WorkloadGenerator(seed=seed).generate_chunks(count * num_players, count * num_players))
+    costs = chunk.costs.tolist()
+    return [
+        {
+            "players": [
+                {"id": f"P{i}", "name": f"Movement {i}", "cost": costs[r * num_players + i]}
+                for i in range(num_players)
+            ],
+            "algorithm": algorithm,
+        }
+        for r in range(count)
+    ]
+
+
+def client_worker(
+    host: str,
+    port: int,
+    num_requests: int,
+    num_players: int,
+    algorithm: str,
+    seed: int,
+    latencies: List[float],
+    errors: List[str],
+):
+    # One persistent (keep-alive) connection per client.
+    connection = http.client.HTTPConnection(host, port, timeout=60)
+    for configuration in workload_configurations(seed, num_requests, num_players, algorithm):
+        body = json.dumps(configuration)
+        start = time.perf_counter()
+        connection.request(
+            "POST", "/run", body=body, headers={"Content-Type": "application/json"}
+        )
+        response = connection.getresponse()
+        payload = response.read()
+        latencies.append(time.perf_counter() - start)
+        if response.status != 200:
+            errors.append(f"{response.status}: {payload[:200]!r}")
+    connection.close()
+
+
+def run_load_test(
+    host: str, port: int, num_requests: int, concurrency: int, num_players: int, algorithm: str
+):
+    per_client = max(1, num_requests // concurrency)
+    latencies: List[float] = []
+    errors: List[str] = []
+    threads = [
+        threading.Thread(
+            target=client_worker,
+            args=(host, port, per_client, num_players, algorithm, seed, latencies, errors),
+        )
+        for seed in range(concurrency)
+    ]
+
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    total = per_client * concurrency
+    ms = np.array(latencies) * 1000
+    print(f"| Requests | Clients | Players | Throughput (req/s) | p50 (ms) | p95 (ms) | p99 (ms) | Errors |")
+    print(f"|---|---|---|---|---|---|---|---|")
+    print(
+        f"| {total} | {concurrency} | {num_players} | {total / elapsed:,.0f} | "
+        f"{np.percentile(ms, 50):.2f} | {np.percentile(ms, 95):.2f} | {np.percentile(ms, 99):.2f} | {len(errors)} |"
+    )
+    for error in errors[:5]:
+        print(f"  error {error}")
+    return errors
+
+
+def check_streaming_endpoints(host: str, port: int, num_players: int):
+    connection = http.client.HTTPConnection(host, port, timeout=60)
+
+    configurations = workload_configurations(0, 200, num_players, "airport_shapley")
+    connection.request("POST", "/batch", body=json.dumps({"configurations": configurations}))
+    response = connection.getresponse()
+    lines = [json.loads(line) for line in response.read().splitlines()]
+    assert response.status == 200 and len(lines) == 200
+    assert all("result" in line for line in lines), "batch returned errors"
+    print(f"/batch: {len(lines)} results streamed")
+
+    sweep = {
+        "configuration": workload_configurations(1, 1, 6, "exact")[0],
+        "grid": {"algorithm": ["exact", "airport_shapley", "banzhaf", "nucleolus"]},
+    }
+    connection.request("POST", "/sweep", body=json.dumps(sweep))
+    response = connection.getresponse()
+    lines = [json.loads(line) for line in response.read().splitlines()]
+    assert response.status == 200 and len(lines) == 4
+    exact, shapley = lines[0]["result"], lines[1]["result"]
+    for pid, value in exact["shapley_values"].items():
+        assert abs(shapley["shapley_values"][pid] - value) < 1e-6
+    print(f"/sweep: {len(lines)} scenarios streamed, exact and closed form agree")
+    connection.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Load test for the HTTP/JSON compute API (POST /run with keep-alive clients)"
+    )
+    parser.add_argument(
+        "--url",
+        type=str,
+        default=None,
+        help="API to test, e.g. http://127.0.0.1:8000 (default: start one in-process on a free port)",
+    )
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--players", type=int, default=20)
+    parser.add_argument("--algorithm", type=str, default="airport_shapley")
+    args = parser.parse_args()
+
+    server: Optional[ApiServer] = None
+    if args.url:
+        parsed = urlparse(args.url)
+        host, port = parsed.hostname, parsed.port or 80
+    else:
+        server = ApiServer(SimulationEngine(), port=0)
+        server.start()
+        host, port = server.host, server.port
+        print(f"Started API on http://{host}:{port}")
+
+    try:
+        errors = run_load_test(
+            host, port, args.requests, args.concurrency, args.players, args.algorithm
+        )
+        check_streaming_endpoints(host, port, args.players)
+    finally:
+        if server is not None:
+            server.stop()
+
+    sys.exit(1 if errors else 0)
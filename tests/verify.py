@@ -1,13 +1,43 @@
 import sys
 import os
+import io
+import math
+import asyncio
+import itertools
+import socket
+import tempfile
+import threading
+
+import numpy as np
 
 # Add the project root to sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.models.entities.player import Player
 from src.models.entities.game_configuration import GameConfiguration
+from src.models.entities.tree_edge import TreeEdge
+from src.models.entities.facility import Facility
 from src.models.enums.algorithm_type import AlgorithmType
 from src.simulation.simulation_engine import SimulationEngine
+from src.simulation.sweep_coordinator import SweepCoordinator
+from src.simulation.sweep_worker import SweepWorker
+from src.simulation.async_simulation_engine import AsyncSimulationEngine
+from src.simulation.job_manager import JobLimitExceededError
+from src.simulation.workload_generator import WorkloadGenerator
+from src.infrastructure.frame_protocol import send_frame, recv_frame
+from src.infrastructure.result_store import ResultStore
+from src.infrastructure.game_snapshot import save_snapshot, load_snapshot
+from src.infrastructure.checkpoint_store import CheckpointStore
+from src.infrastructure.result_cache import ResultCache, compute_cache_key, compute_run_key
+from src.domain.compiled_game import CompiledGame
+from src.services.compiled_game_calculator import CompiledGameCalculator
+from src.services.core_stability_verifier import CoreStabilityVerifier
+from src.services.calculation_monitor import CalculationMonitor, CalculationCancelledError
+from src.services.sampling_session import SamplingSession
+from src.domain.airport_game import AirportGame
+from src.domain.airport_game_coalition import AirportGameWithCoalitionConfiguration
+from src.domain.congestion_airport_game import CongestionAirportGame
+from src.domain.tree_game import TreeGame
 
 
 def verify_airport_game():
@@ -49,5 +79,735 @@ def verify_airport_game():
     print("\nVerification Successful!")
 
 
+def _brute_force_semivalue(costs, weight):
+    """
+    Semivalue of the airport game over `costs` by enumerating all coalitions:
+    player i gets the sum over S not containing i of weight(|S|) * (c(S + i) - c(S)).
+    """
+    n = len(costs)
+    values = []
+    for i in range(n):
+        others = [j for j in range(n) if j != i]
+        total = 0.0
+        for size in range(n):
+            for coalition in itertools.combinations(others, size):
+                without = max((costs[j] for j in coalition), default=0.0)
+                total += weight(size) * (max(without, costs[i]) - without)
+        values.append(total)
+    return values
+
+
+def verify_semivalues():
+    print("\nVerifying airport semivalues against enumeration of all coalitions...")
+
+    costs = [10.0, 20.0, 20.0, 35.0, 50.0, 50.0]
+    n = len(costs)
+    players = [Player(id=f"P{i}", name=f"P{i}", cost=c) for i, c in enumerate(costs)]
+    engine = SimulationEngine()
+
+    def beta_weight(alpha, beta):
+        # Probability of one particular coalition of `size` others under Beta(alpha, beta).
+        def log_beta(a, b):
+            return math.lgamma(a) + math.lgamma(b) - math.lgamma(a + b)
+
+        return lambda size: math.exp(
+            log_beta(size + alpha, n - 1 - size + beta) - log_beta(alpha, beta)
+        )
+
+    cases = [
+        (AlgorithmType.AIRPORT_SHAPLEY, {}, beta_weight(1.0, 1.0)),
+        (AlgorithmType.BANZHAF, {}, lambda size: 0.5 ** (n - 1)),
+        (
+            AlgorithmType.SEMIVALUE,
+            {"semivalue_alpha": 2.0, "semivalue_beta": 0.5},
+            beta_weight(2.0, 0.5),
+        ),
+    ]
+    for algorithm, options, weight in cases:
+        result = engine.run_simulation(
+            GameConfiguration(players=players, algorithm=algorithm, **options)
+        )
+        expected = _brute_force_semivalue(costs, weight)
+        for p, value in zip(players, expected):
+            assert abs(result.shapley_values[p.id] - value) < 1e-9, (
+                f"{algorithm.value} {p.id}: {result.shapley_values[p.id]} != {value}"
+            )
+        print(f"{algorithm.value}: matches enumeration of {2 ** (n - 1)} coalitions per player")
+
+    print("\nVerification Successful!")
+
+
+def verify_nucleolus():
+    print("\nVerifying the airport nucleolus against known values...")
+
+    engine = SimulationEngine()
+    # Littlechild's examples: the cheapest players split the smallest runway as long
+    # as that leaves every prefix coalition its largest possible saving.
+    cases = [
+        ([1.0, 2.0, 3.0], [0.5, 0.75, 1.75]),
+        ([10.0, 20.0, 30.0], [5.0, 7.5, 17.5]),
+        ([4.0, 4.0, 9.0, 9.0], [4 / 3, 4 / 3, 19 / 6, 19 / 6]),
+    ]
+    for costs, expected in cases:
+        players = [Player(id=f"P{i}", name=f"P{i}", cost=c) for i, c in enumerate(costs)]
+        result = engine.run_simulation(
+            GameConfiguration(players=players, algorithm=AlgorithmType.NUCLEOLUS)
+        )
+        values = [result.shapley_values[p.id] for p in players]
+        print(f"costs {costs}: nucleolus {values}")
+        assert all(abs(v - e) < 1e-9 for v, e in zip(values, expected)), f"expected {expected}"
+
+    print("\nVerification Successful!")
+
+
+def verify_core_stability():
+    print("\nVerifying the core check against all 2^N coalitions...")
+
+    steps = [1500.0, 2500.0, 3500.0]
+    players = [
+        Player(id="F1", name="A", cost=1500.0, type=1, airlines=frozenset({"X"}), node="T1"),
+        Player(id="F2", name="B", cost=2500.0, type=2, airlines=frozenset({"X"}), node="A1"),
+        Player(id="F3", name="C", cost=3500.0, type=3, airlines=frozenset({"Y"}), node="A1"),
+        Player(id="F4", name="D", cost=2500.0, type=2, airlines=frozenset({"Z"}), node="R"),
+        Player(id="F5", name="E", cost=3500.0, type=3, airlines=frozenset({"Z"}), movements=3, node="A2"),
+        Player(id="F6", name="F", cost=1500.0, type=1, airlines=frozenset({"Y"}), node="T1"),
+    ]
+    edges = [
+        TreeEdge(parent="root", child="R", cost=1500.0),
+        TreeEdge(parent="R", child="T1", cost=400.0),
+        TreeEdge(parent="R", child="T2", cost=700.0),
+        TreeEdge(parent="T2", child="A1", cost=900.0),
+        TreeEdge(parent="T2", child="A2", cost=300.0),
+    ]
+    games = {
+        "classic": AirportGame(players),
+        "code-sharing": AirportGameWithCoalitionConfiguration(players, steps),
+        "congestion": CongestionAirportGame(players, maintenance_rate=0.02, slot_cost=40.0),
+        "tree": TreeGame(players, edges),
+    }
+    # Equal split, a skewed split and one with a negative share: some are in the core,
+    # some are not.
+    allocations = [
+        [1.0, 1.0, 1.0, 1.0, 1.0, 1.0],
+        [0.05, 0.3, 0.1, 0.25, 0.05, 0.25],
+        [-0.1, 0.2, 0.5, 0.1, 0.3, 0.0],
+    ]
+    verifier = CoreStabilityVerifier()
+    for name, game in games.items():
+        total = game.calculate_characteristic_function(players)
+        for weights in allocations:
+            allocation = {
+                p.id: total * w / sum(weights) for p, w in zip(players, weights)
+            }
+            report = verifier.verify(game, allocation)
+
+            worst = max(
+                sum(allocation[p.id] for p in coalition)
+                - game.calculate_characteristic_function(list(coalition))
+                for size in range(1, len(players) + 1)
+                for coalition in itertools.combinations(players, size)
+            )
+            members = [p for p in players if p.id in report.most_violated_coalition]
+            attained = sum(allocation[p.id] for p in members) - (
+                game.calculate_characteristic_function(members)
+            )
+            assert abs(report.max_violation - worst) < 1e-6, f"{name}: {report} vs {worst}"
+            assert abs(attained - worst) < 1e-6, f"{name}: coalition does not attain it"
+            assert report.in_core == (worst <= 1e-6)
+        print(f"{name}: max violation and coalition match enumeration")
+
+    print("\nVerification Successful!")
+
+
+def verify_configuration_value_sampling():
+    print("\nVerifying Configuration Value Sampling against Theorem 4.1...")
+
+    steps = [1500.0, 2500.0, 3500.0]
+    players = [
+        Player(id="F1", name="A", type=1, airlines=frozenset({"X"})),
+        Player(id="F2", name="B", type=2, airlines=frozenset({"X", "Y"})),
+        Player(id="F3", name="C", type=3, airlines=frozenset({"Y"})),
+        Player(id="F4", name="D", type=2, airlines=frozenset({"Z"})),
+        Player(id="F5", name="E", type=3, airlines=frozenset({"X", "Z"})),
+    ]
+
+    engine = SimulationEngine()
+    closed_form = engine.run_simulation(
+        GameConfiguration(
+            players=players,
+            algorithm=AlgorithmType.CONFIGURATION_VALUE,
+            runway_cost_steps=steps,
+        )
+    )
+    sampled = engine.run_simulation(
+        GameConfiguration(
+            players=players,
+            algorithm=AlgorithmType.CONFIGURATION_VALUE_SAMPLING,
+            runway_cost_steps=steps,
+            num_samples=20000,
+            seed=0,
+        )
+    )
+
+    for pid, exact in closed_form.shapley_values.items():
+        estimate = sampled.shapley_values[pid]
+        error = sampled.standard_errors[pid]
+        print(f"{pid}: closed form {exact:.2f}, sampled {estimate:.2f} ± {error:.2f}")
+        assert abs(estimate - exact) <= 5 * error + 1e-9, f"{pid} estimate is off"
+
+    assert abs(sum(sampled.shapley_values.values()) - sampled.total_cost) < 1e-6
+
+    # A deadline stops sampling early and reports the samples actually drawn.
+    deadline_run = engine.run_simulation(
+        GameConfiguration(
+            players=players,
+            algorithm=AlgorithmType.CONFIGURATION_VALUE_SAMPLING,
+            runway_cost_steps=steps,
+            num_samples=10**7,
+        ),
+        deadline_seconds=0.05,
+    )
+    print(f"Deadline run: {deadline_run.num_samples_used:,} samples")
+    assert 2 <= deadline_run.num_samples_used < 10**7
+    assert deadline_run.standard_errors is not None
+
+    # Without runway cost steps the classic airport game (Player.cost) is sampled.
+    classic = [p.model_copy(update={"cost": 1000.0 * p.type}) for p in players]
+    general = engine.run_simulation(
+        GameConfiguration(
+            players=classic,
+            algorithm=AlgorithmType.CONFIGURATION_VALUE_SAMPLING,
+            num_samples=1,
+            seed=0,
+        )
+    )
+    assert general.standard_errors is None, "one sample has no standard error"
+    assert abs(sum(general.shapley_values.values()) - 3000.0) < 1e-6
+
+    print("\nVerification Successful!")
+
+
+def verify_tree_game():
+    print("\nVerifying Tree Shapley allocation against exact enumeration...")
+
+    # Runway R splits into two taxiways, the second of which serves two aprons.
+    edges = [
+        TreeEdge(parent="root", child="R", cost=100.0),
+        TreeEdge(parent="R", child="T1", cost=40.0),
+        TreeEdge(parent="R", child="T2", cost=30.0),
+        TreeEdge(parent="T2", child="A1", cost=12.0),
+        TreeEdge(parent="T2", child="A2", cost=8.0),
+    ]
+    nodes = ["R", "T1", "T1", "T2", "A1", "A2", "A2"]
+    players = [
+        Player(id=f"M{i}", name=f"Movement {i}", node=node) for i, node in enumerate(nodes)
+    ]
+
+    engine = SimulationEngine()
+    exact = engine.run_simulation(
+        GameConfiguration(players=players, algorithm=AlgorithmType.EXACT, tree_edges=edges)
+    )
+    tree = engine.run_simulation(
+        GameConfiguration(
+            players=players, algorithm=AlgorithmType.TREE_SHAPLEY, tree_edges=edges
+        )
+    )
+
+    assert abs(tree.total_cost - 190.0) < 1e-9
+    for pid, value in exact.shapley_values.items():
+        print(f"{pid}: exact {value:.4f}, tree {tree.shapley_values[pid]:.4f}")
+        assert abs(tree.shapley_values[pid] - value) < 1e-9, f"{pid} allocation is off"
+
+    print("\nVerification Successful!")
+
+
+def verify_multi_facility_game():
+    print("\nVerifying multi-facility decomposition against exact enumeration...")
+
+    players = [Player(id=f"P{i}", name=f"Airline {i}") for i in range(5)]
+    facilities = [
+        Facility(name="runway", player_costs={"P0": 10.0, "P1": 20.0, "P2": 30.0, "P3": 30.0, "P4": 5.0}),
+        Facility(name="terminal", player_costs={"P1": 7.0, "P3": 3.0}),
+        Facility(name="apron", player_costs={p.id: 2.0 for p in players}),
+    ]
+
+    engine = SimulationEngine()
+    exact = engine.run_simulation(
+        GameConfiguration(players=players, algorithm=AlgorithmType.EXACT, facilities=facilities)
+    )
+    decomposed = engine.run_simulation(
+        GameConfiguration(
+            players=players, algorithm=AlgorithmType.DECOMPOSITION, facilities=facilities
+        )
+    )
+
+    assert abs(decomposed.total_cost - 39.0) < 1e-9
+    for pid, value in exact.shapley_values.items():
+        print(f"{pid}: exact {value:.4f}, decomposed {decomposed.shapley_values[pid]:.4f}")
+        assert abs(decomposed.shapley_values[pid] - value) < 1e-9, f"{pid} allocation is off"
+    terminal = decomposed.component_values["terminal"]
+    assert abs(terminal["P1"] - 5.5) < 1e-9 and terminal["P0"] == 0.0
+
+    # Facility games hold only valid players: the facility's users, with positive costs.
+    game = engine._build_game(
+        GameConfiguration(players=players, algorithm=AlgorithmType.DECOMPOSITION, facilities=facilities)
+    )
+    assert [p.id for p in game.components["terminal"].players] == ["P1", "P3"]
+    for component in game.components.values():
+        for p in component.players:
+            Player.model_validate(p.model_dump())
+
+    print("\nVerification Successful!")
+
+
+def verify_congestion_game():
+    print("\nVerifying congestion-aware airport allocation against exact enumeration...")
+
+    specs = [(10.0, 4), (20.0, 1), (20.0, 0), (35.0, 6), (50.0, 2), (35.0, None)]
+    players = [
+        Player(id=f"P{i}", name=f"Airline {i}", cost=cost, movements=movements)
+        for i, (cost, movements) in enumerate(specs)
+    ]
+    rates = {"maintenance_rate": 0.05, "slot_cost": 1.5}
+
+    engine = SimulationEngine()
+    exact = engine.run_simulation(
+        GameConfiguration(players=players, algorithm=AlgorithmType.EXACT, **rates)
+    )
+    closed_form = engine.run_simulation(
+        GameConfiguration(
+            players=players, algorithm=AlgorithmType.CONGESTION_SHAPLEY, **rates
+        )
+    )
+
+    # 14 movements (None counts as 1): 50 * (1 + 0.05 * 14) + 1.5 * 14
+    assert abs(closed_form.total_cost - 106.0) < 1e-9
+    for pid, value in exact.shapley_values.items():
+        print(f"{pid}: exact {value:.4f}, closed form {closed_form.shapley_values[pid]:.4f}")
+        assert abs(closed_form.shapley_values[pid] - value) < 1e-9, f"{pid} allocation is off"
+
+    print("\nVerification Successful!")
+
+
+def verify_distributed_sweep():
+    print("\nVerifying a distributed sweep on localhost workers...")
+
+    coordinator = SweepCoordinator(port=0, task_size=2, steal_after_seconds=0.3)
+    coordinator.start()
+
+    # A worker that takes a task and disconnects: its task must be retried elsewhere.
+    lost = socket.create_connection(("127.0.0.1", coordinator.port))
+    send_frame(lost, {"type": "hello", "worker_id": "lost"})
+    coordinator.wait_for_workers(1, timeout=5)
+
+    players = [Player(id=f"P{i}", name=f"Airline {i}", cost=float(i * 7 % 11 + 1)) for i in range(7)]
+    base = GameConfiguration(players=players)
+    grid = {"algorithm": ["exact", "airport_shapley", "banzhaf", "nucleolus"], "seed": [0, 1, 2]}
+
+    outcome = []
+    sweep = threading.Thread(target=lambda: outcome.append(coordinator.run_sweep(base, grid, timeout=60)))
+    sweep.start()
+    send_frame(lost, {"type": "request"})
+    assert recv_frame(lost)["type"] == "task"
+    lost.close()
+
+    workers = [SweepWorker("127.0.0.1", coordinator.port, worker_id=f"w{i}") for i in range(3)]
+    for worker in workers:
+        worker.start()
+    sweep.join()
+    coordinator.stop()
+    for worker in workers:
+        worker.stop(timeout=5)
+
+    local = SimulationEngine().run_sweep(base, grid)
+    assert len(outcome[0]) == len(local) == 12
+    for (overrides, remote), (_, expected) in zip(outcome[0], local):
+        assert remote.shapley_values == expected.shapley_values, f"{overrides} differs"
+    print(f"12 scenarios match local runs; tasks per worker: {[w.tasks_completed for w in workers]}")
+
+    print("\nVerification Successful!")
+
+
+class _CancelAt(CalculationMonitor):
+    """
+    Cancels the calculation once it reports `step` completed work units.
+    """
+
+    def __init__(self, step):
+        super().__init__()
+        self.step = step
+
+    def update(self, completed, total):
+        if completed >= self.step:
+            self.cancel()
+        super().update(completed, total)
+
+
+def verify_result_cache():
+    print("\nVerifying the result cache...")
+
+    players = [Player(id=f"P{i}", name=f"Airline {i}", cost=float(i % 3 + 1)) for i in range(6)]
+    engine = SimulationEngine(result_cache=ResultCache())
+    config = GameConfiguration(players=players, algorithm=AlgorithmType.EXACT)
+    first = engine.run_simulation(config)
+
+    # Same players listed in another order, under other display names: a hit.
+    renamed = [p.model_copy(update={"name": f"Carrier {p.id}"}) for p in reversed(players)]
+    reordered = GameConfiguration(players=renamed, algorithm=AlgorithmType.EXACT)
+    assert compute_cache_key(reordered) == compute_cache_key(config)
+    assert engine.run_simulation(reordered) is first, "reordered players should hit the cache"
+
+    # A changed cost or algorithm setting: a miss.
+    changed_cost = GameConfiguration(
+        players=players[:-1] + [players[-1].model_copy(update={"cost": 9.0})],
+        algorithm=AlgorithmType.EXACT,
+    )
+    semivalue = GameConfiguration(players=players, algorithm=AlgorithmType.SEMIVALUE, semivalue_alpha=2.0)
+    for changed in (changed_cost, semivalue, semivalue.model_copy(update={"semivalue_alpha": 3.0})):
+        assert compute_cache_key(changed) != compute_cache_key(config)
+        result = engine.run_simulation(changed)
+        assert result is not first and engine.run_simulation(changed) is result
+    assert engine.run_simulation(changed_cost).shapley_values != first.shapley_values
+
+    # Unseeded sampling is not reproducible and is never served from the cache.
+    unseeded = GameConfiguration(players=players, algorithm=AlgorithmType.APPROXIMATE, num_samples=50)
+    assert compute_cache_key(unseeded) is None
+    assert engine.run_simulation(unseeded) is not engine.run_simulation(unseeded)
+
+    print("\nVerification Successful!")
+
+
+def verify_deadline_fallback():
+    print("\nVerifying that an exact run past its deadline falls back to sampling...")
+
+    # 30 players: the exact permutation count is far beyond any budget.
+    players = [Player(id=f"P{i}", name=f"Airline {i}", cost=float(i % 7 + 1)) for i in range(30)]
+    config = GameConfiguration(players=players, algorithm=AlgorithmType.EXACT, seed=11)
+    result = SimulationEngine().run_simulation(config, deadline_seconds=0.05)
+
+    print(f"Samples: {result.num_samples_used}, budget used: {result.budget_used:.2f}")
+    assert not result.is_exact
+    assert result.budget_used is not None and result.budget_used > 0
+    assert result.num_samples_used >= 2
+    assert result.standard_errors is not None and set(result.standard_errors) == set(result.shapley_values)
+    assert math.isclose(sum(result.shapley_values.values()), result.total_cost, rel_tol=1e-9)
+
+    print("\nVerification Successful!")
+
+
+def verify_session_merge():
+    print("\nVerifying that merged sampling sessions pool their samples...")
+
+    players = [Player(id=f"P{i}", name=f"Airline {i}", cost=float(i % 5 + 1)) for i in range(10)]
+    game = AirportGame(players)
+    halves = [SamplingSession(game, seed=seed, game_key="g") for seed in (1, 2)]
+    for half in halves:
+        half.add_samples(250)
+
+    merged = SamplingSession(game, seed=1, game_key="g")
+    merged.add_samples(250)
+    merged.merge_state(halves[1].to_state())
+    assert merged.num_samples == 500
+    assert np.array_equal(merged.sums, halves[0].sums + halves[1].sums)
+    assert np.array_equal(merged.squared_sums, halves[0].squared_sums + halves[1].squared_sums)
+
+    # Standard errors of the pooled sample, computed directly from both halves' sums.
+    estimate = merged.estimate()
+    m = merged.num_samples
+    for i, p in enumerate(players):
+        mean = (halves[0].sums[i] + halves[1].sums[i]) / m
+        variance = max(0.0, (halves[0].squared_sums[i] + halves[1].squared_sums[i]) / m - mean**2)
+        assert math.isclose(estimate.shapley_values[p.id], mean, rel_tol=1e-12)
+        assert math.isclose(estimate.standard_errors[p.id], math.sqrt(variance / (m - 1)), rel_tol=1e-12)
+    print(f"P9: {estimate.shapley_values['P9']:.4f} +- {estimate.standard_errors['P9']:.4f} from {m} samples")
+
+    try:
+        SamplingSession(game, seed=3, game_key="other").merge_state(halves[0].to_state())
+        raise AssertionError("sessions of different games must not merge")
+    except ValueError:
+        pass
+
+    print("\nVerification Successful!")
+
+
+def verify_checkpoint_resume():
+    print("\nVerifying that interrupted runs resume from their checkpoints...")
+
+    players = [Player(id=f"P{i}", name=f"Airline {i}", cost=float(i % 4 + 1)) for i in range(8)]
+    cases = [
+        # (configuration, progress step at which the first run is interrupted)
+        (GameConfiguration(players=players, algorithm=AlgorithmType.EXACT), 10000),
+        (
+            GameConfiguration(
+                players=players, algorithm=AlgorithmType.APPROXIMATE, num_samples=1000, seed=5
+            ),
+            300,
+        ),
+    ]
+    for config, step in cases:
+        expected = SimulationEngine().run_simulation(config)
+        with tempfile.TemporaryDirectory() as directory:
+            interrupted = SimulationEngine(
+                checkpoint_directory=directory, checkpoint_interval_seconds=0.0
+            )
+            try:
+                interrupted.run_simulation(config, _CancelAt(step))
+                raise AssertionError("the run should have been cancelled")
+            except CalculationCancelledError:
+                pass
+            checkpoint = CheckpointStore(directory).load(compute_run_key(config))
+            assert checkpoint is not None, "no checkpoint was left behind"
+            done = checkpoint.position if checkpoint.sampling is None else checkpoint.sampling.num_samples
+            assert 0 < done
+
+            # A new engine (e.g. after a restart) picks the run up from the checkpoint.
+            resumed = SimulationEngine(checkpoint_directory=directory).run_simulation(config)
+            assert resumed.shapley_values == expected.shapley_values, config.algorithm.value
+            assert resumed.standard_errors == expected.standard_errors
+            assert CheckpointStore(directory).load(compute_run_key(config)) is None
+        print(f"{config.algorithm.value}: resumed after {done:,} and matched an uninterrupted run")
+
+    print("\nVerification Successful!")
+
+
+def verify_result_store():
+    print("\nVerifying the columnar result store...")
+
+    players = [Player(id=f"P{i}", name=f"Airline {i}", cost=float(i % 5 + 1)) for i in range(6)]
+    base = GameConfiguration(players=players)
+    engine = SimulationEngine()
+    sweep = engine.run_sweep(base, {"algorithm": ["exact", "airport_shapley", "approximate"]})
+
+    # Array-backed results look players up by ID like the dict form.
+    array_result = engine.run_simulation(base.model_copy(update={"seed": 7}), as_array=True)
+    assert array_result.shapley_values.to_dict() == sweep[0][1].shapley_values
+    assert array_result.to_calculation_result().shapley_values["P3"] == array_result.shapley_values["P3"]
+
+    with tempfile.TemporaryDirectory() as directory:
+        with ResultStore(directory, store_standard_errors=True) as store:
+            for overrides, result in sweep:
+                store.append(result, metadata=overrides)
+            assert store.append(array_result) == 3
+
+        # Simulate an append interrupted before its metadata line was written.
+        with open(os.path.join(directory, "values.f64"), "ab") as f:
+            f.write(b"\0" * 20)
+
+        with ResultStore(directory) as store:
+            assert store.num_scenarios == 4
+            assert list(store.values(3)) == list(array_result.values)
+            for i, (overrides, result) in enumerate(sweep):
+                assert store.metadata(i)["metadata"] == overrides
+                assert list(store.values(i)) == [result.shapley_values[p.id] for p in players]
+            assert list(store.player_values("P2")[:3]) == [r.shapley_values["P2"] for _, r in sweep]
+            assert list(store.values(slice(1, 3), ["P4", "P0"])[1]) == [
+                sweep[2][1].shapley_values[pid] for pid in ("P4", "P0")
+            ]
+
+            out = io.StringIO()
+            assert store.export_csv(out, slice(0, 3)) == 3 * len(players)
+            assert out.getvalue().splitlines()[0] == "scenario,player_id,value,standard_error"
+
+            # Failed appends leave nothing behind: metadata JSON cannot encode, and
+            # standard errors missing a player.
+            approximate = sweep[2][1]
+            partial_errors = dict(approximate.standard_errors)
+            partial_errors.pop("P5")
+            failing = [
+                (sweep[0][1], {"seed": np.int64(2)}),
+                (approximate.model_copy(update={"standard_errors": partial_errors}), None),
+            ]
+            for result, metadata in failing:
+                try:
+                    store.append(result, metadata=metadata)
+                    raise AssertionError("the append should have failed")
+                except (TypeError, ValueError):
+                    pass
+            assert store.append(sweep[1][1], metadata={"retry": True}) == 4
+
+        with ResultStore(directory) as store:
+            assert store.num_scenarios == 5
+            assert list(store.values(4)) == [sweep[1][1].shapley_values[p.id] for p in players]
+            assert store.metadata(4)["metadata"] == {"retry": True}
+            assert store.total_costs()[4] == sweep[1][1].total_cost
+    print("Stored, reopened and exported 4 scenarios; failed appends were rolled back")
+
+    print("\nVerification Successful!")
+
+
+
+def verify_game_snapshot():
+    print("\nVerifying allocations on a memory-mapped game snapshot...")
+
+    steps = [1500.0, 2500.0, 3500.0]
+    players = [
+        Player(id="F1", name="A", cost=1500.0, type=1, airlines=frozenset({"X"})),
+        Player(id="F2", name="B", cost=2500.0, type=2, airlines=frozenset({"X", "Y"})),
+        Player(id="F3", name="C", cost=3500.0, type=3, airlines=frozenset({"Y"})),
+        Player(id="F4", name="D", cost=2500.0, type=2, airlines=frozenset({"Z"})),
+        Player(id="F5", name="E", cost=3500.0, type=3, airlines=frozenset({"X", "Z"})),
+    ]
+    engine = SimulationEngine()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "airport.snap")
+        config = GameConfiguration(players=players, runway_cost_steps=steps)
+        save_snapshot(CompiledGame.from_configuration(config), path)
+        game = load_snapshot(path)
+
+        for algorithm in (AlgorithmType.AIRPORT_SHAPLEY, AlgorithmType.CONFIGURATION_VALUE):
+            expected = engine.run_simulation(config.model_copy(update={"algorithm": algorithm}))
+            result = CompiledGameCalculator(algorithm).calculate(game)
+            for pid, value in expected.shapley_values.items():
+                assert abs(result.shapley_values[pid] - value) < 1e-9, f"{algorithm.value} {pid} is off"
+            print(f"{algorithm.value}: snapshot matches the engine")
+
+    print("\nVerification Successful!")
+
+
+def verify_workload_generator():
+    print("\nVerifying the synthetic workload generator...")
+
+    # Spans several generator blocks, so chunks cut across block boundaries.
+    n = 2 * WorkloadGenerator.BLOCK_SIZE + 123
+    columns = []
+    for chunk_size in (1000, 5000, WorkloadGenerator.BLOCK_SIZE + 1, n):
+        chunks = list(WorkloadGenerator(seed=8).generate_chunks(n, chunk_size))
+        assert [c.start for c in chunks] == list(range(0, n, chunk_size))
+        columns.append([
+            np.concatenate([c.costs for c in chunks]),
+            np.concatenate([c.types for c in chunks]),
+            np.concatenate([np.diff(c.airline_offsets) for c in chunks]),
+            np.concatenate([c.airline_indices for c in chunks]),
+        ])
+    for other in columns[1:]:
+        for expected, column in zip(columns[0], other):
+            assert np.array_equal(expected, column), "columns depend on the chunk size"
+    assert not np.array_equal(
+        columns[0][0], next(WorkloadGenerator(seed=9).generate_chunks(n, n)).costs
+    )
+    print(f"{n:,} movements: identical columns for every chunk size")
+
+    generator = WorkloadGenerator(seed=8)
+    game = generator.generate(300, chunk_size=64)
+    config = GameConfiguration(
+        players=generator.players(300), runway_cost_steps=generator.runway_cost_steps
+    )
+    engine = SimulationEngine()
+    for algorithm in (AlgorithmType.AIRPORT_SHAPLEY, AlgorithmType.CONFIGURATION_VALUE):
+        expected = engine.run_simulation(config.model_copy(update={"algorithm": algorithm}))
+        result = CompiledGameCalculator(algorithm).calculate(game)
+        for pid, value in expected.shapley_values.items():
+            assert abs(result.shapley_values[pid] - value) < 1e-9, f"{algorithm.value} {pid} is off"
+        print(f"{algorithm.value}: generated game matches the engine on its players")
+
+    print("\nVerification Successful!")
+
+
+class _GatedEngine(SimulationEngine):
+    """
+    Holds every calculation until `gate` is set, recording the monitors it was given.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+        self.monitors = []
+
+    def run_simulation(self, config, monitor=None, deadline_seconds=None, as_array=False):
+        self.monitors.append(monitor)
+        self.gate.wait(10)
+        return super().run_simulation(config, monitor, deadline_seconds, as_array)
+
+
+def verify_async_engine():
+    print("\nVerifying single flight, cancellation and backpressure of the async engine...")
+
+    players = [Player(id=f"P{i}", name=f"P{i}", cost=float(i)) for i in range(1, 6)]
+
+    def config(algorithm):
+        return GameConfiguration(players=players, algorithm=algorithm)
+
+    async def coalescing():
+        engine = _GatedEngine()
+        async with AsyncSimulationEngine(engine) as front:
+            requests = [
+                asyncio.ensure_future(front.run_simulation(config(AlgorithmType.EXACT)))
+                for _ in range(5)
+            ]
+            await asyncio.sleep(0.05)
+            assert front.in_flight == 1
+            engine.gate.set()
+            results = await asyncio.gather(*requests)
+        assert len(engine.monitors) == 1, "identical requests must share one calculation"
+        assert all(r.shapley_values == results[0].shapley_values for r in results)
+        print("5 identical requests ran 1 calculation")
+
+    async def cancellation():
+        engine = _GatedEngine()
+        async with AsyncSimulationEngine(engine) as front:
+            requests = [
+                asyncio.ensure_future(front.run_simulation(config(AlgorithmType.BANZHAF)))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0.05)
+            for request in requests:
+                request.cancel()
+            # One loop step lets the waiters handle their cancellation; the flight must
+            # be unregistered right away, before its own task has finished cancelling.
+            await asyncio.sleep(0)
+            assert front.in_flight == 0
+            await asyncio.gather(*requests, return_exceptions=True)
+            assert engine.monitors[0].is_cancelled
+
+            # A new request starts a fresh calculation rather than joining the cancelled one.
+            retry = asyncio.ensure_future(front.run_simulation(config(AlgorithmType.BANZHAF)))
+            await asyncio.sleep(0.05)
+            engine.gate.set()
+            await retry
+        assert len(engine.monitors) == 2
+        print("Cancelling every waiter cancelled the shared calculation")
+
+    async def backpressure():
+        engine = _GatedEngine()
+        async with AsyncSimulationEngine(
+            engine, max_pending=1, wait_timeout_seconds=0.05
+        ) as front:
+            running = asyncio.ensure_future(front.run_simulation(config(AlgorithmType.EXACT)))
+            await asyncio.sleep(0.05)
+            try:
+                await front.run_simulation(config(AlgorithmType.AIRPORT_SHAPLEY))
+                raise AssertionError("a request beyond max_pending must be rejected")
+            except JobLimitExceededError:
+                pass
+            engine.gate.set()
+            await running
+            # The slot is released once the calculation finishes.
+            await front.run_simulation(config(AlgorithmType.AIRPORT_SHAPLEY))
+        print("A request beyond max_pending was rejected, then served once a slot freed")
+
+    asyncio.run(coalescing())
+    asyncio.run(cancellation())
+    asyncio.run(backpressure())
+
+    print("\nVerification Successful!")
+
+
 if __name__ == "__main__":
     verify_airport_game()
+    verify_semivalues()
+    verify_nucleolus()
+    verify_core_stability()
+    verify_configuration_value_sampling()
+    verify_tree_game()
+    verify_multi_facility_game()
+    verify_congestion_game()
+    verify_distributed_sweep()
+    verify_result_cache()
+    verify_deadline_fallback()
+    verify_session_merge()
+    verify_checkpoint_resume()
+    verify_result_store()
+    verify_game_snapshot()
+    verify_workload_generator()
+    verify_async_engine()